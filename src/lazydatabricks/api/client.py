@@ -2,8 +2,11 @@
 
 Wraps the Databricks SDK WorkspaceClient and provides:
 - Lazy initialization
+- A sized HTTP connection pool shared by all callers
 - Profile switching
-- Connection testing
+- Connection testing (identity cached with a short TTL)
+- Scoped write access for armed actions
+- Process-wide caches shared per workspace (see shared_cache)
 - Centralized error handling
 
 All domain-specific modules (clusters, jobs, warehouses) receive
@@ -12,15 +15,46 @@ this client rather than creating their own SDK instances.
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Optional
 
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.core import Config
 
 from lazydatabricks.models.config import LazyDatabricksConfig
 
 logger = logging.getLogger(__name__)
 
+# Process-wide cache namespaces keyed by (host, profile, auth identity).
+# Every client and ops object for the same workspace and credentials shares
+# them, so data warmed by one screen (or before a profile switch and back)
+# is reused by the next; a new token starts cold.
+_SHARED_CACHES: dict[tuple[str, str | None, str, str], dict[tuple, dict]] = {}
+
+
+def _auth_fingerprint(config: LazyDatabricksConfig) -> str:
+    """Short digest of the token, so cache keys never hold the secret."""
+    return hashlib.sha256(config.token.encode()).hexdigest()[:16]
+
+
+def shared_cache(config: LazyDatabricksConfig, name: str, *scope: str) -> dict:
+    """Return the named cache dict shared by all clients for a workspace.
+
+    Args:
+        config: Config identifying the workspace (host + profile + auth).
+        name: Cache namespace, e.g. "identity" or "billing".
+        *scope: Extra settings the cached data depends on, e.g. the
+            billing warehouse; each distinct scope gets its own dict.
+    """
+    workspace = (config.host, config.profile_name, config.auth_method.value, _auth_fingerprint(config))
+    namespaces = _SHARED_CACHES.setdefault(workspace, {})
+    return namespaces.setdefault((name, *scope), {})
+
 
 class DatabricksClient:
     """Central Databricks API client.
@@ -35,9 +69,20 @@ class DatabricksClient:
         summaries = clusters.list_all()
     """
 
+    # Seconds a successful identity lookup is served from memory
+    IDENTITY_TTL_SECONDS = 60.0
+
+    # urllib3 pool sizing for the SDK session (the SDK default is 20)
+    HTTP_POOL_SIZE = 32
+
     def __init__(self, config: LazyDatabricksConfig) -> None:
         self._config = config
         self._sdk: Optional[WorkspaceClient] = None
+        self._identity_cache: dict[str, tuple[float, dict]] = shared_cache(config, "identity")
+        # Number of writable() blocks in flight, and read_only before the first
+        self._writers = 0
+        self._saved_read_only = config.read_only
+        self._writers_lock = threading.Lock()
 
     @property
     def config(self) -> LazyDatabricksConfig:
@@ -45,12 +90,19 @@ class DatabricksClient:
 
     @property
     def sdk(self) -> WorkspaceClient:
-        """Lazily initialize the Databricks SDK client."""
+        """Lazily initialize the Databricks SDK client.
+
+        The SDK keeps one requests.Session with keep-alive connections, so
+        TLS sessions are reused across calls. The pool is sized for the
+        thread fan-out used by the ops layer and is shared by all threads.
+        """
         if self._sdk is None:
-            self._sdk = WorkspaceClient(
+            self._sdk = WorkspaceClient(config=Config(
                 host=self._config.host,
                 token=self._config.token,
-            )
+                max_connection_pools=self.HTTP_POOL_SIZE,
+                max_connections_per_pool=self.HTTP_POOL_SIZE,
+            ))
             logger.info(f"SDK client initialized for {self._config.host_short}")
         return self._sdk
 
@@ -66,21 +118,52 @@ class DatabricksClient:
     def is_read_only(self) -> bool:
         return self._config.read_only
 
+    @contextmanager
+    def writable(self) -> Iterator[None]:
+        """Lift read-only mode for the duration of a mutating call.
+
+        Overlapping blocks (several action workers at once) are counted, so
+        read_only is only restored when the last one exits.
+        """
+        with self._writers_lock:
+            if self._writers == 0:
+                self._saved_read_only = self._config.read_only
+                self._config.read_only = False
+            self._writers += 1
+        try:
+            yield
+        finally:
+            with self._writers_lock:
+                self._writers -= 1
+                if self._writers == 0:
+                    self._config.read_only = self._saved_read_only
+
     def test_connection(self) -> dict:
         """Quick connection test — validates auth + returns identity.
 
+        Successful results are cached for IDENTITY_TTL_SECONDS; errors
+        are never cached so the next call retries immediately.
+
         Returns:
             {"status": "ok", "user": "...", "host": "..."} or
             {"status": "error", "error": "..."}
         """
+        hit = self._identity_cache.get("me")
+        if hit is not None:
+            cached_at, cached = hit
+            if time.monotonic() - cached_at < self.IDENTITY_TTL_SECONDS:
+                return dict(cached)
+
         try:
             current_user = self.sdk.current_user.me()
-            return {
+            result = {
                 "status": "ok",
                 "user": current_user.user_name or "",
                 "display_name": current_user.display_name or "",
                 "host": self._config.host_short,
             }
+            self._identity_cache["me"] = (time.monotonic(), result)
+            return dict(result)
         except Exception as e:
             logger.error(f"Connection test failed: {e}")
             return {
@@ -92,12 +175,26 @@ class DatabricksClient:
     def switch_profile(self, profile_name: str) -> DatabricksClient:
         """Return a new client targeting a different profile.
 
-        The old SDK instance is discarded.
+        The new client gets its own SDK instance. Caches are keyed by
+        host and profile, so switching back finds them still warm.
         """
         new_config = self._config.switch_profile(profile_name)
         return DatabricksClient(new_config)
 
+    def invalidate(self, *, identity: bool = True) -> None:
+        """Drop cached API results so the next call goes to the workspace.
+
+        Cached entries are otherwise served until their TTL expires and
+        never past it.
+
+        Args:
+            identity: Clear the cached test_connection identity.
+        """
+        if identity:
+            self._identity_cache.clear()
+
     def refresh(self) -> None:
         """Force a fresh SDK client on next call."""
         self._sdk = None
+        self.invalidate()
         logger.info("SDK client reset — will reinitialize on next call")
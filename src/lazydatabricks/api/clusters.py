@@ -5,7 +5,12 @@ All methods return normalized model objects from lazydatabricks.models.cluster.
 
 from __future__ import annotations
 
+import heapq
 import logging
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from itertools import islice
 from typing import Optional
 
 from lazydatabricks.api.client import DatabricksClient
@@ -13,6 +18,17 @@ from lazydatabricks.models.cluster import ClusterEvent, ClusterSummary
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent SDK calls when fanning out per-cluster requests
+MAX_FANOUT_WORKERS = 8
+
+# Sort rank by state: active clusters first, everything else last
+_STATE_ORDER = {"RUNNING": 0, "RESTARTING": 1, "RESIZING": 1, "PENDING": 2}
+
+
+def _sort_key(c: ClusterSummary) -> tuple[int, str]:
+    """Sort key for cluster listings: state rank, then case-insensitive name."""
+    return (_STATE_ORDER.get(c.state.value, 9), c.name.lower())
+
 
 class ClusterOps:
     """Cluster API operations."""
@@ -20,39 +36,41 @@ class ClusterOps:
     def __init__(self, client: DatabricksClient) -> None:
         self._client = client
 
-    def list_all(self) -> list[ClusterSummary]:
-        """List all clusters in the workspace.
+    def iter_clusters(self, page_size: int = 50) -> Iterator[ClusterSummary]:
+        """Stream clusters in API order as the SDK fetches each page.
 
-        Returns:
-            List of ClusterSummary, sorted by state (active first) then name.
+        Clusters that fail to parse are logged and skipped.
         """
         try:
-            clusters = list(self._client.sdk.clusters.list())
+            for c in self._client.sdk.clusters.list(page_size=page_size):
+                try:
+                    yield ClusterSummary.from_sdk(c, self._client.host)
+                except Exception as e:
+                    logger.warning(f"Failed to parse cluster: {e}")
         except Exception as e:
             logger.error(f"Failed to list clusters: {e}")
-            return []
 
-        summaries = []
-        for c in clusters:
-            try:
-                data = c.as_dict() if hasattr(c, "as_dict") else c.__dict__
-                summary = ClusterSummary.from_api(data, self._client.host)
-                summaries.append(summary)
-            except Exception as e:
-                logger.warning(f"Failed to parse cluster: {e}")
+    def list_all(self, limit: int | None = None) -> list[ClusterSummary]:
+        """List clusters in the workspace.
 
-        # Sort: active clusters first, then by name
-        state_order = {"RUNNING": 0, "RESTARTING": 1, "RESIZING": 1, "PENDING": 2}
-        summaries.sort(key=lambda c: (state_order.get(c.state.value, 9), c.name.lower()))
+        Args:
+            limit: Keep only the first N clusters in sort order. Memory stays
+                bounded by the limit rather than the workspace size.
 
-        return summaries
+        Returns:
+            List of ClusterSummary, sorted by state (active first) then name.
+        """
+        # Keys are computed once per cluster by sorted()/nsmallest()
+        clusters = self.iter_clusters()
+        if limit is not None:
+            return heapq.nsmallest(limit, clusters, key=_sort_key)
+        return sorted(clusters, key=_sort_key)
 
     def get(self, cluster_id: str) -> Optional[ClusterSummary]:
         """Get a single cluster by ID."""
         try:
             c = self._client.sdk.clusters.get(cluster_id=cluster_id)
-            data = c.as_dict() if hasattr(c, "as_dict") else c.__dict__
-            return ClusterSummary.from_api(data, self._client.host)
+            return ClusterSummary.from_sdk(c, self._client.host)
         except Exception as e:
             logger.error(f"Failed to get cluster {cluster_id}: {e}")
             return None
@@ -111,28 +129,53 @@ class ClusterOps:
             List of ClusterEvent, most recent first.
         """
         try:
-            from datetime import datetime, timezone
-
-            events_response = self._client.sdk.clusters.events(
+            events_iter = self._client.sdk.clusters.events(
                 cluster_id=cluster_id,
                 limit=limit,
             )
+            # The SDK pages transparently; stop once we have `limit` events
+            now = datetime.now(timezone.utc)
             events = []
-            for page in events_response:
-                if hasattr(page, "events") and page.events:
-                    for e in page.events:
-                        ts = datetime.now(timezone.utc)
-                        if hasattr(e, "timestamp") and e.timestamp:
-                            ts = datetime.fromtimestamp(e.timestamp / 1000.0, tz=timezone.utc)
-                        events.append(ClusterEvent(
-                            timestamp=ts,
-                            event_type=str(e.type.value) if hasattr(e, "type") and e.type else "UNKNOWN",
-                            details=str(e.details) if hasattr(e, "details") else "",
-                        ))
-                # The SDK returns paginated results; we just want the first page
-                break
+            for e in islice(events_iter, limit):
+                # SDK events always carry these fields, but any may be None
+                ts = (
+                    datetime.fromtimestamp(e.timestamp / 1000.0, tz=timezone.utc)
+                    if e.timestamp is not None
+                    else now
+                )
+                event_type = "UNKNOWN" if e.type is None else str(e.type.value)
+                details = "" if e.details is None else str(e.details)
+                events.append(ClusterEvent(
+                    timestamp=ts,
+                    event_type=event_type,
+                    details=details,
+                ))
 
             return events
         except Exception as e:
             logger.error(f"Failed to get events for cluster {cluster_id}: {e}")
             return []
+
+    def get_events_many(
+        self,
+        cluster_ids: list[str],
+        limit: int = 50,
+    ) -> dict[str, list[ClusterEvent]]:
+        """Get recent events for several clusters concurrently.
+
+        The events API is network-bound, so requests are fanned out over a
+        small thread pool sharing the client's SDK instance.
+
+        Returns:
+            Mapping of cluster_id to its events, most recent first.
+        """
+        if not cluster_ids:
+            return {}
+
+        # Initialize the SDK once up front so worker threads don't race on it
+        _ = self._client.sdk
+
+        workers = min(MAX_FANOUT_WORKERS, len(cluster_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(lambda cid: self.get_events(cid, limit=limit), cluster_ids)
+            return dict(zip(cluster_ids, results, strict=True))
@@ -13,16 +13,26 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
 import sys
+from typing import TYPE_CHECKING
 
-from lazydatabricks.api.client import DatabricksClient
-from lazydatabricks.api.health import HealthBuilder
-from lazydatabricks.models.config import LazyDatabricksConfig
+# Heavy imports (the Databricks SDK in particular) are deferred into the
+# functions that need them so `--help` and argument errors return fast.
+if TYPE_CHECKING:
+    from lazydatabricks.api.client import DatabricksClient
+
+
+# Row templates for the CLI tables; headers are rendered through the same
+# template so columns always line up.
+_CLUSTER_ROW = "{name:<35} {state:<12} {workers:<10} {runtime:<10} {flags}\n"
+_JOB_ROW = "{id:<10} {name:<40} {schedule:<20} {health}\n"
 
 
 def create_client(args: argparse.Namespace) -> DatabricksClient:
     """Create a DatabricksClient from CLI args."""
+    from lazydatabricks.api.client import DatabricksClient
+    from lazydatabricks.models.config import LazyDatabricksConfig
+
     config = LazyDatabricksConfig.load(
         profile=args.profile,
         host_override=args.host,
@@ -40,6 +50,8 @@ def cmd_tui(client: DatabricksClient) -> None:
 
 def cmd_health(client: DatabricksClient) -> None:
     """Print health snapshot to stdout (CLI mode)."""
+    from lazydatabricks.api.health import HealthBuilder
+
     builder = HealthBuilder(client)
     snapshot = builder.build()
 
@@ -73,11 +85,19 @@ def cmd_clusters(client: DatabricksClient) -> None:
         return
 
     # Simple table
-    print(f"{'Name':<35} {'State':<12} {'Workers':<10} {'Runtime':<10} {'Flags'}")
-    print("-" * 85)
-    for c in clusters:
-        flags = ", ".join(f.value for f in c.flags) if c.flags else ""
-        print(f"{c.name[:34]:<35} {c.state.value:<12} {c.workers_display:<10} {c.runtime_display:<10} {flags}")
+    out = sys.stdout
+    out.write(_CLUSTER_ROW.format(name="Name", state="State", workers="Workers", runtime="Runtime", flags="Flags"))
+    out.write("-" * 85 + "\n")
+    out.writelines(
+        _CLUSTER_ROW.format(
+            name=c.name[:34],
+            state=c.state.value,
+            workers=c.workers_display,
+            runtime=c.runtime_display,
+            flags=", ".join(f.value for f in c.flags),
+        )
+        for c in clusters
+    )
 
 
 def cmd_jobs(client: DatabricksClient) -> None:
@@ -91,16 +111,27 @@ def cmd_jobs(client: DatabricksClient) -> None:
         print("No jobs found.")
         return
 
-    print(f"{'ID':<10} {'Name':<40} {'Schedule':<20} {'Health'}")
-    print("-" * 75)
-    for j in jobs:
-        print(f"{j.id:<10} {j.name[:39]:<40} {j.schedule_display:<20} {j.health_display}")
+    out = sys.stdout
+    out.write(_JOB_ROW.format(id="ID", name="Name", schedule="Schedule", health="Health"))
+    out.write("-" * 75 + "\n")
+    out.writelines(
+        _JOB_ROW.format(
+            id=j.id,
+            name=j.name[:39],
+            schedule=j.schedule_display,
+            health=j.health_display,
+        )
+        for j in jobs
+    )
 
 
 def cmd_test(client: DatabricksClient) -> None:
     """Test connection."""
+    import json
+
     result = client.test_connection()
-    print(json.dumps(result, indent=2))
+    json.dump(result, sys.stdout, indent=2)
+    sys.stdout.write("\n")
 
 
 def cmd_setup(client: DatabricksClient, extension: str) -> None:
@@ -198,6 +229,11 @@ def _setup_billing(client: DatabricksClient) -> None:
         extensions["billing"] = {}
     extensions["billing"]["sql_warehouse_id"] = selected.id
 
+    # Optionally create the pre-aggregated cost view
+    cost_view = extensions["billing"].get("cost_view", "")
+    if not cost_view:
+        cost_view = _setup_cost_view(client, selected.id)
+
     # Write TOML manually (tomllib is read-only)
     with open(config_path, "w") as f:
         f.write("# LazyDatabricks Configuration\n\n")
@@ -205,6 +241,8 @@ def _setup_billing(client: DatabricksClient) -> None:
         f.write(f"enabled = {extensions['enabled']!r}\n\n")
         f.write("[extensions.billing]\n")
         f.write(f'sql_warehouse_id = "{selected.id}"\n')
+        if cost_view:
+            f.write(f'cost_view = "{cost_view}"\n')
 
     print()
     print(f"✓ Billing extension configured!")
@@ -215,6 +253,34 @@ def _setup_billing(client: DatabricksClient) -> None:
     print()
 
 
+def _setup_cost_view(client: DatabricksClient, warehouse_id: str) -> str:
+    """Offer to create the billing cost view. Returns its name, or "" if skipped."""
+    from lazydatabricks.extensions.billing.api import BillingOps
+    from lazydatabricks.extensions.billing.queries import DEFAULT_COST_VIEW
+
+    print()
+    print("Billing queries can read from a pre-aggregated materialized view")
+    print(f"({DEFAULT_COST_VIEW}, refreshed hourly) instead of scanning")
+    print("system.billing.usage on every refresh. This needs CREATE privileges")
+    print("in the current catalog.")
+    try:
+        answer = input("Create it now? [y/N]: ").strip().lower()
+    except (KeyboardInterrupt, EOFError):
+        print()
+        return ""
+    if answer not in ("y", "yes"):
+        return ""
+
+    ok, error = BillingOps(client, {"sql_warehouse_id": warehouse_id}).create_cost_view()
+    if not ok:
+        print(f"Could not create cost view: {error}")
+        print("Billing will query the system tables directly.")
+        return ""
+
+    print(f"✓ Cost view {DEFAULT_COST_VIEW} created (initial build may take a few minutes)")
+    return DEFAULT_COST_VIEW
+
+
 def main() -> None:
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -16,6 +16,7 @@ Config (in ~/.lazydatabricks/config.toml):
     [extensions.billing]
     sql_warehouse_id = "your-warehouse-id"
     default_window = "7d"  # optional, default is 7d
+    cost_view = "lazydatabricks_billing.sku_daily_cost"  # optional, see setup
 """
 
 from __future__ import annotations
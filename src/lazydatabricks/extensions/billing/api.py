@@ -7,14 +7,20 @@ Requires a SQL Warehouse for query execution.
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta, timezone
+import re
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Optional
+from functools import lru_cache
+from typing import Any, TypeVar
 
-from databricks.sdk.service.sql import StatementParameterListItem
+from databricks.sdk.service.sql import StatementParameterListItem, StatementResponse
 
-from lazydatabricks.api.client import DatabricksClient
+from lazydatabricks.api.client import DatabricksClient, shared_cache
 from lazydatabricks.extensions.billing.models import (
+    BillingDashboard,
     SkuCostSummary,
     TimeWindow,
     UsageBreakdown,
@@ -22,58 +28,135 @@ from lazydatabricks.extensions.billing.models import (
 from lazydatabricks.extensions.billing.queries import (
     ACCESS_CHECK_QUERY,
     BREAKDOWN_QUERY,
+    COST_VIEW_DDL,
+    COST_VIEW_SCHEMA_DDL,
+    DASHBOARD_QUERY,
+    DEFAULT_COST_VIEW,
+    REQUIRED_TABLES,
     SKU_COST_QUERY,
+    SKU_COST_VIEW_QUERY,
     TOTAL_COST_QUERY,
+    TOTAL_COST_VIEW_QUERY,
 )
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# View names are interpolated into SQL, so only plain dotted identifiers pass
+_QUALIFIED_NAME = re.compile(r"^[A-Za-z_]\w*(\.[A-Za-z_]\w*){1,2}$")
+
+# Error codes meaning the cost view is gone or not readable by this user;
+# anything else (timeouts, warehouse hiccups) is treated as transient
+_VIEW_UNAVAILABLE_ERRORS = (
+    "TABLE_OR_VIEW_NOT_FOUND",
+    "PERMISSION_DENIED",
+    "INSUFFICIENT_PERMISSIONS",
+)
+
 
 class BillingOps:
     """Billing query operations using Statement Execution API."""
 
+    # Billing system tables lag by hours, so re-running the same query on
+    # every pane switch only burns warehouse time. An entry is never served
+    # past this age; invalidate() drops entries before it.
+    CACHE_TTL_SECONDS = 300.0
+
+    # Cache scopes accepted by invalidate(); each is a cache key prefix
+    CACHE_SCOPES = ("sku", "breakdown", "total")
+
     def __init__(self, client: DatabricksClient, config: dict) -> None:
         self._client = client
         self._warehouse_id = config.get("sql_warehouse_id", "")
         self._default_window = config.get("default_window", "7d")
+        self._cost_view = config.get("cost_view", "")
+        if self._cost_view and not _QUALIFIED_NAME.match(self._cost_view):
+            logger.warning(f"Ignoring invalid billing cost_view: {self._cost_view!r}")
+            self._cost_view = ""
+        # Monotonic time before which a transiently failing view is skipped
+        self._cost_view_retry_at = 0.0
+        # Shared with every BillingOps for this workspace/profile and source
+        self._cache: dict[tuple, tuple[float, object]] = shared_cache(
+            client.config, "billing", self._warehouse_id, self._cost_view
+        )
+
+    def invalidate(self, *, scope: str = "all") -> None:
+        """Drop cached query results so the next call hits the warehouse.
+
+        Args:
+            scope: "all", or one of CACHE_SCOPES to drop only that kind.
+
+        Raises:
+            ValueError: If scope is not recognised.
+        """
+        if scope == "all":
+            self._cache.clear()
+            return
+        if scope not in self.CACHE_SCOPES:
+            raise ValueError(f"Unknown billing cache scope: {scope!r}")
+        for key in [k for k in self._cache if k[0] == scope]:
+            self._cache.pop(key, None)
+
+    def _fresh(self, key: tuple) -> Any:
+        """Return the cached value for key if within the TTL, else None.
+
+        Entries hold different result types per key kind, so the value is
+        untyped; callers know what their key maps to.
+        """
+        hit = self._cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < self.CACHE_TTL_SECONDS:
+            return hit[1]
+        return None
+
+    def _cached(self, key: tuple, fetch: Callable[[], T]) -> T:
+        """Return a fresh cached result for key, or fetch and cache it.
+
+        Empty results are not cached so failures and transient gaps are
+        retried on the next call.
+        """
+        cached: T | None = self._fresh(key)
+        if cached is not None:
+            return cached
+
+        value = fetch()
+        if value:
+            self._cache[key] = (time.monotonic(), value)
+        return value
 
     @property
     def warehouse_id(self) -> str:
         """The SQL warehouse ID for query execution."""
         return self._warehouse_id
 
-    def _execute_query(
+    def _run_statement(
         self,
         query: str,
-        parameters: Optional[list[dict]] = None,
+        parameters: tuple[tuple[str, str, str], ...] = (),
         timeout_seconds: int = 50,
-    ) -> list[dict]:
-        """Execute SQL via Statement Execution API.
+    ) -> tuple[StatementResponse | None, str]:
+        """Execute one SQL statement via Statement Execution API.
 
         Args:
-            query: SQL query string with :param placeholders.
-            parameters: List of parameter dicts with name, value, type.
-            timeout_seconds: Query timeout.
+            query: SQL statement with :param placeholders.
+            parameters: (name, value, SQL type) triples, e.g. DATE or STRING.
+            timeout_seconds: How long to wait for the statement.
 
         Returns:
-            List of row dicts with column names as keys.
+            Tuple of (response, error_message). response is None when the
+            statement could not be run or FAILED.
         """
         if not self._warehouse_id:
             logger.error("No SQL warehouse configured for billing queries")
-            return []
+            return None, "No SQL warehouse configured"
 
         try:
-            # Build parameters for the API
-            params = None
-            if parameters:
-                params = [
-                    StatementParameterListItem(
-                        name=p["name"],
-                        value=str(p["value"]),
-                        type="STRING",
-                    )
-                    for p in parameters
-                ]
+            # Build typed parameters for the API; typed values let the
+            # warehouse reuse plans and cached results for repeat queries
+            params = [
+                StatementParameterListItem(name=name, value=value, type=sql_type)
+                for name, value, sql_type in parameters
+            ] or None
 
             # Execute statement
             response = self._client.sdk.statement_execution.execute_statement(
@@ -82,61 +165,167 @@ class BillingOps:
                 parameters=params,
                 wait_timeout=f"{timeout_seconds}s",
             )
+        except Exception as e:
+            logger.error(f"Query execution failed: {e}")
+            return None, str(e)
 
-            # Check for errors
-            if response.status and response.status.state:
-                state = response.status.state.value if hasattr(response.status.state, "value") else str(response.status.state)
-                if state == "FAILED":
-                    error_msg = ""
-                    if response.status.error:
-                        error_msg = getattr(response.status.error, "message", str(response.status.error))
-                    logger.error(f"Query failed: {error_msg}")
-                    return []
-
-            # Extract results
-            if not response.result or not response.result.data_array:
-                return []
-
-            # Get column names from manifest
-            columns = []
-            if response.manifest and response.manifest.schema and response.manifest.schema.columns:
-                columns = [col.name for col in response.manifest.schema.columns]
-
-            if not columns:
-                return []
-
-            # Convert to list of dicts
-            rows = []
-            for row_data in response.result.data_array:
-                row_dict = {}
-                for i, col_name in enumerate(columns):
-                    if i < len(row_data):
-                        row_dict[col_name] = row_data[i]
-                    else:
-                        row_dict[col_name] = None
-                rows.append(row_dict)
-
-            return rows
+        # Check for errors
+        if response.status and response.status.state:
+            state = response.status.state.value if hasattr(response.status.state, "value") else str(response.status.state)
+            if state == "FAILED":
+                error_msg = ""
+                if response.status.error:
+                    error_msg = getattr(response.status.error, "message", str(response.status.error))
+                logger.error(f"Query failed: {error_msg}")
+                return None, error_msg or "Query failed"
+
+        return response, ""
+
+    def _execute_query(
+        self,
+        query: str,
+        parameters: tuple[tuple[str, str, str], ...] = (),
+        timeout_seconds: int = 50,
+    ) -> tuple[dict[str, int], list[list]]:
+        """Execute a SQL query and collect its rows.
+
+        Args:
+            query: SQL query string with :param placeholders.
+            parameters: (name, value, SQL type) triples, e.g. DATE or STRING.
+            timeout_seconds: Query timeout.
+
+        Returns:
+            Tuple of (column name -> index map, raw row lists). The map is
+            built once per query so models can index rows positionally.
+            An empty map means the query failed.
+        """
+        response, _ = self._run_statement(query, parameters, timeout_seconds)
+        if response is None:
+            return {}, []
+        return self._collect_rows(response)
+
+    def _collect_rows(self, response: StatementResponse) -> tuple[dict[str, int], list[list]]:
+        """Read every result chunk of a finished statement.
+
+        Returns:
+            Tuple of (column name -> index map, raw row lists); an empty map
+            means the result could not be read.
+        """
+        try:
+            idx = _column_index(response)
+            if not idx:
+                return {}, []
+
+            # Collect rows from every result chunk
+            rows: list[list] = []
+            for chunk in self._iter_chunks(response):
+                rows.extend(chunk)
+
+            return idx, rows
 
         except Exception as e:
             logger.error(f"Query execution failed: {e}")
-            return []
+            return {}, []
+
+    def _query_cost_view(
+        self,
+        view_query: str,
+        fallback_query: str,
+        parameters: tuple[tuple[str, str, str], ...],
+    ) -> tuple[dict[str, int], list[list]]:
+        """Run view_query against the cost view, or fallback_query without it.
+
+        If the configured view is missing or not granted, it is disabled for
+        this instance. Any other failure only skips the view for
+        CACHE_TTL_SECONDS; the system-table query answers meanwhile.
+        """
+        if self._cost_view and time.monotonic() >= self._cost_view_retry_at:
+            response, error = self._run_statement(
+                view_query.format(cost_view=self._cost_view), parameters, timeout_seconds=50
+            )
+            if response is not None:
+                idx, rows = self._collect_rows(response)
+                if idx:
+                    return idx, rows
+            if any(code in error.upper() for code in _VIEW_UNAVAILABLE_ERRORS):
+                logger.warning(f"Cost view {self._cost_view} unavailable, using system tables")
+                self._cost_view = ""
+            else:
+                logger.warning(
+                    f"Cost view {self._cost_view} query failed, using system tables "
+                    f"for {self.CACHE_TTL_SECONDS:.0f}s: {error}"
+                )
+                self._cost_view_retry_at = time.monotonic() + self.CACHE_TTL_SECONDS
+
+        return self._execute_query(fallback_query, parameters, timeout_seconds=50)
+
+    def create_cost_view(self, name: str = DEFAULT_COST_VIEW) -> tuple[bool, str]:
+        """Create the pre-aggregated cost materialized view.
+
+        The view refreshes hourly on the Databricks side. The initial build
+        may outlive the wait timeout; it keeps running in the background.
+
+        Args:
+            name: Fully qualified view name (schema.view or catalog.schema.view).
+
+        Returns:
+            Tuple of (success, error_message).
+        """
+        if not _QUALIFIED_NAME.match(name):
+            return False, f"Invalid view name: {name}"
+
+        schema = name.rsplit(".", 1)[0]
+        for ddl in (
+            COST_VIEW_SCHEMA_DDL.format(schema=schema),
+            COST_VIEW_DDL.format(cost_view=name),
+        ):
+            response, error = self._run_statement(ddl, timeout_seconds=50)
+            if response is None:
+                return False, error
+
+        self._cost_view = name
+        return True, ""
+
+    def _iter_chunks(self, response: StatementResponse) -> Iterator[list[list]]:
+        """Yield each inline result chunk's data_array in order.
+
+        Large results are split into chunks; the first arrives with the
+        execute response and the rest are fetched one at a time by
+        next_chunk_index, so rows can be consumed as each chunk lands.
+        """
+        result = response.result
+        while result is not None:
+            if result.data_array:
+                yield result.data_array
+            if result.next_chunk_index is None or not response.statement_id:
+                return
+            result = self._client.sdk.statement_execution.get_statement_result_chunk_n(
+                statement_id=response.statement_id,
+                chunk_index=result.next_chunk_index,
+            )
 
     def check_access(self) -> tuple[bool, str]:
         """Check if user has access to billing tables.
 
+        Probes Unity Catalog metadata rather than the tables themselves,
+        so no data files are scanned.
+
         Returns:
             Tuple of (success, error_message).
         """
         if not self._warehouse_id:
             return False, "No SQL warehouse configured"
 
-        try:
-            rows = self._execute_query(ACCESS_CHECK_QUERY, timeout_seconds=30)
-            # If we get any result (even empty), access is OK
-            return True, ""
-        except Exception as e:
-            return False, str(e)
+        response, error = self._run_statement(ACCESS_CHECK_QUERY, timeout_seconds=30)
+        if response is None:
+            return False, error
+
+        rows = response.result.data_array if response.result else None
+        visible = {row[0] for row in rows or ()}
+        missing = [f"system.billing.{t}" for t in REQUIRED_TABLES if t not in visible]
+        if missing:
+            return False, f"No access to {', '.join(missing)}"
+        return True, ""
 
     def get_time_window_bounds(
         self,
@@ -164,19 +353,17 @@ class BillingOps:
         Returns:
             List of SkuCostSummary, sorted by cost descending.
         """
-        start, end = self.get_time_window_bounds(window)
+        return self._cached(("sku", window), lambda: self._fetch_sku_costs(window))
 
-        params = [
-            {"name": "window_start", "value": start.strftime("%Y-%m-%d")},
-            {"name": "window_end", "value": end.strftime("%Y-%m-%d")},
-        ]
+    def _fetch_sku_costs(self, window: TimeWindow) -> list[SkuCostSummary]:
+        params = _window_params(window, datetime.now(timezone.utc).date())
 
-        rows = self._execute_query(SKU_COST_QUERY, params, timeout_seconds=50)
+        idx, rows = self._query_cost_view(SKU_COST_VIEW_QUERY, SKU_COST_QUERY, params)
 
         summaries = []
         for row in rows:
             try:
-                summaries.append(SkuCostSummary.from_row(row))
+                summaries.append(SkuCostSummary.from_row(row, idx))
             except Exception as e:
                 logger.warning(f"Failed to parse SKU cost row: {e}")
 
@@ -198,21 +385,53 @@ class BillingOps:
         Returns:
             List of UsageBreakdown, sorted by cost descending.
         """
-        start, end = self.get_time_window_bounds(window)
+        return self._cached(
+            ("breakdown", sku_name, usage_type, window),
+            lambda: self._fetch_usage_breakdown(sku_name, usage_type, window),
+        )
 
-        params = [
-            {"name": "sku_name", "value": sku_name},
-            {"name": "usage_type", "value": usage_type},
-            {"name": "window_start", "value": start.strftime("%Y-%m-%d")},
-            {"name": "window_end", "value": end.strftime("%Y-%m-%d")},
+    def prefetch_breakdowns(
+        self,
+        skus: list[SkuCostSummary],
+        window: TimeWindow,
+    ) -> None:
+        """Warm the breakdown cache for SKUs the user is likely to open next.
+
+        Already-cached SKUs cost nothing; the rest are queried in parallel.
+
+        Args:
+            skus: SKUs to prefetch, most likely first.
+            window: Time window to query.
+        """
+        pending = [
+            sku for sku in skus
+            if self._fresh(("breakdown", sku.sku_name, sku.usage_type, window)) is None
         ]
+        if not pending:
+            return
 
-        rows = self._execute_query(BREAKDOWN_QUERY, params, timeout_seconds=50)
+        _ = self._client.sdk  # initialize once before fanning out
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            for sku in pending:
+                executor.submit(self.get_usage_breakdown, sku.sku_name, sku.usage_type, window)
+
+    def _fetch_usage_breakdown(
+        self,
+        sku_name: str,
+        usage_type: str,
+        window: TimeWindow,
+    ) -> list[UsageBreakdown]:
+        params = (
+            ("sku_name", sku_name, "STRING"),
+            ("usage_type", usage_type, "STRING"),
+        ) + _window_params(window, datetime.now(timezone.utc).date())
+
+        idx, rows = self._execute_query(BREAKDOWN_QUERY, params, timeout_seconds=50)
 
         breakdowns = []
         for row in rows:
             try:
-                breakdowns.append(UsageBreakdown.from_row(row))
+                breakdowns.append(UsageBreakdown.from_row(row, idx))
             except Exception as e:
                 logger.warning(f"Failed to parse breakdown row: {e}")
 
@@ -232,19 +451,173 @@ class BillingOps:
         Returns:
             Total estimated cost as Decimal.
         """
-        start, end = self.get_time_window_bounds(window)
+        return self._cached(("total", window), lambda: self._fetch_total_cost(window))
 
-        params = [
-            {"name": "window_start", "value": start.strftime("%Y-%m-%d")},
-            {"name": "window_end", "value": end.strftime("%Y-%m-%d")},
-        ]
+    def _fetch_total_cost(self, window: TimeWindow) -> Decimal:
+        params = _window_params(window, datetime.now(timezone.utc).date())
 
-        rows = self._execute_query(TOTAL_COST_QUERY, params, timeout_seconds=50)
+        idx, rows = self._query_cost_view(TOTAL_COST_VIEW_QUERY, TOTAL_COST_QUERY, params)
 
-        if rows and rows[0].get("total_cost"):
+        col = idx.get("total_cost")
+        total = rows[0][col] if rows and col is not None else None
+        if total:
             try:
-                return Decimal(str(rows[0]["total_cost"]))
+                return Decimal(str(total))
             except Exception:
                 pass
 
         return Decimal(0)
+
+    def load_dashboard(self, window: TimeWindow) -> BillingDashboard:
+        """Load SKU costs, all SKU breakdowns and the total in one query.
+
+        The results also seed the per-method caches, so subsequent
+        list_sku_costs/get_usage_breakdown/get_total_cost calls for the
+        same window are served without touching the warehouse.
+
+        Args:
+            window: Time window to query.
+
+        Returns:
+            BillingDashboard with rows sorted by cost descending.
+        """
+        dashboard = BillingDashboard()
+        for last in self.iter_dashboard(window):
+            dashboard = last
+        return dashboard
+
+    def iter_dashboard(self, window: TimeWindow) -> Iterator[BillingDashboard]:
+        """Yield the dashboard as it fills, once per result chunk.
+
+        The same BillingDashboard object is yielded each time with more
+        rows appended, so callers can render the first chunk while later
+        chunks are still being fetched. Caches are seeded once the last
+        chunk has been read.
+
+        Args:
+            window: Time window to query.
+        """
+        # Revisiting a window (e.g. cycling with "t") is served from cache
+        sku_costs = self._fresh(("sku", window))
+        if sku_costs is not None:
+            yield BillingDashboard(
+                sku_costs=sku_costs,
+                breakdowns={
+                    (key[1], key[2]): value
+                    for key in list(self._cache)
+                    if key[0] == "breakdown" and key[3] == window
+                    and (value := self._fresh(key)) is not None
+                },
+                total_cost=self._fresh(("total", window)) or Decimal(0),
+            )
+            return
+
+        if self._cost_view:
+            # The view answers SKUs and the total from pre-aggregated rows;
+            # breakdowns then load per SKU on drill-down.
+            yield BillingDashboard(
+                sku_costs=self.list_sku_costs(window),
+                total_cost=self.get_total_cost(window),
+            )
+            return
+
+        params = _window_params(window, datetime.now(timezone.utc).date())
+        response, _ = self._run_statement(DASHBOARD_QUERY, params, timeout_seconds=50)
+        idx = _column_index(response)
+        kind_col = idx.get("kind")
+        if response is None or kind_col is None:
+            return
+
+        dashboard = BillingDashboard()
+        try:
+            for chunk in self._iter_chunks(response):
+                for row in chunk:
+                    self._add_dashboard_row(dashboard, row, idx, row[kind_col])
+                yield dashboard
+        except Exception as e:
+            logger.error(f"Failed to read dashboard results: {e}")
+            return
+
+        now = time.monotonic()
+        if dashboard.sku_costs:
+            self._cache[("sku", window)] = (now, dashboard.sku_costs)
+        for (sku_name, usage_type), items in dashboard.breakdowns.items():
+            self._cache[("breakdown", sku_name, usage_type, window)] = (now, items)
+        if dashboard.total_cost:
+            self._cache[("total", window)] = (now, dashboard.total_cost)
+
+    @staticmethod
+    def _add_dashboard_row(
+        dashboard: BillingDashboard, row: list, idx: dict[str, int], kind: str
+    ) -> None:
+        """Parse one tagged DASHBOARD_QUERY row into the dashboard."""
+        try:
+            if kind == "sku":
+                dashboard.sku_costs.append(SkuCostSummary.from_row(row, idx))
+            elif kind == "breakdown":
+                key = (row[idx["sku_name"]], row[idx["usage_type"]])
+                dashboard.breakdowns.setdefault(key, []).append(
+                    UsageBreakdown.from_row(row, idx)
+                )
+            elif kind == "total":
+                total = row[idx["estimated_cost"]]
+                if total:
+                    dashboard.total_cost = Decimal(str(total))
+        except Exception as e:
+            logger.warning(f"Failed to parse {kind} dashboard row: {e}")
+
+    def check_access_and_load(
+        self, window: TimeWindow
+    ) -> tuple[bool, str, BillingDashboard | None]:
+        """Run the access probe and the dashboard query concurrently.
+
+        The Statement Execution API has no multi-statement batch call, so
+        the two statements are submitted side by side; first paint then
+        waits for the slower of the two rather than their sum.
+
+        Args:
+            window: Time window for the dashboard.
+
+        Returns:
+            Tuple of (access_ok, error_message, dashboard). dashboard is
+            None when access is denied.
+        """
+        _ = self._client.sdk  # initialize once before fanning out
+        executor = ThreadPoolExecutor(max_workers=2)
+        try:
+            access = executor.submit(self.check_access)
+            dashboard = executor.submit(self.load_dashboard, window)
+            ok, error = access.result()
+            if not ok:
+                # Don't hold the screen on a dashboard the user can't see;
+                # the in-flight statement finishes in the background.
+                return False, error, None
+            return True, "", dashboard.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+@lru_cache(maxsize=8)
+def _window_params(window: TimeWindow, today: date) -> tuple[tuple[str, str, str], ...]:
+    """Return the window_start/window_end query parameters for a window.
+
+    Queries filter on usage_date, so the bounds only change when the UTC
+    date does; keying on today lets every query in a refresh share one
+    formatted pair.
+    """
+    start = today - timedelta(days=window.days)
+    return (
+        ("window_start", start.isoformat(), "DATE"),
+        ("window_end", today.isoformat(), "DATE"),
+    )
+
+
+def _column_index(response: StatementResponse | None) -> dict[str, int]:
+    """Map column names to row positions from a statement's manifest."""
+    if response and response.manifest and response.manifest.schema and response.manifest.schema.columns:
+        return {
+            col.name: i
+            for i, col in enumerate(response.manifest.schema.columns)
+            if col.name is not None
+        }
+    return {}
@@ -1,6 +1,10 @@
 """Billing data models.
 
 Defines cost summary and usage breakdown structures for the Billing screen.
+
+Per-row DBU and price figures are floats: they are only ever displayed to
+a few decimal places. Decimal is reserved for summed totals (see
+BillingOps.get_total_cost).
 """
 
 from __future__ import annotations
@@ -8,7 +12,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional, TypeVar
 
 
 class TimeWindow(str, Enum):
@@ -19,17 +23,15 @@ class TimeWindow(str, Enum):
 
     @property
     def days(self) -> int:
-        return {"24h": 1, "7d": 7, "30d": 30}[self.value]
+        return _WINDOW_DAYS[self]
 
     @property
     def display(self) -> str:
-        return {"24h": "24 hours", "7d": "7 days", "30d": "30 days"}[self.value]
+        return _WINDOW_DISPLAY[self]
 
     def next(self) -> "TimeWindow":
         """Cycle to next time window."""
-        windows = [TimeWindow.DAY_1, TimeWindow.DAY_7, TimeWindow.DAY_30]
-        idx = windows.index(self)
-        return windows[(idx + 1) % len(windows)]
+        return _WINDOW_NEXT[self]
 
 
 class GroupBy(str, Enum):
@@ -41,38 +43,62 @@ class GroupBy(str, Enum):
 
     @property
     def display(self) -> str:
-        return self.value.replace("_id", "").title()
+        return _GROUP_DISPLAY[self]
 
     def next(self) -> "GroupBy":
         """Cycle to next grouping."""
-        groups = [GroupBy.CLUSTER, GroupBy.WAREHOUSE, GroupBy.JOB, GroupBy.WORKSPACE]
-        idx = groups.index(self)
-        return groups[(idx + 1) % len(groups)]
+        return _GROUP_NEXT[self]
 
 
-@dataclass
+E = TypeVar("E", bound=Enum)
+
+
+def _cycle(members: tuple[E, ...]) -> dict[E, E]:
+    """Map each member to the one after it, wrapping at the end."""
+    return dict(zip(members, members[1:] + members[:1], strict=True))
+
+
+# Per-member lookups built once, so hotkey cycling and display are O(1)
+_WINDOW_DAYS = {TimeWindow.DAY_1: 1, TimeWindow.DAY_7: 7, TimeWindow.DAY_30: 30}
+_WINDOW_DISPLAY = {
+    TimeWindow.DAY_1: "24 hours",
+    TimeWindow.DAY_7: "7 days",
+    TimeWindow.DAY_30: "30 days",
+}
+_WINDOW_NEXT = _cycle((TimeWindow.DAY_1, TimeWindow.DAY_7, TimeWindow.DAY_30))
+_GROUP_DISPLAY = {g: g.value.replace("_id", "").title() for g in GroupBy}
+_GROUP_NEXT = _cycle((GroupBy.CLUSTER, GroupBy.WAREHOUSE, GroupBy.JOB, GroupBy.WORKSPACE))
+
+
+@dataclass(slots=True, frozen=True)
 class SkuCostSummary:
     """SKU-level cost summary for left pane."""
     sku_name: str
     usage_type: str
-    total_dbu: Decimal
-    unit_price_effective: Decimal
-    estimated_cost: Decimal
-    unit_price_list: Optional[Decimal] = None
-    unit_price_promo: Optional[Decimal] = None
-    discount_pct: Optional[Decimal] = None
+    total_dbu: float
+    unit_price_effective: float
+    estimated_cost: float
+    unit_price_list: float | None = None
+    unit_price_promo: float | None = None
+    discount_pct: float | None = None
+
+    # Rendered once at construction; rows are immutable
+    _cost_display: str = field(init=False, repr=False, compare=False, default="")
+    _dbu_display: str = field(init=False, repr=False, compare=False, default="")
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_cost_display", _format_cost(self.estimated_cost))
+        object.__setattr__(self, "_dbu_display", _format_dbu(self.total_dbu))
 
     @property
     def cost_display(self) -> str:
         """Format cost with dollar sign."""
-        return f"${self.estimated_cost:,.2f}"
+        return self._cost_display
 
     @property
     def dbu_display(self) -> str:
         """Format DBUs with K suffix for thousands."""
-        if self.total_dbu >= 1000:
-            return f"{self.total_dbu / 1000:,.1f}K"
-        return f"{self.total_dbu:,.1f}"
+        return self._dbu_display
 
     @property
     def discount_display(self) -> str:
@@ -87,21 +113,31 @@ class SkuCostSummary:
         return f"${self.unit_price_effective:.4f}"
 
     @classmethod
-    def from_row(cls, row: dict) -> "SkuCostSummary":
-        """Create from query result row."""
+    def from_row(cls, row: list, idx: dict[str, int]) -> "SkuCostSummary":
+        """Create from a raw query result row and its column index map."""
         return cls(
-            sku_name=row.get("sku_name") or "",
-            usage_type=row.get("usage_type") or "",
-            total_dbu=_to_decimal(row.get("total_dbu")),
-            unit_price_effective=_to_decimal(row.get("unit_price_effective")),
-            estimated_cost=_to_decimal(row.get("estimated_cost")),
-            unit_price_list=_to_decimal(row.get("unit_price_list")),
-            unit_price_promo=_to_decimal(row.get("unit_price_promo")),
-            discount_pct=_to_decimal(row.get("discount_pct")),
+            sku_name=_cell(row, idx, "sku_name") or "",
+            usage_type=_cell(row, idx, "usage_type") or "",
+            total_dbu=_to_float(_cell(row, idx, "total_dbu")),
+            unit_price_effective=_to_float(_cell(row, idx, "unit_price_effective")),
+            estimated_cost=_to_float(_cell(row, idx, "estimated_cost")),
+            unit_price_list=_to_float(_cell(row, idx, "unit_price_list")),
+            unit_price_promo=_to_float(_cell(row, idx, "unit_price_promo")),
+            discount_pct=_to_float(_cell(row, idx, "discount_pct")),
         )
 
 
-@dataclass
+# Resource fields in precedence order: (attribute, resource type, display formatter)
+_RESOURCE_FIELDS = (
+    ("cluster_id", "cluster", lambda v: v[:16]),
+    ("warehouse_id", "warehouse", lambda v: v[:16]),
+    ("job_id", "job", lambda v: f"job-{v}"),
+    ("pipeline_id", "pipeline", lambda v: f"pipeline-{v[:8]}"),
+    ("notebook_id", "notebook", lambda v: f"notebook-{v[:8]}"),
+)
+
+
+@dataclass(slots=True, frozen=True)
 class UsageBreakdown:
     """Usage breakdown by compute target for middle pane."""
     workspace_id: str
@@ -113,43 +149,44 @@ class UsageBreakdown:
     notebook_id: Optional[str] = None
     creator: Optional[str] = None
     resource_class: Optional[str] = None
-    total_dbu: Decimal = field(default_factory=lambda: Decimal(0))
-    unit_price_effective: Decimal = field(default_factory=lambda: Decimal(0))
-    estimated_cost: Decimal = field(default_factory=lambda: Decimal(0))
+    total_dbu: float = 0.0
+    unit_price_effective: float = 0.0
+    estimated_cost: float = 0.0
+
+    # Rendered once at construction; rows are immutable
+    _cost_display: str = field(init=False, repr=False, compare=False, default="")
+    _dbu_display: str = field(init=False, repr=False, compare=False, default="")
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_cost_display", _format_cost(self.estimated_cost))
+        object.__setattr__(self, "_dbu_display", _format_dbu(self.total_dbu))
+
+    def _resource(self) -> tuple[str, str, str] | None:
+        """Return (type, id, display) for the first populated resource field."""
+        for attr, kind, fmt in _RESOURCE_FIELDS:
+            value = getattr(self, attr)
+            if value:
+                return kind, value, fmt(value)
+        return None
 
     @property
     def resource_id(self) -> Optional[str]:
         """Return the primary resource identifier."""
-        return self.cluster_id or self.warehouse_id or self.job_id or self.pipeline_id or self.notebook_id
+        resource = self._resource()
+        return resource[1] if resource else None
 
     @property
     def resource_type(self) -> Optional[str]:
         """Return the type of resource."""
-        if self.cluster_id:
-            return "cluster"
-        if self.warehouse_id:
-            return "warehouse"
-        if self.job_id:
-            return "job"
-        if self.pipeline_id:
-            return "pipeline"
-        if self.notebook_id:
-            return "notebook"
-        return None
+        resource = self._resource()
+        return resource[0] if resource else None
 
     @property
     def resource_display(self) -> str:
         """Display name for the resource."""
-        if self.cluster_id:
-            return self.cluster_id[:16]
-        if self.warehouse_id:
-            return self.warehouse_id[:16]
-        if self.job_id:
-            return f"job-{self.job_id}"
-        if self.pipeline_id:
-            return f"pipeline-{self.pipeline_id[:8]}"
-        if self.notebook_id:
-            return f"notebook-{self.notebook_id[:8]}"
+        resource = self._resource()
+        if resource:
+            return resource[2]
         if self.creator:
             return f"[{self.creator[:16]}]"
         return "[unknown]"
@@ -157,39 +194,71 @@ class UsageBreakdown:
     @property
     def cost_display(self) -> str:
         """Format cost with dollar sign."""
-        return f"${self.estimated_cost:,.2f}"
+        return self._cost_display
 
     @property
     def dbu_display(self) -> str:
         """Format DBUs."""
-        if self.total_dbu >= 1000:
-            return f"{self.total_dbu / 1000:,.1f}K"
-        return f"{self.total_dbu:,.1f}"
+        return self._dbu_display
 
     @classmethod
-    def from_row(cls, row: dict) -> "UsageBreakdown":
-        """Create from query result row."""
+    def from_row(cls, row: list, idx: dict[str, int]) -> "UsageBreakdown":
+        """Create from a raw query result row and its column index map."""
+        job_id = _cell(row, idx, "job_id")
+        job_run_id = _cell(row, idx, "job_run_id")
         return cls(
-            workspace_id=str(row.get("workspace_id") or ""),
-            cluster_id=row.get("cluster_id"),
-            warehouse_id=row.get("warehouse_id"),
-            job_id=str(row.get("job_id")) if row.get("job_id") else None,
-            job_run_id=str(row.get("job_run_id")) if row.get("job_run_id") else None,
-            pipeline_id=row.get("pipeline_id"),
-            notebook_id=row.get("notebook_id"),
-            creator=row.get("creator"),
-            resource_class=row.get("resource_class"),
-            total_dbu=_to_decimal(row.get("total_dbu")),
-            unit_price_effective=_to_decimal(row.get("unit_price_effective")),
-            estimated_cost=_to_decimal(row.get("estimated_cost")),
+            workspace_id=str(_cell(row, idx, "workspace_id") or ""),
+            cluster_id=_cell(row, idx, "cluster_id"),
+            warehouse_id=_cell(row, idx, "warehouse_id"),
+            job_id=str(job_id) if job_id else None,
+            job_run_id=str(job_run_id) if job_run_id else None,
+            pipeline_id=_cell(row, idx, "pipeline_id"),
+            notebook_id=_cell(row, idx, "notebook_id"),
+            creator=_cell(row, idx, "creator"),
+            resource_class=_cell(row, idx, "resource_class"),
+            total_dbu=_to_float(_cell(row, idx, "total_dbu")),
+            unit_price_effective=_to_float(_cell(row, idx, "unit_price_effective")),
+            estimated_cost=_to_float(_cell(row, idx, "estimated_cost")),
         )
 
 
-def _to_decimal(value) -> Decimal:
-    """Safely convert a value to Decimal."""
+@dataclass
+class BillingDashboard:
+    """Everything the Billing screen shows for one time window."""
+    sku_costs: list[SkuCostSummary] = field(default_factory=list)
+    breakdowns: dict[tuple[str, str], list[UsageBreakdown]] = field(default_factory=dict)
+    total_cost: Decimal = Decimal(0)
+
+    def breakdown_for(self, sku_name: str, usage_type: str) -> list[UsageBreakdown]:
+        """Return the breakdown rows for a SKU, or an empty list."""
+        return self.breakdowns.get((sku_name, usage_type), [])
+
+
+def _format_cost(value: float) -> str:
+    """Format a cost with dollar sign and thousands separators."""
+    return f"${value:,.2f}"
+
+
+def _format_dbu(value: float) -> str:
+    """Format DBUs with K suffix for thousands."""
+    if value >= 1000:
+        return f"{value / 1000:,.1f}K"
+    return f"{value:,.1f}"
+
+
+def _cell(row: list, idx: dict[str, int], name: str) -> Any:
+    """Read a column from a raw result row by name, or None if absent."""
+    i = idx.get(name)
+    if i is None or i >= len(row):
+        return None
+    return row[i]
+
+
+def _to_float(value) -> float:
+    """Safely convert a value to float."""
     if value is None:
-        return Decimal(0)
+        return 0.0
     try:
-        return Decimal(str(value))
-    except Exception:
-        return Decimal(0)
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
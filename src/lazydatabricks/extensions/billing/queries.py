@@ -6,11 +6,20 @@ Databricks system tables (system.billing.usage, system.billing.list_prices).
 Parameters are passed as named parameters (:param_name format).
 """
 
-# Quick access check - validates user has billing table access
+# Quick access check - a catalog metadata probe that reads no Delta files.
+# information_schema only lists tables the caller holds privileges on, so a
+# missing row means no access.
 ACCESS_CHECK_QUERY = """
-SELECT 1 FROM system.billing.usage LIMIT 1
+SELECT table_name
+FROM system.information_schema.tables
+WHERE table_catalog = 'system'
+  AND table_schema = 'billing'
+  AND table_name IN ('usage', 'list_prices')
 """
 
+# Tables ACCESS_CHECK_QUERY must find
+REQUIRED_TABLES = ("usage", "list_prices")
+
 # SKU-level cost summary with effective pricing
 SKU_COST_QUERY = """
 WITH prices AS (
@@ -26,21 +35,26 @@ WITH prices AS (
     pricing.promotional.default     AS unit_price_promo
   FROM system.billing.list_prices
   WHERE usage_unit = 'DBU'
+    -- Only prices in effect during the window reach the join
+    AND price_start_time < DATE(:window_end)
+    AND COALESCE(price_end_time, TIMESTAMP '2999-12-31') > DATE(:window_start)
 ),
 usage AS (
+  -- Pre-aggregate to hourly buckets so the price join probes one row per
+  -- (SKU, hour) instead of one per usage record
   SELECT
     account_id,
     sku_name,
     cloud,
     usage_unit,
     usage_type,
-    billing_origin_product,
-    usage_start_time,
-    usage_quantity
+    DATE_TRUNC('HOUR', usage_start_time) AS usage_hour,
+    SUM(usage_quantity) AS usage_quantity
   FROM system.billing.usage
   WHERE usage_unit = 'DBU'
     AND usage_date >= DATE(:window_start)
     AND usage_date < DATE(:window_end)
+  GROUP BY account_id, sku_name, cloud, usage_unit, usage_type, DATE_TRUNC('HOUR', usage_start_time)
 )
 SELECT
   u.sku_name,
@@ -60,8 +74,8 @@ LEFT JOIN prices p
   AND u.sku_name   = p.sku_name
   AND u.cloud      = p.cloud
   AND u.usage_unit = p.usage_unit
-  AND u.usage_start_time >= p.price_start_time
-  AND u.usage_start_time <  p.price_end_time
+  AND u.usage_hour >= p.price_start_time
+  AND u.usage_hour <  p.price_end_time
 GROUP BY u.sku_name, u.usage_type
 ORDER BY estimated_cost DESC NULLS LAST
 LIMIT 50
@@ -77,16 +91,21 @@ WITH prices AS (
     pricing.effective_list.default AS unit_price_effective
   FROM system.billing.list_prices
   WHERE usage_unit = 'DBU'
+    AND sku_name = :sku_name
+    -- Only prices in effect during the window reach the join
+    AND price_start_time < DATE(:window_end)
+    AND COALESCE(price_end_time, TIMESTAMP '2999-12-31') > DATE(:window_start)
 ),
 usage AS (
+  -- Pre-aggregate to hourly buckets per resource before the price join
   SELECT
     account_id,
     workspace_id,
     sku_name,
     cloud,
     usage_unit,
-    usage_start_time,
-    usage_quantity,
+    DATE_TRUNC('HOUR', usage_start_time) AS usage_hour,
+    SUM(usage_quantity)             AS usage_quantity,
     usage_metadata.cluster_id       AS cluster_id,
     usage_metadata.warehouse_id     AS warehouse_id,
     usage_metadata.job_id           AS job_id,
@@ -101,6 +120,13 @@ usage AS (
     AND usage_type = :usage_type
     AND usage_date >= DATE(:window_start)
     AND usage_date < DATE(:window_end)
+  GROUP BY
+    account_id, workspace_id, sku_name, cloud, usage_unit,
+    DATE_TRUNC('HOUR', usage_start_time),
+    usage_metadata.cluster_id, usage_metadata.warehouse_id,
+    usage_metadata.job_id, usage_metadata.job_run_id,
+    usage_metadata.dlt_pipeline_id, usage_metadata.notebook_id,
+    custom_tags.x_Creator, custom_tags.x_ResourceClass
 )
 SELECT
   workspace_id,
@@ -121,8 +147,8 @@ LEFT JOIN prices p
   AND u.sku_name   = p.sku_name
   AND u.cloud      = p.cloud
   AND u.usage_unit = p.usage_unit
-  AND u.usage_start_time >= p.price_start_time
-  AND u.usage_start_time <  p.price_end_time
+  AND u.usage_hour >= p.price_start_time
+  AND u.usage_hour <  p.price_end_time
 GROUP BY workspace_id, cluster_id, warehouse_id, job_id, job_run_id, pipeline_id, notebook_id, creator, resource_class
 ORDER BY estimated_cost DESC NULLS LAST
 LIMIT 200
@@ -130,27 +156,223 @@ LIMIT 200
 
 # Total cost for time window (used for home screen widget)
 TOTAL_COST_QUERY = """
+-- Flat scan + join + aggregate; price filters live in the ON clause so the
+-- LEFT JOIN still keeps usage rows that have no matching price
+SELECT
+  SUM(u.usage_quantity * p.pricing.effective_list.default) AS total_cost
+FROM system.billing.usage u
+LEFT JOIN system.billing.list_prices p
+  ON  u.account_id = p.account_id
+  AND u.sku_name   = p.sku_name
+  AND u.cloud      = p.cloud
+  AND u.usage_unit = p.usage_unit
+  AND p.usage_unit = 'DBU'
+  AND u.usage_start_time >= p.price_start_time
+  AND u.usage_start_time <  COALESCE(p.price_end_time, TIMESTAMP '2999-12-31')
+WHERE u.usage_unit = 'DBU'
+  AND u.usage_date >= DATE(:window_start)
+  AND u.usage_date < DATE(:window_end)
+"""
+
+# SKU costs, per-SKU breakdowns and the window total in a single scan of
+# system.billing.usage. Every row carries a `kind` tag ('sku', 'breakdown'
+# or 'total'); columns that do not apply to a kind are NULL. The total is
+# reported in the estimated_cost column.
+DASHBOARD_QUERY = """
 WITH prices AS (
   SELECT
-    account_id, sku_name, cloud, usage_unit,
+    account_id,
+    sku_name,
+    cloud,
+    usage_unit,
     price_start_time,
     COALESCE(price_end_time, TIMESTAMP '2999-12-31') AS price_end_time,
-    pricing.effective_list.default AS unit_price_effective
+    pricing.effective_list.default  AS unit_price_effective,
+    pricing.default                 AS unit_price_list,
+    pricing.promotional.default     AS unit_price_promo
   FROM system.billing.list_prices
   WHERE usage_unit = 'DBU'
+    -- Only prices in effect during the window reach the join
+    AND price_start_time < DATE(:window_end)
+    AND COALESCE(price_end_time, TIMESTAMP '2999-12-31') > DATE(:window_start)
 ),
 usage AS (
+  -- Pre-aggregate to hourly buckets per resource before the price join
   SELECT
-    account_id, sku_name, cloud, usage_unit,
-    usage_start_time, usage_quantity
+    account_id,
+    workspace_id,
+    sku_name,
+    cloud,
+    usage_unit,
+    usage_type,
+    DATE_TRUNC('HOUR', usage_start_time) AS usage_hour,
+    SUM(usage_quantity)             AS usage_quantity,
+    usage_metadata.cluster_id       AS cluster_id,
+    usage_metadata.warehouse_id     AS warehouse_id,
+    usage_metadata.job_id           AS job_id,
+    usage_metadata.job_run_id       AS job_run_id,
+    usage_metadata.dlt_pipeline_id  AS pipeline_id,
+    usage_metadata.notebook_id      AS notebook_id,
+    custom_tags.x_Creator           AS creator,
+    custom_tags.x_ResourceClass     AS resource_class
   FROM system.billing.usage
   WHERE usage_unit = 'DBU'
     AND usage_date >= DATE(:window_start)
     AND usage_date < DATE(:window_end)
+  GROUP BY
+    account_id, workspace_id, sku_name, cloud, usage_unit, usage_type,
+    DATE_TRUNC('HOUR', usage_start_time),
+    usage_metadata.cluster_id, usage_metadata.warehouse_id,
+    usage_metadata.job_id, usage_metadata.job_run_id,
+    usage_metadata.dlt_pipeline_id, usage_metadata.notebook_id,
+    custom_tags.x_Creator, custom_tags.x_ResourceClass
+),
+priced AS (
+  SELECT
+    u.*,
+    p.unit_price_effective,
+    p.unit_price_list,
+    p.unit_price_promo
+  FROM usage u
+  LEFT JOIN prices p
+    ON  u.account_id = p.account_id
+    AND u.sku_name   = p.sku_name
+    AND u.cloud      = p.cloud
+    AND u.usage_unit = p.usage_unit
+    AND u.usage_hour >= p.price_start_time
+    AND u.usage_hour <  p.price_end_time
+),
+skus AS (
+  SELECT
+    sku_name,
+    usage_type,
+    SUM(usage_quantity) AS total_dbu,
+    MAX(unit_price_effective) AS unit_price_effective,
+    SUM(usage_quantity) * MAX(unit_price_effective) AS estimated_cost,
+    MAX(unit_price_list) AS unit_price_list,
+    MAX(unit_price_promo) AS unit_price_promo,
+    CASE
+      WHEN MAX(unit_price_list) IS NULL OR MAX(unit_price_list) = 0 THEN NULL
+      ELSE 1 - (MAX(unit_price_effective) / MAX(unit_price_list))
+    END AS discount_pct
+  FROM priced
+  GROUP BY sku_name, usage_type
+),
+breakdowns AS (
+  SELECT
+    sku_name,
+    usage_type,
+    workspace_id,
+    cluster_id,
+    warehouse_id,
+    job_id,
+    job_run_id,
+    pipeline_id,
+    notebook_id,
+    creator,
+    resource_class,
+    SUM(usage_quantity) AS total_dbu,
+    MAX(unit_price_effective) AS unit_price_effective,
+    SUM(usage_quantity) * MAX(unit_price_effective) AS estimated_cost,
+    ROW_NUMBER() OVER (
+      PARTITION BY sku_name, usage_type
+      ORDER BY SUM(usage_quantity) * MAX(unit_price_effective) DESC NULLS LAST
+    ) AS rn
+  FROM priced
+  GROUP BY sku_name, usage_type, workspace_id, cluster_id, warehouse_id, job_id, job_run_id, pipeline_id, notebook_id, creator, resource_class
+),
+ranked_skus AS (
+  SELECT *, ROW_NUMBER() OVER (ORDER BY estimated_cost DESC NULLS LAST) AS rn
+  FROM skus
+)
+SELECT * FROM (
+  SELECT
+    'sku' AS kind, sku_name, usage_type,
+    NULL AS workspace_id, NULL AS cluster_id, NULL AS warehouse_id,
+    NULL AS job_id, NULL AS job_run_id, NULL AS pipeline_id,
+    NULL AS notebook_id, NULL AS creator, NULL AS resource_class,
+    total_dbu, unit_price_effective, estimated_cost,
+    unit_price_list, unit_price_promo, discount_pct
+  FROM ranked_skus
+  WHERE rn <= 50
+
+  UNION ALL
+
+  -- Breakdowns only for the SKUs returned above
+  SELECT
+    'breakdown', b.sku_name, b.usage_type,
+    b.workspace_id, b.cluster_id, b.warehouse_id,
+    b.job_id, b.job_run_id, b.pipeline_id,
+    b.notebook_id, b.creator, b.resource_class,
+    b.total_dbu, b.unit_price_effective, b.estimated_cost,
+    NULL, NULL, NULL
+  FROM breakdowns b
+  JOIN ranked_skus r
+    ON  b.sku_name = r.sku_name
+    AND b.usage_type <=> r.usage_type
+  WHERE b.rn <= 200
+    AND r.rn <= 50
+
+  UNION ALL
+
+  SELECT
+    'total', NULL, NULL,
+    NULL, NULL, NULL,
+    NULL, NULL, NULL,
+    NULL, NULL, NULL,
+    SUM(usage_quantity), NULL, SUM(usage_quantity * unit_price_effective),
+    NULL, NULL, NULL
+  FROM priced
+)
+ORDER BY estimated_cost DESC NULLS LAST
+"""
+
+# ─── Pre-aggregated cost view ───────────────────────────────────
+#
+# Optional materialized view holding daily DBU totals per SKU with the
+# effective price already joined. It is liquid-clustered on the columns
+# every reader filters by, so window queries skip unrelated files. When
+# configured (cost_view in [extensions.billing]), SKU and total queries
+# read O(groups) rows from it instead of scanning system.billing.usage.
+# Created by `lazydatabricks setup billing`; `{cost_view}` is the fully
+# qualified name.
+
+DEFAULT_COST_VIEW = "lazydatabricks_billing.sku_daily_cost"
+
+COST_VIEW_SCHEMA_DDL = """
+CREATE SCHEMA IF NOT EXISTS {schema}
+"""
+
+COST_VIEW_DDL = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS {cost_view}
+CLUSTER BY (usage_date, sku_name)
+SCHEDULE EVERY 1 HOUR
+AS
+WITH prices AS (
+  SELECT
+    account_id,
+    sku_name,
+    cloud,
+    usage_unit,
+    price_start_time,
+    COALESCE(price_end_time, TIMESTAMP '2999-12-31') AS price_end_time,
+    pricing.effective_list.default  AS unit_price_effective,
+    pricing.default                 AS unit_price_list,
+    pricing.promotional.default     AS unit_price_promo
+  FROM system.billing.list_prices
+  WHERE usage_unit = 'DBU'
 )
 SELECT
-  SUM(u.usage_quantity * p.unit_price_effective) AS total_cost
-FROM usage u
+  u.usage_date,
+  u.sku_name,
+  u.usage_type,
+  u.billing_origin_product,
+  SUM(u.usage_quantity) AS total_dbu,
+  SUM(u.usage_quantity * p.unit_price_effective) AS estimated_cost,
+  MAX(p.unit_price_effective) AS unit_price_effective,
+  MAX(p.unit_price_list) AS unit_price_list,
+  MAX(p.unit_price_promo) AS unit_price_promo
+FROM system.billing.usage u
 LEFT JOIN prices p
   ON  u.account_id = p.account_id
   AND u.sku_name   = p.sku_name
@@ -158,4 +380,37 @@ LEFT JOIN prices p
   AND u.usage_unit = p.usage_unit
   AND u.usage_start_time >= p.price_start_time
   AND u.usage_start_time <  p.price_end_time
+WHERE u.usage_unit = 'DBU'
+GROUP BY u.usage_date, u.sku_name, u.usage_type, u.billing_origin_product
+"""
+
+# SKU_COST_QUERY equivalent over the cost view
+SKU_COST_VIEW_QUERY = """
+SELECT
+  sku_name,
+  usage_type,
+  SUM(total_dbu) AS total_dbu,
+  MAX(unit_price_effective) AS unit_price_effective,
+  SUM(total_dbu) * MAX(unit_price_effective) AS estimated_cost,
+  MAX(unit_price_list) AS unit_price_list,
+  MAX(unit_price_promo) AS unit_price_promo,
+  CASE
+    WHEN MAX(unit_price_list) IS NULL OR MAX(unit_price_list) = 0 THEN NULL
+    ELSE 1 - (MAX(unit_price_effective) / MAX(unit_price_list))
+  END AS discount_pct
+FROM {cost_view}
+WHERE usage_date >= DATE(:window_start)
+  AND usage_date < DATE(:window_end)
+GROUP BY sku_name, usage_type
+ORDER BY estimated_cost DESC NULLS LAST
+LIMIT 50
+"""
+
+# TOTAL_COST_QUERY equivalent over the cost view
+TOTAL_COST_VIEW_QUERY = """
+SELECT
+  SUM(estimated_cost) AS total_cost
+FROM {cost_view}
+WHERE usage_date >= DATE(:window_start)
+  AND usage_date < DATE(:window_end)
 """
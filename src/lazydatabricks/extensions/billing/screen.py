@@ -12,6 +12,7 @@ from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import DataTable, Static
 from textual import work
+from textual.worker import get_current_worker
 
 from lazydatabricks.extensions.billing.models import (
     GroupBy,
@@ -36,13 +37,20 @@ class BillingScreen(BaseScreen):
         ("g", "cycle_grouping", "Group By"),
     ]
 
+    # SKUs below the top one whose breakdowns are fetched ahead of selection
+    PREFETCH_SKUS = 3
+
     def __init__(self) -> None:
         super().__init__()
         self._sku_costs: list[SkuCostSummary] = []
         self._breakdowns: list[UsageBreakdown] = []
         self._selected_sku: SkuCostSummary | None = None
+        # While the dashboard streams in, drill-downs wait for it: its single
+        # scan seeds every breakdown once the last chunk has been read
+        self._dashboard_loading = True
         self._selected_breakdown: UsageBreakdown | None = None
         self._current_pane = 0  # 0=skus, 1=breakdown, 2=detail
+        self._styled_pane = 0  # pane currently carrying pane-active
         self._time_window = TimeWindow.DAY_7
         self._group_by = GroupBy.CLUSTER
         self._access_ok: bool | None = None  # None = not checked yet
@@ -100,12 +108,26 @@ class BillingScreen(BaseScreen):
         """Initialize the screen."""
         super().on_mount()
 
+        # Cache widget handles; the layout is fixed after compose
+        self._sku_table = self.query_one("#sku-table", DataTable)
+        self._sku_subtitle = self.query_one("#sku-subtitle", Static)
+        self._breakdown_table = self.query_one("#breakdown-table", DataTable)
+        self._detail = self.query_one("#usage-detail", Static)
+        self._panes = tuple(
+            self.query_one(pane_id, Vertical)
+            for pane_id in ("#pane-sku", "#pane-breakdown", "#pane-detail")
+        )
+        self._titles = tuple(
+            self.query_one(title_id, Static)
+            for title_id in ("#sku-title", "#breakdown-title", "#detail-title")
+        )
+
         # Set up tables
-        sku_table = self.query_one("#sku-table", DataTable)
+        sku_table = self._sku_table
         sku_table.cursor_type = "row"
         sku_table.add_columns("SKU", "Type", "DBUs", "Cost")
 
-        breakdown_table = self.query_one("#breakdown-table", DataTable)
+        breakdown_table = self._breakdown_table
         breakdown_table.cursor_type = "row"
         breakdown_table.add_columns("Resource", "Workspace", "DBUs", "Cost")
 
@@ -120,13 +142,14 @@ class BillingScreen(BaseScreen):
                 self.app.call_from_thread(self._show_not_configured)
                 return
 
-            ok, error = billing_ops.check_access()
+            ok, error, dashboard = billing_ops.check_access_and_load(self._time_window)
             if not ok:
                 self.app.call_from_thread(self._show_access_error, error)
                 return
 
             self._access_ok = True
-            self.app.call_from_thread(self._load_sku_costs)
+            self.app.call_from_thread(self._update_sku_table, dashboard.sku_costs)
+            self.app.call_from_thread(self._dashboard_loaded, bool(dashboard.breakdowns))
         except Exception as e:
             self.app.call_from_thread(self._show_access_error, str(e))
 
@@ -134,7 +157,7 @@ class BillingScreen(BaseScreen):
         """Show message when billing extension not configured."""
         self._access_ok = False
         self._access_error = "Billing extension not configured"
-        detail = self.query_one("#usage-detail", Static)
+        detail = self._detail
         detail.update(
             "[yellow]Billing extension not configured.[/]\n\n"
             "Add to ~/.lazydatabricks/config.toml:\n\n"
@@ -148,7 +171,7 @@ class BillingScreen(BaseScreen):
         """Show access error message."""
         self._access_ok = False
         self._access_error = error
-        detail = self.query_one("#usage-detail", Static)
+        detail = self._detail
         detail.update(
             f"[red]Cannot access billing data.[/]\n\n"
             f"Error: {error}\n\n"
@@ -162,34 +185,67 @@ class BillingScreen(BaseScreen):
         """Refresh billing data."""
         if self._access_ok is False:
             return
+        self._dashboard_loading = True
         self._load_sku_costs()
 
     @work(thread=True, exclusive=True)
     def _load_sku_costs(self) -> None:
         """Load SKU costs in background."""
+        worker = get_current_worker()
+        has_breakdowns = False
         try:
             billing_ops = self.lazydatabricks_app.get_extension_ops("billing")
             if not billing_ops:
                 return
 
-            costs = billing_ops.list_sku_costs(self._time_window)
-            self.app.call_from_thread(self._update_sku_table, costs)
+            # One scan for SKUs and every breakdown; drill-downs then hit
+            # the seeded cache instead of issuing a query each. Rows are
+            # rendered per result chunk so the first ones show up early.
+            shown = 0
+            for dashboard in billing_ops.iter_dashboard(self._time_window):
+                # A window change or refresh superseded this load; its rows
+                # must not land in the new window's table
+                if worker.is_cancelled:
+                    return
+                new_rows = dashboard.sku_costs[shown:]
+                if shown == 0:
+                    self.app.call_from_thread(self._update_sku_table, new_rows)
+                elif new_rows:
+                    self.app.call_from_thread(self._append_sku_rows, new_rows)
+                shown += len(new_rows)
+                has_breakdowns = bool(dashboard.breakdowns)
+            if shown == 0 and not worker.is_cancelled:
+                self.app.call_from_thread(self._update_sku_table, [])
         except Exception as e:
             self.app.call_from_thread(self.notify_error, f"Failed to load billing: {e}")
+            has_breakdowns = False
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self._dashboard_loaded, has_breakdowns)
+
+    def _dashboard_loaded(self, has_breakdowns: bool) -> None:
+        """Release drill-downs held back while the dashboard streamed in."""
+        self._dashboard_loading = False
+        if self._selected_sku:
+            self._load_breakdown(self._selected_sku.sku_name, self._selected_sku.usage_type)
+        # The dashboard scan already cached every breakdown; only the
+        # pre-aggregated view path still loads them per SKU
+        if not has_breakdowns:
+            # Users usually walk down the most expensive SKUs next
+            self._prefetch_breakdowns(self._sku_costs[1:1 + self.PREFETCH_SKUS])
 
     def _update_sku_table(self, costs: list[SkuCostSummary]) -> None:
-        """Update the SKU costs table."""
-        self._sku_costs = costs
-        table = self.query_one("#sku-table", DataTable)
+        """Replace the SKU costs table contents."""
+        self._sku_costs = []
+        table = self._sku_table
         table.clear()
 
         # Update subtitle with time window
-        subtitle = self.query_one("#sku-subtitle", Static)
+        subtitle = self._sku_subtitle
         subtitle.update(f"[dim]{self._time_window.display} • Data delayed ~24h[/]")
 
         if not costs:
             # Show empty state in detail panel
-            detail = self.query_one("#usage-detail", Static)
+            detail = self._detail
             detail.update(
                 "[dim]No billing data found for this time window.[/]\n\n"
                 "This could mean:\n"
@@ -199,24 +255,44 @@ class BillingScreen(BaseScreen):
             )
             return
 
-        for i, sku in enumerate(costs):
-            table.add_row(
-                sku.sku_name[:30],
-                sku.usage_type[:15],
-                sku.dbu_display,
-                f"[green]{sku.cost_display}[/]",
-                key=f"{i}",
-            )
-
-        if costs:
+        self._append_sku_rows(costs)
+
+    def _append_sku_rows(self, costs: list[SkuCostSummary]) -> None:
+        """Append SKU rows; the first rows added also select the top SKU."""
+        start = len(self._sku_costs)
+        self._sku_costs.extend(costs)
+        table = self._sku_table
+
+        # One layout/repaint for the whole batch instead of one per row
+        with self.app.batch_update():
+            for i, sku in enumerate(costs, start):
+                table.add_row(
+                    sku.sku_name[:30],
+                    sku.usage_type[:15],
+                    sku.dbu_display,
+                    f"[green]{sku.cost_display}[/]",
+                    key=f"{i}",
+                )
+
+        if start == 0 and costs:
             table.move_cursor(row=0)
             self._select_sku(costs[0])
 
     def _select_sku(self, sku: SkuCostSummary) -> None:
         """Select a SKU and load its breakdown."""
         self._selected_sku = sku
+        # _dashboard_loaded loads it from the seeded cache instead
+        if self._dashboard_loading:
+            return
         self._load_breakdown(sku.sku_name, sku.usage_type)
 
+    @work(thread=True)
+    def _prefetch_breakdowns(self, skus: list[SkuCostSummary]) -> None:
+        """Warm the breakdown cache for the given SKUs in background."""
+        billing_ops = self.lazydatabricks_app.get_extension_ops("billing")
+        if billing_ops and skus:
+            billing_ops.prefetch_breakdowns(skus, self._time_window)
+
     @work(thread=True)
     def _load_breakdown(self, sku_name: str, usage_type: str) -> None:
         """Load usage breakdown for selected SKU."""
@@ -235,24 +311,25 @@ class BillingScreen(BaseScreen):
     def _update_breakdown_table(self, breakdowns: list[UsageBreakdown]) -> None:
         """Update the breakdown table."""
         self._breakdowns = breakdowns
-        table = self.query_one("#breakdown-table", DataTable)
-        table.clear()
-
-        for i, item in enumerate(breakdowns):
-            table.add_row(
-                item.resource_display,
-                item.workspace_id[:12] if item.workspace_id else "—",
-                item.dbu_display,
-                f"[green]{item.cost_display}[/]",
-                key=f"{i}",
-            )
+        table = self._breakdown_table
+
+        with self.app.batch_update():
+            table.clear()
+            for i, item in enumerate(breakdowns):
+                table.add_row(
+                    item.resource_display,
+                    item.workspace_id[:12] if item.workspace_id else "—",
+                    item.dbu_display,
+                    f"[green]{item.cost_display}[/]",
+                    key=f"{i}",
+                )
 
         if breakdowns:
             table.move_cursor(row=0)
             self._select_breakdown(breakdowns[0])
         else:
             # Clear detail panel
-            detail = self.query_one("#usage-detail", Static)
+            detail = self._detail
             detail.update("[dim]No breakdown data for this SKU.[/]")
 
     def _select_breakdown(self, breakdown: UsageBreakdown) -> None:
@@ -262,7 +339,7 @@ class BillingScreen(BaseScreen):
 
     def _update_detail(self, breakdown: UsageBreakdown) -> None:
         """Update the detail panel."""
-        detail = self.query_one("#usage-detail", Static)
+        detail = self._detail
 
         lines = [
             "[bold #e94560]Usage Detail[/]",
@@ -303,22 +380,23 @@ class BillingScreen(BaseScreen):
 
     def _update_pane_styles(self) -> None:
         """Update visual style of panes based on focus."""
-        panes = ["#pane-sku", "#pane-breakdown", "#pane-detail"]
-        titles = ["#sku-title", "#breakdown-title", "#detail-title"]
-        title_text = ["SKU Costs", "Breakdown", "Detail"]
-
-        for i, (pane_id, title_id, text) in enumerate(zip(panes, titles, title_text)):
-            pane = self.query_one(pane_id, Vertical)
-            title = self.query_one(title_id, Static)
-
-            if i == self._current_pane:
-                pane.remove_class("pane-inactive")
-                pane.add_class("pane-active")
-                title.update(f"[bold #e94560]{text}[/]")
-            else:
-                pane.remove_class("pane-active")
-                pane.add_class("pane-inactive")
-                title.update(f"[dim]{text}[/]")
+        title_text = ("SKU Costs", "Breakdown", "Detail")
+        previous, current = self._styled_pane, self._current_pane
+        if previous == current:
+            return
+
+        # Only the panes losing and gaining focus change
+        for i in (previous, current):
+            active = i == current
+            pane = self._panes[i]
+            # Restyle once per pane rather than once per class change
+            pane.set_class(active, "pane-active", update=False)
+            pane.set_class(not active, "pane-inactive")
+            text = title_text[i]
+            self._titles[i].update(
+                f"[bold #e94560]{text}[/]" if active else f"[dim]{text}[/]"
+            )
+        self._styled_pane = current
 
     def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
         """Handle row highlight."""
@@ -344,7 +422,10 @@ class BillingScreen(BaseScreen):
     # ─── Actions ────────────────────────────────────────────────
 
     def action_refresh(self) -> None:
-        """Refresh data."""
+        """Refresh data, bypassing cached query results."""
+        billing_ops = self.lazydatabricks_app.get_extension_ops("billing")
+        if billing_ops:
+            billing_ops.invalidate(scope="all")
         self.notify_success("Refreshing billing data...")
         self._refresh_data()
 
@@ -365,9 +446,9 @@ class BillingScreen(BaseScreen):
     def _focus_current_pane(self) -> None:
         """Focus the current pane's table."""
         if self._current_pane == 0:
-            self.query_one("#sku-table", DataTable).focus()
+            self._sku_table.focus()
         elif self._current_pane == 1:
-            self.query_one("#breakdown-table", DataTable).focus()
+            self._breakdown_table.focus()
         # Pane 2 is detail, no focusable element
 
     def action_drill_down(self) -> None:
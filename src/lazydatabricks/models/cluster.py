@@ -6,10 +6,15 @@ that the TUI can render without caring about API version changes.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import time
+from dataclasses import InitVar, dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
+
+# Bound once; _epoch_ms_to_dt runs several times per cluster
+_fromtimestamp = datetime.fromtimestamp
+_UTC = timezone.utc
 
 
 class ClusterState(str, Enum):
@@ -25,25 +30,32 @@ class ClusterState(str, Enum):
 
     @property
     def is_active(self) -> bool:
-        return self in (ClusterState.RUNNING, ClusterState.RESIZING, ClusterState.RESTARTING)
+        return self in _ACTIVE_STATES
 
     @property
     def is_actionable(self) -> bool:
         """Can we start or stop this cluster?"""
-        return self in (ClusterState.RUNNING, ClusterState.TERMINATED, ClusterState.ERROR)
+        return self in _ACTIONABLE_STATES
 
     @property
     def display_style(self) -> str:
         """Return a style hint for TUI rendering."""
-        return {
-            ClusterState.RUNNING: "green",
-            ClusterState.TERMINATED: "dim",
-            ClusterState.ERROR: "red bold",
-            ClusterState.PENDING: "yellow",
-            ClusterState.RESTARTING: "yellow",
-            ClusterState.RESIZING: "yellow",
-            ClusterState.TERMINATING: "yellow dim",
-        }.get(self, "white")
+        return _STATE_STYLE.get(self, "white")
+
+
+# State lookups built once at import rather than per property access
+_ACTIVE_STATES = frozenset({ClusterState.RUNNING, ClusterState.RESIZING, ClusterState.RESTARTING})
+_ACTIONABLE_STATES = frozenset({ClusterState.RUNNING, ClusterState.TERMINATED, ClusterState.ERROR})
+_STATE_LOOKUP: dict[str, ClusterState] = {s.value: s for s in ClusterState}
+_STATE_STYLE: dict[ClusterState, str] = {
+    ClusterState.RUNNING: "green",
+    ClusterState.TERMINATED: "dim",
+    ClusterState.ERROR: "red bold",
+    ClusterState.PENDING: "yellow",
+    ClusterState.RESTARTING: "yellow",
+    ClusterState.RESIZING: "yellow",
+    ClusterState.TERMINATING: "yellow dim",
+}
 
 
 class ClusterFlag(str, Enum):
@@ -56,7 +68,7 @@ class ClusterFlag(str, Enum):
     AUTO_TERMINATION_OFF = "no_auto_term"
 
 
-@dataclass
+@dataclass(slots=True)
 class ClusterSummary:
     """Normalized cluster summary for TUI display."""
     id: str
@@ -82,22 +94,38 @@ class ClusterSummary:
     creator: str = ""
     cluster_source: str = ""  # UI, API, JOB
 
-    # Computed
-    flags: list[ClusterFlag] = field(default_factory=list)
-
     # Links
     ui_url: Optional[str] = None
 
+    # Risk flags; computed lazily on first access of .flags unless passed in.
+    # The flags property is attached after the class body, since a property
+    # defined here would become the InitVar's default.
+    if TYPE_CHECKING:
+        @property
+        def flags(self) -> list[ClusterFlag]: ...
+    else:
+        flags: InitVar[Optional[list[ClusterFlag]]] = None
+
+    # Epoch seconds mirrored from the datetimes above for per-row display math
+    _started_at_s: int | None = field(default=None, init=False, repr=False, compare=False)
+    _last_activity_at_s: int | None = field(default=None, init=False, repr=False, compare=False)
+    _flags: list[ClusterFlag] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self, flags: list[ClusterFlag] | None = None) -> None:
+        self._flags = flags
+        if self.started_at:
+            self._started_at_s = int(self.started_at.timestamp())
+        if self.last_activity_at:
+            self._last_activity_at_s = int(self.last_activity_at.timestamp())
+
     @property
     def runtime_display(self) -> str:
         """Human-friendly runtime like '2h 14m' or 'terminated'."""
         if self.state == ClusterState.TERMINATED:
             return "terminated"
-        if not self.started_at:
+        if self._started_at_s is None:
             return "—"
-        delta = datetime.now(timezone.utc) - self.started_at
-        hours, remainder = divmod(int(delta.total_seconds()), 3600)
-        minutes = remainder // 60
+        hours, minutes = divmod((int(time.time()) - self._started_at_s) // 60, 60)
         if hours > 0:
             return f"{hours}h {minutes}m"
         return f"{minutes}m"
@@ -105,18 +133,17 @@ class ClusterSummary:
     @property
     def idle_time_display(self) -> str:
         """How long since last activity."""
-        if not self.last_activity_at:
+        if self._last_activity_at_s is None:
             return "—"
         if self.state != ClusterState.RUNNING:
             return "—"
-        delta = datetime.now(timezone.utc) - self.last_activity_at
-        minutes = int(delta.total_seconds()) // 60
+        minutes = (int(time.time()) - self._last_activity_at_s) // 60
         if minutes < 1:
             return "just now"
         if minutes < 60:
             return f"{minutes}m idle"
-        hours = minutes // 60
-        return f"{hours}h {minutes % 60}m idle"
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}h {minutes}m idle"
 
     @property
     def workers_display(self) -> str:
@@ -125,79 +152,136 @@ class ClusterSummary:
             return f"{self.autoscale_min}–{self.autoscale_max}"
         return str(self.num_workers)
 
-    def compute_flags(self, idle_burn_minutes: int = 30, long_running_hours: int = 12) -> None:
-        """Compute risk flags based on current state and thresholds."""
-        self.flags.clear()
+    def compute_flags(
+        self,
+        idle_burn_minutes: int = 30,
+        long_running_hours: int = 12,
+        *,
+        now: datetime | None = None,
+    ) -> list[ClusterFlag]:
+        """Compute risk flags based on current state and thresholds.
+
+        Args:
+            now: Reference time; batch callers pass one value for all clusters.
+
+        Returns:
+            The computed flags, also stored for .flags.
+        """
+        flags: list[ClusterFlag] = []
+        self._flags = flags
 
         if self.state == ClusterState.RUNNING:
+            now = now or datetime.now(timezone.utc)
+
             # Idle burn detection
             if self.last_activity_at:
-                idle_seconds = (datetime.now(timezone.utc) - self.last_activity_at).total_seconds()
+                idle_seconds = (now - self.last_activity_at).total_seconds()
                 if idle_seconds > idle_burn_minutes * 60:
-                    self.flags.append(ClusterFlag.IDLE_BURN)
+                    flags.append(ClusterFlag.IDLE_BURN)
 
             # Long running
             if self.started_at:
-                running_hours = (datetime.now(timezone.utc) - self.started_at).total_seconds() / 3600
+                running_hours = (now - self.started_at).total_seconds() / 3600
                 if running_hours > long_running_hours:
-                    self.flags.append(ClusterFlag.LONG_RUNNING)
+                    flags.append(ClusterFlag.LONG_RUNNING)
 
             # No auto-termination
             if self.auto_termination_minutes is None or self.auto_termination_minutes == 0:
-                self.flags.append(ClusterFlag.AUTO_TERMINATION_OFF)
+                flags.append(ClusterFlag.AUTO_TERMINATION_OFF)
+
+        return flags
 
     @classmethod
-    def from_api(cls, data: dict, workspace_host: str = "") -> ClusterSummary:
+    def from_api(
+        cls,
+        data: dict,
+        workspace_host: str = "",
+    ) -> ClusterSummary:
         """Create from Databricks SDK cluster info dict.
 
         Accepts the dict form of databricks.sdk.service.compute.ClusterDetails.
         """
-        # Parse state
-        state_str = data.get("state", "UNKNOWN")
-        try:
-            state = ClusterState(state_str)
-        except ValueError:
-            state = ClusterState.UNKNOWN
+        g = data.get  # bound once; called per field below
+        state = _parse_state(g("state", "UNKNOWN"))
 
         # Parse timestamps (Databricks returns epoch millis)
-        started_at = _epoch_ms_to_dt(data.get("start_time"))
-        terminated_at = _epoch_ms_to_dt(data.get("terminated_time"))
-        last_activity_at = _epoch_ms_to_dt(data.get("last_activity_time"))
+        started_at = _epoch_ms_to_dt(g("start_time"))
+        terminated_at = _epoch_ms_to_dt(g("terminated_time"))
+        last_activity_at = _epoch_ms_to_dt(g("last_activity_time"))
 
         # Parse autoscale
-        autoscale = data.get("autoscale")
+        autoscale = g("autoscale")
         autoscale_min = autoscale.get("min_workers") if autoscale else None
         autoscale_max = autoscale.get("max_workers") if autoscale else None
-        num_workers = data.get("num_workers", 0) if not autoscale else 0
+        num_workers = g("num_workers", 0) if not autoscale else 0
 
-        cluster_id = data.get("cluster_id", "")
+        cluster_id = g("cluster_id", "")
         ui_url = f"{workspace_host}/#setting/clusters/{cluster_id}/configuration" if workspace_host else None
 
-        summary = cls(
+        return cls(
             id=cluster_id,
-            name=data.get("cluster_name", "unnamed"),
+            name=g("cluster_name", "unnamed"),
             state=state,
-            state_message=data.get("state_message", ""),
-            node_type_id=data.get("node_type_id", ""),
-            driver_node_type_id=data.get("driver_node_type_id", ""),
+            state_message=g("state_message", ""),
+            node_type_id=g("node_type_id", ""),
+            driver_node_type_id=g("driver_node_type_id", ""),
             num_workers=num_workers,
             autoscale_min=autoscale_min,
             autoscale_max=autoscale_max,
             started_at=started_at,
             terminated_at=terminated_at,
             last_activity_at=last_activity_at,
-            auto_termination_minutes=data.get("autotermination_minutes"),
-            spark_version=data.get("spark_version", ""),
-            creator=data.get("creator_user_name", ""),
-            cluster_source=data.get("cluster_source", ""),
+            auto_termination_minutes=g("autotermination_minutes"),
+            spark_version=g("spark_version", ""),
+            creator=g("creator_user_name", ""),
+            cluster_source=g("cluster_source", ""),
             ui_url=ui_url,
         )
 
-        summary.compute_flags()
-        return summary
+    @classmethod
+    def from_sdk(
+        cls,
+        obj: Any,
+        workspace_host: str = "",
+    ) -> ClusterSummary:
+        """Create from a databricks.sdk.service.compute.ClusterDetails object.
+
+        Reads the attributes directly, skipping the as_dict() round-trip
+        that from_api needs.
+        """
+        state = _parse_state(obj.state.value if obj.state else "UNKNOWN")
 
+        autoscale = obj.autoscale
+        autoscale_min = autoscale.min_workers if autoscale else None
+        autoscale_max = autoscale.max_workers if autoscale else None
+        num_workers = (obj.num_workers or 0) if not autoscale else 0
 
-@dataclass
+        cluster_id = obj.cluster_id or ""
+        ui_url = f"{workspace_host}/#setting/clusters/{cluster_id}/configuration" if workspace_host else None
+
+        return cls(
+            id=cluster_id,
+            name=obj.cluster_name or "unnamed",
+            state=state,
+            state_message=obj.state_message or "",
+            node_type_id=obj.node_type_id or "",
+            driver_node_type_id=obj.driver_node_type_id or "",
+            num_workers=num_workers,
+            autoscale_min=autoscale_min,
+            autoscale_max=autoscale_max,
+            started_at=_epoch_ms_to_dt(obj.start_time),
+            terminated_at=_epoch_ms_to_dt(obj.terminated_time),
+            # Not modelled by every SDK version
+            last_activity_at=_epoch_ms_to_dt(getattr(obj, "last_activity_time", None)),
+            auto_termination_minutes=obj.autotermination_minutes,
+            spark_version=obj.spark_version or "",
+            creator=obj.creator_user_name or "",
+            cluster_source=obj.cluster_source.value if obj.cluster_source else "",
+            ui_url=ui_url,
+        )
+
+
+@dataclass(slots=True)
 class ClusterEvent:
     """A single cluster event (from events API)."""
     timestamp: datetime
@@ -205,8 +289,23 @@ class ClusterEvent:
     details: str = ""
 
 
+def _parse_state(value: str) -> ClusterState:
+    """Map an API state string to ClusterState, defaulting to UNKNOWN."""
+    return _STATE_LOOKUP.get(value, ClusterState.UNKNOWN)
+
+
 def _epoch_ms_to_dt(epoch_ms: Optional[int]) -> Optional[datetime]:
     """Convert epoch milliseconds to timezone-aware datetime."""
-    if epoch_ms is None or epoch_ms == 0:
+    if not epoch_ms:
         return None
-    return datetime.fromtimestamp(epoch_ms / 1000.0, tz=timezone.utc)
+    return _fromtimestamp(epoch_ms * 0.001, tz=_UTC)
+
+
+def _cluster_flags(self: ClusterSummary) -> list[ClusterFlag]:
+    """Risk flags, computed with default thresholds on first access."""
+    if self._flags is None:
+        return self.compute_flags()
+    return self._flags
+
+
+ClusterSummary.flags = property(_cluster_flags)  # type: ignore[method-assign,assignment]
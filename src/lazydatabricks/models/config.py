@@ -8,9 +8,9 @@ Handles:
 
 from __future__ import annotations
 
-import configparser
+import functools
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from pathlib import Path
 from typing import Optional
@@ -27,7 +27,7 @@ class AuthMethod(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DatabricksProfile:
     """A single Databricks CLI profile from ~/.databrickscfg."""
     name: str
@@ -37,23 +37,25 @@ class DatabricksProfile:
     cluster_id: Optional[str] = None
     auth_type: Optional[str] = None
 
+    _host_short: str = field(init=False, repr=False, compare=False)
+    _auth_method: AuthMethod = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen, so the one-time caches go through object.__setattr__
+        object.__setattr__(self, "_host_short", _strip_scheme(self.host))
+        object.__setattr__(self, "_auth_method", _resolve_auth_method(self.token, self.auth_type))
+
     @property
     def auth_method(self) -> AuthMethod:
-        if self.token:
-            return AuthMethod.PAT
-        if self.auth_type == "azure-cli":
-            return AuthMethod.AZURE_CLI
-        if self.auth_type == "oauth-m2m":
-            return AuthMethod.OAUTH_M2M
-        return AuthMethod.UNKNOWN
+        return self._auth_method
 
     @property
     def host_short(self) -> str:
         """Workspace hostname without protocol."""
-        return self.host.replace("https://", "").replace("http://", "").rstrip("/")
+        return self._host_short
 
 
-@dataclass
+@dataclass(slots=True)
 class LazyDatabricksConfig:
     """Runtime configuration for LazyDatabricks.
 
@@ -70,7 +72,12 @@ class LazyDatabricksConfig:
     read_only: bool = True  # Safe default
 
     # Available profiles (populated on load)
-    available_profiles: list[DatabricksProfile] = field(default_factory=list)
+    available_profiles: tuple[DatabricksProfile, ...] = field(default_factory=tuple)
+
+    _host_short: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._host_short = _strip_scheme(self.host)
 
     @classmethod
     def load(
@@ -83,8 +90,38 @@ class LazyDatabricksConfig:
         """Load configuration with fallback chain.
 
         Priority: overrides > env vars > profile > DEFAULT profile.
+        Results are memoized per argument set and ~/.databrickscfg stamp,
+        so edits to the file are picked up on the next call; env changes
+        need invalidate_cache() or reload_env(). Each call returns a
+        shallow copy, so callers may mutate it (e.g. read_only) freely.
+        The profiles tuple is shared.
+        """
+        return replace(
+            cls._load_cached(
+                profile, host_override, token_override, cluster_id_override, _cfg_stamp()
+            )
+        )
+
+    @classmethod
+    @functools.lru_cache(maxsize=16)
+    def _load_cached(
+        cls,
+        profile: str | None,
+        host_override: str | None,
+        token_override: str | None,
+        cluster_id_override: str | None,
+        cfg_stamp: tuple[str, int, int] | None,
+    ) -> LazyDatabricksConfig:
+        """Resolve a config; backs load() and is cleared by invalidate_cache().
+
+        cfg_stamp only keys the memo, so a changed ~/.databrickscfg misses it.
         """
-        load_dotenv()
+        _ensure_dotenv_loaded()
+
+        # Env vars read in one block, ahead of the fallback chain
+        host_env = _env("DATABRICKS_HOST")
+        token_env = _env("DATABRICKS_TOKEN")
+        cluster_id_env = _env("DATABRICKS_CLUSTER_ID")
 
         # Parse all available profiles
         profiles = _parse_databricks_cfg()
@@ -108,17 +145,17 @@ class LazyDatabricksConfig:
         # Resolve values with fallback chain
         host = (
             host_override
-            or os.getenv("DATABRICKS_HOST")
+            or host_env
             or (target_profile.host if target_profile else None)
         )
         token = (
             token_override
-            or os.getenv("DATABRICKS_TOKEN")
+            or token_env
             or (target_profile.token if target_profile else None)
         )
         cluster_id = (
             cluster_id_override
-            or os.getenv("DATABRICKS_CLUSTER_ID")
+            or cluster_id_env
             or (target_profile.cluster_id if target_profile else None)
         )
 
@@ -142,44 +179,163 @@ class LazyDatabricksConfig:
             host=host.rstrip("/"),
             token=token,
             cluster_id=cluster_id,
-            profile_name=profile or target_profile.name if target_profile else None,
+            profile_name=profile if profile else (target_profile.name if target_profile else None),
             auth_method=auth_method,
             available_profiles=profiles,
         )
 
     @property
     def host_short(self) -> str:
-        return self.host.replace("https://", "").replace("http://", "").rstrip("/")
+        """Workspace hostname without protocol, computed once at init."""
+        return self._host_short
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Forget memoized loads and the parsed ~/.databrickscfg."""
+        cls._load_cached.cache_clear()
+        _env.cache_clear()
+        _clear_cfg_cache()
 
-    def switch_profile(self, profile_name: str) -> LazyDatabricksConfig:
-        """Return a new config targeting a different profile."""
+    def switch_profile(self, profile_name: str, *, force: bool = False) -> LazyDatabricksConfig:
+        """Return a new config targeting a different profile.
+
+        Args:
+            force: Re-read env and ~/.databrickscfg instead of reusing a
+                memoized load.
+        """
+        if force:
+            LazyDatabricksConfig.invalidate_cache()
         return LazyDatabricksConfig.load(profile=profile_name)
 
 
-def _parse_databricks_cfg() -> list[DatabricksProfile]:
-    """Parse ~/.databrickscfg into a list of profiles."""
+def _resolve_auth_method(token: str | None, auth_type: str | None) -> AuthMethod:
+    """Map a profile's token / auth_type to an AuthMethod."""
+    if token:
+        return AuthMethod.PAT
+    if auth_type == "azure-cli":
+        return AuthMethod.AZURE_CLI
+    if auth_type == "oauth-m2m":
+        return AuthMethod.OAUTH_M2M
+    return AuthMethod.UNKNOWN
+
+
+def _strip_scheme(host: str) -> str:
+    """Hostname without protocol or trailing slash."""
+    return host.replace("https://", "").replace("http://", "").rstrip("/")
+
+
+def reload_env() -> None:
+    """Re-read DATABRICKS_* env vars on the next load().
+
+    Call after os.environ changes, e.g. a fresh load_dotenv().
+    """
+    _env.cache_clear()
+    LazyDatabricksConfig._load_cached.cache_clear()
+
+
+@functools.cache
+def _ensure_dotenv_loaded() -> None:
+    """Load .env into os.environ once per process.
+
+    Only ./.env or the file named by DOTENV_PATH is read; when neither
+    exists the upward directory search is skipped entirely.
+    """
+    dotenv_path = os.environ.get("DOTENV_PATH")
+    if dotenv_path:
+        load_dotenv(dotenv_path)
+        return
+    local = Path.cwd() / ".env"
+    if local.is_file():
+        load_dotenv(local)
+
+
+@functools.cache
+def _env(name: str) -> str | None:
+    """Cached os.environ lookup; cleared by reload_env()."""
+    return os.environ.get(name)
+
+
+# Keys read from ~/.databrickscfg; anything else is skipped
+_CFG_KEYS = frozenset({"host", "token", "account_id", "cluster_id", "auth_type"})
+
+# Last parse of ~/.databrickscfg, keyed on (path, st_mtime_ns, st_size)
+_CFG_CACHE: tuple[tuple[str, int, int], tuple[DatabricksProfile, ...]] | None = None
+
+
+def _cfg_stamp() -> tuple[str, int, int] | None:
+    """(path, st_mtime_ns, st_size) of ~/.databrickscfg, or None if missing."""
     cfg_path = Path.home() / ".databrickscfg"
-    if not cfg_path.exists():
-        return []
+    try:
+        st = cfg_path.stat()
+    except OSError:
+        return None
+    return (str(cfg_path), st.st_mtime_ns, st.st_size)
 
-    parser = configparser.ConfigParser()
-    parser.read(str(cfg_path))
 
+def _parse_databricks_cfg() -> tuple[DatabricksProfile, ...]:
+    """Parse ~/.databrickscfg into a tuple of profiles.
+
+    Served from memory while the file's mtime and size are unchanged; the
+    same immutable tuple is shared by every caller.
+    """
+    global _CFG_CACHE
+    stamp = _cfg_stamp()
+    if stamp is None:
+        return ()
+    if _CFG_CACHE is not None and _CFG_CACHE[0] == stamp:
+        return _CFG_CACHE[1]
+
+    try:
+        lines = Path(stamp[0]).read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return ()
+
+    # Single pass over the INI text; [DEFAULT] values are inherited by every
+    # other section, as configparser does
+    sections: dict[str, dict[str, str]] = {}
+    current: dict[str, str] | None = None
+    for raw in lines:
+        line = raw.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line[0] == "[" and line[-1] == "]":
+            current = sections.setdefault(line[1:-1], {})
+            continue
+        if current is None:
+            continue
+        key, sep, value = line.partition("=")
+        if not sep:
+            continue
+        key = key.strip().lower()
+        if key in _CFG_KEYS:
+            current[key] = value.strip()
+
+    defaults = sections.pop("DEFAULT", {})
     profiles = []
-    for section in parser.sections():
-        host = parser.get(section, "host", fallback="")
+    for section, fields in sections.items():
+        # Reject host-less sections before merging in [DEFAULT]
+        host = fields["host"] if "host" in fields else defaults.get("host", "")
         if not host:
             continue
+        if defaults:
+            fields = {**defaults, **fields}
 
         profiles.append(
             DatabricksProfile(
                 name=section,
                 host=host,
-                token=parser.get(section, "token", fallback=None),
-                account_id=parser.get(section, "account_id", fallback=None),
-                cluster_id=parser.get(section, "cluster_id", fallback=None),
-                auth_type=parser.get(section, "auth_type", fallback=None),
+                token=fields.get("token"),
+                account_id=fields.get("account_id"),
+                cluster_id=fields.get("cluster_id"),
+                auth_type=fields.get("auth_type"),
             )
         )
 
-    return profiles
+    _CFG_CACHE = (stamp, tuple(profiles))
+    return _CFG_CACHE[1]
+
+
+def _clear_cfg_cache() -> None:
+    """Drop the cached ~/.databrickscfg parse."""
+    global _CFG_CACHE
+    _CFG_CACHE = None
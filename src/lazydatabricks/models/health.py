@@ -22,24 +22,29 @@ class SparkStatus(str, Enum):
 
     @property
     def display_style(self) -> str:
-        return {
-            SparkStatus.CONNECTED: "green bold",
-            SparkStatus.DISCONNECTED: "red",
-            SparkStatus.STALE: "yellow",
-            SparkStatus.NO_CLUSTER: "dim",
-        }.get(self, "white")
+        return _SPARK_STYLE.get(self, "white")
 
     @property
     def icon(self) -> str:
-        return {
-            SparkStatus.CONNECTED: "✓",
-            SparkStatus.DISCONNECTED: "✗",
-            SparkStatus.STALE: "⚠",
-            SparkStatus.NO_CLUSTER: "—",
-        }.get(self, "?")
+        return _SPARK_ICON.get(self, "?")
 
 
-@dataclass
+_SPARK_STYLE: dict[SparkStatus, str] = {
+    SparkStatus.CONNECTED: "green bold",
+    SparkStatus.DISCONNECTED: "red",
+    SparkStatus.STALE: "yellow",
+    SparkStatus.NO_CLUSTER: "dim",
+}
+
+_SPARK_ICON: dict[SparkStatus, str] = {
+    SparkStatus.CONNECTED: "✓",
+    SparkStatus.DISCONNECTED: "✗",
+    SparkStatus.STALE: "⚠",
+    SparkStatus.NO_CLUSTER: "—",
+}
+
+
+@dataclass(slots=True)
 class HealthSnapshot:
     """Home screen health summary — the first thing you see."""
 
@@ -114,15 +119,13 @@ class HealthSnapshot:
         """Most recent failure summary."""
         if not self.last_failure_at:
             return "No recent failures"
-        age = datetime.now(timezone.utc) - self.last_failure_at
-        hours = int(age.total_seconds()) // 3600
-        if hours < 1:
-            minutes = int(age.total_seconds()) // 60
-            ago = f"{minutes}m ago"
-        elif hours < 24:
-            ago = f"{hours}h ago"
+        secs = int((datetime.now(timezone.utc) - self.last_failure_at).total_seconds())
+        if secs < 3600:
+            ago = f"{secs // 60}m ago"
+        elif secs < 86400:
+            ago = f"{secs // 3600}h ago"
         else:
-            ago = f"{hours // 24}d ago"
+            ago = f"{secs // 86400}d ago"
 
         name = self.last_failure_job_name or f"run-{self.last_failure_run_id}"
         snippet = self.last_failure_snippet[:100] if self.last_failure_snippet else ""
@@ -10,11 +10,16 @@ This is the entry point for the Textual TUI. It owns:
 
 from __future__ import annotations
 
+import importlib
+import time
+from collections.abc import Callable
+from functools import cache, cached_property, partial
 from typing import Any
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container
+from textual.screen import ModalScreen, Screen
 
 from lazydatabricks.api.client import DatabricksClient
 from lazydatabricks.api.clusters import ClusterOps
@@ -27,13 +32,50 @@ from lazydatabricks.api.warehouses import WarehouseOps
 from lazydatabricks.extensions import load_extensions, load_lazydatabricks_config
 from lazydatabricks.extensions.base import BaseExtension
 from lazydatabricks.tui.theme_config import get_css, get_theme
+from lazydatabricks.tui.widgets.footer_bar import HintItem
 from lazydatabricks.tui.widgets.header import Header
+from lazydatabricks.tui.widgets.help_overlay import HelpOverlay
+
+# Theme and generated CSS are fixed for the process; build them once
+_get_theme = cache(get_theme)
+_get_css = cache(get_css)
+
+
+# Core screens as (install name, module, class). Each module is imported
+# the first time its screen is shown.
+_SCREEN_SPECS = (
+    ("home", "lazydatabricks.tui.screens.home", "HomeScreen"),
+    ("clusters", "lazydatabricks.tui.screens.clusters", "ClustersScreen"),
+    ("jobs", "lazydatabricks.tui.screens.jobs", "JobsScreen"),
+    ("pipelines", "lazydatabricks.tui.screens.pipelines", "PipelinesScreen"),
+    ("warehouses", "lazydatabricks.tui.screens.warehouses", "WarehousesScreen"),
+    ("config", "lazydatabricks.tui.screens.config", "ConfigScreen"),
+)
+
+# Prefix length for dynamic extension navigation actions
+_GO_LEN = len("go_")
+
+
+def _screen_factory(module: str, class_name: str) -> Callable[[], Screen]:
+    """Build a factory that imports and instantiates a screen on demand."""
+    def factory() -> Screen:
+        screen: Screen = getattr(importlib.import_module(module), class_name)()
+        return screen
+    return factory
+
+
+def _extension_screen_factory(ext: BaseExtension) -> Callable[[], Screen]:
+    """Build a factory that instantiates an extension's screen on demand."""
+    def factory() -> Screen:
+        screen: Screen = ext.get_screen_class()()
+        return screen
+    return factory
 
 
 class LazyDatabricksApp(App):
     """LazyDatabricks TUI application."""
 
-    CSS = ""  # Set dynamically in __init__
+    CSS = _get_css()
 
     BINDINGS = [
         Binding("h", "go_home", "Home", show=False),
@@ -49,39 +91,52 @@ class LazyDatabricksApp(App):
         Binding("escape", "back", "Back", show=False),
     ]
 
-    SCREENS = {}  # Will be populated dynamically
+    # Minimum seconds between repeated logs-hint notifications
+    LOGS_NOTIFY_DEBOUNCE_SECONDS = 2.0
+
+    # Textual calls each factory on first switch/push to that screen
+    SCREENS = {name: _screen_factory(module, class_name) for name, module, class_name in _SCREEN_SPECS}
 
     def __init__(self, client: DatabricksClient) -> None:
         # Load theme config
-        self._theme_config = get_theme()
-        LazyDatabricksApp.CSS = get_css()
+        self._theme_config = _get_theme()
+
+        # Load LazyDatabricks config and extensions. Their screens join an
+        # instance copy of SCREENS before App.__init__ installs it, so they
+        # are built on first switch just like the core screens.
+        self._lazydatabricks_config = load_lazydatabricks_config()
+        self._extensions = load_extensions(client, self._lazydatabricks_config)
+        self.SCREENS = {  # type: ignore[misc]  # per-instance copy; App only reads it
+            **self.SCREENS,
+            **{ext.info.name: _extension_screen_factory(ext) for ext in self._extensions},
+        }
+
         super().__init__()
         # Set theme after init
         self.theme = self._theme_config.theme_name
         self._client = client
         self._guard = ArmedGuard(ttl_seconds=30)
 
-        # Operations instances
-        self._cluster_ops = ClusterOps(client)
-        self._job_ops = JobOps(client)
-        self._pipeline_ops = PipelineOps(client)
-        self._warehouse_ops = WarehouseOps(client)
-        self._log_ops = LogOps(client)
-        self._health_builder = HealthBuilder(client)
+        # Operations instances are created on first access (see properties)
 
-        # Load LazyDatabricks config and extensions
-        self._lazydatabricks_config = load_lazydatabricks_config()
-        self._extensions = load_extensions(client, self._lazydatabricks_config)
+        self._extension_names: frozenset[str] = frozenset(ext.info.name for ext in self._extensions)
+        # Footer hints for extensions, shared by every screen's footer
+        self._extension_hints: tuple[HintItem, ...] = tuple(
+            HintItem(ext.info.hotkey, ext.info.display_name) for ext in self._extensions
+        )
+        # Navigation actions for extensions, built once and served by __getattr__
+        self._extension_actions: dict[str, Callable[[], object]] = {
+            f"action_go_{n}": partial(self.switch_screen, n) for n in self._extension_names
+        }
+        # Extension ops instances, created on first get_extension_ops()
         self._extension_ops: dict[str, Any] = {}
 
-        # Create ops instances for each extension
-        for ext in self._extensions:
-            ext_config = self._lazydatabricks_config.get("extensions", {}).get(ext.info.name, {})
-            ops_class = ext.get_ops_class()
-            self._extension_ops[ext.info.name] = ops_class(client, ext_config)
-
         # Widgets (created in compose)
         self._header: Header | None = None
+        # Header fields waiting for _flush_header
+        self._pending_header: dict[str, str] | None = None
+        # Monotonic time of the last "select a run first" hint
+        self._last_logs_notify = 0.0
 
     @property
     def client(self) -> DatabricksClient:
@@ -93,44 +148,61 @@ class LazyDatabricksApp(App):
         """The armed mode guard."""
         return self._guard
 
-    @property
+    @cached_property
     def cluster_ops(self) -> ClusterOps:
         """Cluster operations."""
-        return self._cluster_ops
+        return ClusterOps(self._client)
 
-    @property
+    @cached_property
     def job_ops(self) -> JobOps:
         """Job operations."""
-        return self._job_ops
+        return JobOps(self._client)
 
-    @property
+    @cached_property
     def pipeline_ops(self) -> PipelineOps:
         """Pipeline operations."""
-        return self._pipeline_ops
+        return PipelineOps(self._client)
 
-    @property
+    @cached_property
     def warehouse_ops(self) -> WarehouseOps:
         """Warehouse operations."""
-        return self._warehouse_ops
+        return WarehouseOps(self._client)
 
-    @property
+    @cached_property
     def log_ops(self) -> LogOps:
         """Log operations."""
-        return self._log_ops
+        return LogOps(self._client)
 
-    @property
+    @cached_property
     def health_builder(self) -> HealthBuilder:
         """Health snapshot builder."""
-        return self._health_builder
+        return HealthBuilder(self._client)
 
     @property
     def extensions(self) -> list[BaseExtension]:
         """Loaded extensions."""
         return self._extensions
 
+    @property
+    def extension_hints(self) -> tuple[HintItem, ...]:
+        """Footer hints for loaded extensions."""
+        return self._extension_hints
+
     def get_extension_ops(self, name: str) -> Any | None:
-        """Get ops instance for an extension by name."""
-        return self._extension_ops.get(name)
+        """Get ops instance for an extension by name.
+
+        The instance is created on first request and reused afterwards.
+        """
+        ops = self._extension_ops.get(name)
+        if ops is not None:
+            return ops
+        ext = next((e for e in self._extensions if e.info.name == name), None)
+        if ext is None:
+            return None
+        ext_config = self._lazydatabricks_config.get("extensions", {}).get(name, {})
+        ops = ext.get_ops_class()(self._client, ext_config)
+        # Workers may race here; keep whichever instance landed first
+        return self._extension_ops.setdefault(name, ops)
 
     def compose(self) -> ComposeResult:
         """Compose the app layout."""
@@ -151,26 +223,9 @@ class LazyDatabricksApp(App):
 
     def on_mount(self) -> None:
         """Called when app is mounted."""
-        # Install core screens
-        from lazydatabricks.tui.screens.home import HomeScreen
-        from lazydatabricks.tui.screens.clusters import ClustersScreen
-        from lazydatabricks.tui.screens.jobs import JobsScreen
-        from lazydatabricks.tui.screens.pipelines import PipelinesScreen
-        from lazydatabricks.tui.screens.warehouses import WarehousesScreen
-        from lazydatabricks.tui.screens.config import ConfigScreen
-
-        self.install_screen(HomeScreen(), name="home")
-        self.install_screen(ClustersScreen(), name="clusters")
-        self.install_screen(JobsScreen(), name="jobs")
-        self.install_screen(PipelinesScreen(), name="pipelines")
-        self.install_screen(WarehousesScreen(), name="warehouses")
-        self.install_screen(ConfigScreen(), name="config")
-
-        # Install extension screens and register keybindings
+        # Screens come from SCREENS, so nothing but home is built before
+        # first paint
         for ext in self._extensions:
-            screen_class = ext.get_screen_class()
-            self.install_screen(screen_class(), name=ext.info.name)
-
             # Register extension keybinding
             for binding in ext.get_bindings():
                 self.bind(
@@ -184,12 +239,29 @@ class LazyDatabricksApp(App):
         self.push_screen("home")
 
     def update_header(self, workspace: str = "", profile: str = "") -> None:
-        """Update header workspace/profile display."""
-        if self._header:
-            if workspace:
-                self._header.workspace = workspace
-            if profile:
-                self._header.profile = profile
+        """Update header workspace/profile display.
+
+        Writes made in the same tick are merged and applied once after the
+        next refresh.
+        """
+        if not self._header:
+            return
+        pending = self._pending_header
+        if pending is None:
+            pending = self._pending_header = {}
+            self.call_after_refresh(self._flush_header)
+        if workspace:
+            pending["workspace"] = workspace
+        if profile:
+            pending["profile"] = profile
+
+    def _flush_header(self) -> None:
+        """Apply merged header writes in one batch."""
+        pending, self._pending_header = self._pending_header, None
+        if self._header and pending:
+            with self.batch_update():
+                for name, value in pending.items():
+                    setattr(self._header, name, value)
 
     # ─── Actions ────────────────────────────────────────────────
 
@@ -215,7 +287,12 @@ class LazyDatabricksApp(App):
 
     def action_go_logs(self) -> None:
         """Navigate to logs screen (if context available)."""
-        # Log screen requires a run context - notify if no run selected
+        # Log screen requires a run context - notify if no run selected,
+        # but don't stack toasts when the key is pressed repeatedly
+        now = time.monotonic()
+        if now - self._last_logs_notify < self.LOGS_NOTIFY_DEBOUNCE_SECONDS:
+            return
+        self._last_logs_notify = now
         self.notify(
             "Select a run from Jobs screen first, then press 'l' for logs",
             severity="warning",
@@ -239,7 +316,6 @@ class LazyDatabricksApp(App):
 
     def action_show_help(self) -> None:
         """Show help overlay."""
-        from lazydatabricks.tui.widgets.help_overlay import HelpOverlay
         self.push_screen(HelpOverlay())
 
     def action_back(self) -> None:
@@ -247,8 +323,6 @@ class LazyDatabricksApp(App):
 
         Only pops modal screens (like help overlay), never main screens.
         """
-        from textual.screen import ModalScreen
-
         # Only pop if current screen is a modal
         if isinstance(self.screen, ModalScreen):
             self.pop_screen()
@@ -263,11 +337,13 @@ class LazyDatabricksApp(App):
         Allows extension navigation like action_go_billing without
         explicitly defining each method.
         """
+        # The prefix check keeps lookups of our own attributes from recursing
+        # before __init__ has set them
         if name.startswith("action_go_"):
-            ext_name = name[len("action_go_"):]
-            # Check if this is an extension
-            if any(ext.info.name == ext_name for ext in self._extensions):
-                return lambda: self.switch_screen(ext_name)
+            try:
+                return self._extension_actions[name]
+            except KeyError:
+                pass
 
         raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
@@ -275,8 +351,7 @@ class LazyDatabricksApp(App):
         """Check if an action is valid, including dynamic extension actions."""
         # Handle extension navigation actions
         if action.startswith("go_"):
-            ext_name = action[3:]
-            if any(ext.info.name == ext_name for ext in self._extensions):
+            if action[_GO_LEN:] in self._extension_names:
                 return True
 
         # Defer to parent for all other actions
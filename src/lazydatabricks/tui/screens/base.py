@@ -9,9 +9,11 @@ All screens inherit from this to get:
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import TYPE_CHECKING
 
 from textual.screen import Screen
+from textual.widgets import DataTable
 
 from lazydatabricks.tui.widgets.footer_bar import FooterBar, HintItem
 
@@ -19,6 +21,25 @@ if TYPE_CHECKING:
     from lazydatabricks.tui.app import LazyDatabricksApp
 
 
+# Table and detail timestamps are built field by field: strftime re-parses
+# its format string on every call, and the tables format one per row.
+def format_short_time(dt: datetime | None) -> str:
+    """Format as MM/DD HH:MM, or an em dash when unset."""
+    if dt is None:
+        return "—"
+    return f"{dt.month:02d}/{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
+
+
+def format_full_time(dt: datetime | None) -> str:
+    """Format as YYYY-MM-DD HH:MM:SS, or an em dash when unset."""
+    if dt is None:
+        return "—"
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+    )
+
+
 class BaseScreen(Screen):
     """Base class for all LazyDatabricks screens.
 
@@ -28,16 +49,27 @@ class BaseScreen(Screen):
     - Footer bar with context actions
     """
 
+    # Rows added per event-loop turn when filling a table; the rest follow
+    # via call_later so keypresses are handled between chunks
+    ROW_CHUNK = 50
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._footer_bar: FooterBar | None = None
+        # Typed app reference, captured once on mount
+        self._lb_app: LazyDatabricksApp | None = None
+        # (key, label, destructive) per action last pushed to the footer
+        self._last_footer_sig: tuple | None = None
+        # Table id -> row keys still waiting to be added by _feed_rows
+        self._row_feeds: dict[str | None, list[str]] = {}
 
     @property
     def lazydatabricks_app(self) -> "LazyDatabricksApp":
         """Type-safe access to the LazyDatabricks app."""
-        from lazydatabricks.tui.app import LazyDatabricksApp
-        assert isinstance(self.app, LazyDatabricksApp)
-        return self.app
+        app = self._lb_app
+        if app is None:
+            return self.app  # type: ignore[return-value]
+        return app
 
     @property
     def client(self):
@@ -51,16 +83,12 @@ class BaseScreen(Screen):
 
     def on_mount(self) -> None:
         """Called when screen is mounted. Adds footer and updates it."""
-        # Build extension hints for footer
-        extension_hints = [
-            HintItem(ext.info.hotkey, ext.info.display_name)
-            for ext in self.lazydatabricks_app.extensions
-        ]
+        self._lb_app = self.app  # type: ignore[assignment]
 
         # Create and mount footer bar
         self._footer_bar = FooterBar(
             guard=self.guard,
-            extension_hints=extension_hints,
+            extension_hints=self.lazydatabricks_app.extension_hints,
         )
         self.mount(self._footer_bar)
         self._update_footer()
@@ -81,8 +109,87 @@ class BaseScreen(Screen):
         """Update footer bar with this screen's context actions."""
         if self._footer_bar:
             actions = self.get_context_actions()
+            sig = tuple((h.key, h.label, h.destructive) for h in actions)
+            # Skip the footer re-render when nothing visible changed
+            if sig == self._last_footer_sig:
+                return
+            self._last_footer_sig = sig
             self._footer_bar.set_context_actions(actions)
 
+    def _sync_rows(
+        self,
+        table: DataTable,
+        rows: dict[str, tuple[str, ...]],
+        previous: dict[str, tuple[str, ...]],
+        keep: str | None = None,
+    ) -> None:
+        """Bring ``table`` from ``previous`` to ``rows`` (both keyed by row key).
+
+        Only changed cells are updated, vanished rows removed and new rows
+        appended. If appending would not reproduce the new row order, the
+        table is rebuilt instead. New rows past ROW_CHUNK are added on later
+        event-loop turns, except that the row ``keep`` is always present on
+        return so the caller can move the cursor to it.
+        """
+        # An unfinished fill means previous is not what the table shows
+        streaming = self._row_feeds.pop(table.id, None) is not None
+        kept = [key for key in previous if key in rows]
+        added = [key for key in rows if key not in previous]
+        # One layout/repaint for the whole batch instead of one per row
+        with self.app.batch_update():
+            if streaming or kept + added != list(rows):
+                table.clear()
+                added = list(rows)
+            else:
+                for key in previous.keys() - rows.keys():
+                    table.remove_row(key)
+                column_keys = list(table.columns)
+                for key in kept:
+                    old, new = previous[key], rows[key]
+                    if old != new:
+                        for column_key, old_cell, new_cell in zip(column_keys, old, new, strict=True):
+                            if old_cell != new_cell:
+                                table.update_cell(key, column_key, new_cell)
+
+            count = self.ROW_CHUNK
+            if keep in rows and keep in added:
+                count = max(count, added.index(keep) + 1)
+            for key in added[:count]:
+                table.add_row(*rows[key], key=key)
+
+        if len(added) > count:
+            pending = added[count:]
+            self._row_feeds[table.id] = pending
+            self.call_later(self._feed_rows, table, rows, pending)
+
+    def _feed_rows(
+        self, table: DataTable, rows: dict[str, tuple[str, ...]], pending: list[str]
+    ) -> None:
+        """Add the next chunk of a fill started by _sync_rows."""
+        # A newer sync replaced this fill
+        if self._row_feeds.get(table.id) is not pending:
+            return
+        chunk = pending[: self.ROW_CHUNK]
+        del pending[: self.ROW_CHUNK]
+        with self.app.batch_update():
+            for key in chunk:
+                table.add_row(*rows[key], key=key)
+        if pending:
+            self.call_later(self._feed_rows, table, rows, pending)
+        else:
+            del self._row_feeds[table.id]
+
+    def _refresh_data(self) -> None:
+        """Reload the screen's data. Override in screens that load data."""
+
+    def _notify_and_refresh(self, message: str) -> None:
+        """Show a success notification and reload the screen's data.
+
+        Action workers hand both off in a single call_from_thread.
+        """
+        self.notify_success(message)
+        self._refresh_data()
+
     def notify_error(self, message: str) -> None:
         """Show an error notification."""
         self.app.notify(message, severity="error", timeout=5)
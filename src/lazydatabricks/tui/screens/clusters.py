@@ -204,16 +204,12 @@ class ClustersScreen(BaseScreen):
     def _do_start_cluster(self, cluster_id: str) -> None:
         """Start cluster in background."""
         # Temporarily disable read-only for this operation
-        self.lazydatabricks_app.client.config.read_only = False
-        try:
+        with self.lazydatabricks_app.client.writable():
             result = self.lazydatabricks_app.cluster_ops.start(cluster_id)
             if result.get("status") == "started":
-                self.app.call_from_thread(self.notify_success, "Cluster start requested")
-                self.app.call_from_thread(self._refresh_data)
+                self.app.call_from_thread(self._notify_and_refresh, "Cluster start requested")
             else:
                 self.app.call_from_thread(self.notify_error, result.get("error", "Failed to start"))
-        finally:
-            self.lazydatabricks_app.client.config.read_only = True
 
     def action_terminate_cluster(self) -> None:
         """Terminate the selected cluster."""
@@ -232,16 +228,12 @@ class ClustersScreen(BaseScreen):
     @work(thread=True)
     def _do_terminate_cluster(self, cluster_id: str) -> None:
         """Terminate cluster in background."""
-        self.lazydatabricks_app.client.config.read_only = False
-        try:
+        with self.lazydatabricks_app.client.writable():
             result = self.lazydatabricks_app.cluster_ops.terminate(cluster_id)
             if result.get("status") == "terminated":
-                self.app.call_from_thread(self.notify_success, "Cluster termination requested")
-                self.app.call_from_thread(self._refresh_data)
+                self.app.call_from_thread(self._notify_and_refresh, "Cluster termination requested")
             else:
                 self.app.call_from_thread(self.notify_error, result.get("error", "Failed to terminate"))
-        finally:
-            self.lazydatabricks_app.client.config.read_only = True
 
     def action_restart_cluster(self) -> None:
         """Restart the selected cluster."""
@@ -260,16 +252,12 @@ class ClustersScreen(BaseScreen):
     @work(thread=True)
     def _do_restart_cluster(self, cluster_id: str) -> None:
         """Restart cluster in background."""
-        self.lazydatabricks_app.client.config.read_only = False
-        try:
+        with self.lazydatabricks_app.client.writable():
             result = self.lazydatabricks_app.cluster_ops.restart(cluster_id)
             if result.get("status") == "restarting":
-                self.app.call_from_thread(self.notify_success, "Cluster restart requested")
-                self.app.call_from_thread(self._refresh_data)
+                self.app.call_from_thread(self._notify_and_refresh, "Cluster restart requested")
             else:
                 self.app.call_from_thread(self.notify_error, result.get("error", "Failed to restart"))
-        finally:
-            self.lazydatabricks_app.client.config.read_only = True
 
     def action_view_logs(self) -> None:
         """View cluster logs (opens in browser as fallback)."""
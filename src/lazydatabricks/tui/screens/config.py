@@ -9,8 +9,9 @@ from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import DataTable, Static
 from textual import work
+from textual.worker import get_current_worker
 
-from lazydatabricks.models.config import DatabricksProfile
+from lazydatabricks.models.config import DatabricksProfile, LazyDatabricksConfig
 from lazydatabricks.tui.screens.base import BaseScreen
 from lazydatabricks.tui.widgets.footer_bar import HintItem
 
@@ -25,9 +26,16 @@ class ConfigScreen(BaseScreen):
 
     def __init__(self) -> None:
         super().__init__()
-        self._profiles: list[DatabricksProfile] = []
+        self._profiles: tuple[DatabricksProfile, ...] = ()
+        self._profiles_by_name: dict[str, DatabricksProfile] = {}
+        # Static (name, host, auth) cells per profile, parallel to _profiles
+        self._profile_rows: tuple[tuple[str, str, str], ...] = ()
         self._selected_profile: DatabricksProfile | None = None
+        # Active flag the detail panel was last rendered with
+        self._last_detail_active: bool | None = None
         self._current_profile: str = ""
+        # Rendered cells per profile name, diffed on each _update_table
+        self._last_rows: dict[str, tuple[str, ...]] = {}
 
     def get_context_actions(self) -> list[HintItem]:
         """Config screen context actions."""
@@ -66,6 +74,10 @@ class ConfigScreen(BaseScreen):
         """Load available profiles."""
         config = self.lazydatabricks_app.client.config
         self._profiles = config.available_profiles
+        self._profiles_by_name = {p.name: p for p in self._profiles}
+        self._profile_rows = tuple(
+            (p.name, p.host_short[:40], p.auth_method.value) for p in self._profiles
+        )
         self._current_profile = config.profile_name or ""
 
         self._update_table()
@@ -73,19 +85,15 @@ class ConfigScreen(BaseScreen):
     def _update_table(self) -> None:
         """Update the profiles table."""
         table = self.query_one("#profiles-table", DataTable)
-        table.clear()
-
-        for profile in self._profiles:
-            is_active = profile.name == self._current_profile
-            active_marker = "[green]●[/]" if is_active else ""
 
-            table.add_row(
-                profile.name,
-                profile.host_short[:40],
-                profile.auth_method.value,
-                active_marker,
-                key=profile.name,
-            )
+        # Only touch cells that changed; a profile switch just moves the marker
+        current = self._current_profile
+        rows: dict[str, tuple[str, ...]] = {
+            static[0]: (*static, "[green]●[/]" if static[0] == current else "")
+            for static in self._profile_rows
+        }
+        self._sync_rows(table, rows, self._last_rows)
+        self._last_rows = rows
 
         if self._profiles:
             table.move_cursor(row=0)
@@ -93,31 +101,29 @@ class ConfigScreen(BaseScreen):
 
     def _update_detail(self, profile: DatabricksProfile) -> None:
         """Update the detail panel."""
+        is_active = profile.name == self._current_profile
+        # Same profile, same active state: the panel is already up to date
+        if profile is self._selected_profile and is_active == self._last_detail_active:
+            return
         self._selected_profile = profile
+        self._last_detail_active = is_active
         detail = self.query_one("#profile-detail", Static)
 
-        is_active = profile.name == self._current_profile
-
-        lines = [
+        parts = (
             f"[bold #e94560]{profile.name}[/]",
             "[green]● Active[/]" if is_active else "",
             "",
             f"[dim]Host:[/]      {profile.host}",
             f"[dim]Auth:[/]      {profile.auth_method.value}",
-        ]
-
-        if profile.cluster_id:
-            lines.append(f"[dim]Cluster:[/]   {profile.cluster_id}")
-
-        if profile.account_id:
-            lines.append(f"[dim]Account:[/]   {profile.account_id}")
-
-        detail.update("\n".join(lines))
+            f"[dim]Cluster:[/]   {profile.cluster_id}" if profile.cluster_id else None,
+            f"[dim]Account:[/]   {profile.account_id}" if profile.account_id else None,
+        )
+        detail.update("\n".join(p for p in parts if p is not None))
 
     def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
         """Handle row highlight."""
         if event.row_key and event.row_key.value:
-            profile = next((p for p in self._profiles if p.name == event.row_key.value), None)
+            profile = self._profiles_by_name.get(event.row_key.value)
             if profile:
                 self._update_detail(profile)
 
@@ -132,12 +138,12 @@ class ConfigScreen(BaseScreen):
 
         self._do_switch_profile(self._selected_profile.name)
 
-    @work(thread=True)
+    @work(thread=True, exclusive=True, group="config.switch")
     def _do_switch_profile(self, profile_name: str) -> None:
         """Switch profile in background."""
         try:
-            from lazydatabricks.models.config import LazyDatabricksConfig
-
+            # Re-read env and ~/.databrickscfg rather than a memoized load
+            LazyDatabricksConfig.invalidate_cache()
             new_config = LazyDatabricksConfig.load(profile=profile_name)
             self.lazydatabricks_app.client.config = new_config
             self.lazydatabricks_app.client.refresh()
@@ -167,11 +173,20 @@ class ConfigScreen(BaseScreen):
 
         self._do_test_connection()
 
-    @work(thread=True)
+    @work(thread=True, exclusive=True, group="config.test")
     def _do_test_connection(self) -> None:
-        """Test connection in background."""
+        """Test connection in background.
+
+        A repeat press cancels the previous test; its result is dropped.
+        """
         try:
-            result = self.lazydatabricks_app.client.test_connection()
+            # An explicit test should reach the workspace, not the cache
+            LazyDatabricksConfig.invalidate_cache()
+            client = self.lazydatabricks_app.client
+            client.invalidate(identity=True)
+            result = client.test_connection()
+            if get_current_worker().is_cancelled:
+                return
             if result.get("status") == "ok":
                 user = result.get("user", "unknown")
                 self.app.call_from_thread(self.notify_success, f"Connection OK - user: {user}")
@@ -14,6 +14,7 @@ from textual.containers import Container, Vertical
 from textual.widgets import Static
 from textual import work
 
+from lazydatabricks.models.config import LazyDatabricksConfig
 from lazydatabricks.models.health import HealthSnapshot
 from lazydatabricks.tui.screens.base import BaseScreen
 from lazydatabricks.tui.widgets.footer_bar import HintItem
@@ -122,5 +123,7 @@ class HomeScreen(BaseScreen):
         """Manual refresh action."""
         content = self.query_one("#health-content", Static)
         content.update("\n  Refreshing...")
+        self.lazydatabricks_app.client.invalidate()
+        LazyDatabricksConfig.invalidate_cache()
         self._refresh_data()
         self.notify_success("Refreshing health data...")
@@ -10,13 +10,23 @@ from __future__ import annotations
 
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, Vertical
+from textual.timer import Timer
 from textual.widgets import DataTable, Static
 from textual import work
+from textual.worker import get_current_worker
 
 from lazydatabricks.models.job import JobSummary, RunSummary, RunDetail, RunState, RunResult
-from lazydatabricks.tui.screens.base import BaseScreen
+from lazydatabricks.tui.screens.base import BaseScreen, format_full_time, format_short_time
 from lazydatabricks.tui.widgets.footer_bar import HintItem
 
+# Health indicator -> style; any other indicator renders dim
+_HEALTH_STYLE: dict[str, str] = {"✓": "green", "✗": "red", "●": "yellow"}
+
+# Prebuilt health cell markup, one per indicator
+_HEALTH_CELL: dict[str, str] = {
+    icon: f"[{style}]{icon}[/]" for icon, style in (*_HEALTH_STYLE.items(), ("—", "dim"))
+}
+
 
 class JobsScreen(BaseScreen):
     """Jobs management screen with three-pane layout."""
@@ -33,13 +43,35 @@ class JobsScreen(BaseScreen):
         ("l", "view_logs", "Logs"),
     ]
 
+    # Fixed part of the run detail panel; optional sections are appended
+    _DETAIL_TEMPLATE = (
+        "[bold #e94560]Run {run_id}[/]\n"
+        "\n"
+        "[dim]Job ID:[/]   {job_id}\n"
+        "[dim]State:[/]    [{style}]{state}[/]\n"
+        "[dim]Result:[/]   [{style}]{result}[/]\n"
+        "[dim]Started:[/]  {started}\n"
+        "[dim]Duration:[/] {duration}\n"
+        "[dim]Trigger:[/]  {trigger}"
+    )
+
+    # Quiet period before loading runs, so holding an arrow key fetches once
+    SELECT_DEBOUNCE_SECONDS = 0.15
+
     def __init__(self) -> None:
         super().__init__()
         self._jobs: list[JobSummary] = []
         self._runs: list[RunSummary] = []
+        # Row key -> model, for O(1) lookup on highlight
+        self._jobs_by_key: dict[str, JobSummary] = {}
+        self._runs_by_key: dict[str, RunSummary] = {}
+        # Row key -> cells currently shown in the jobs table
+        self._job_rows: dict[str, tuple[str, ...]] = {}
         self._selected_job: JobSummary | None = None
+        self._select_debounce: Timer | None = None
         self._selected_run: RunSummary | None = None
         self._current_pane = 0  # 0=jobs, 1=runs, 2=detail
+        self._styled_pane = 0  # pane currently carrying pane-active
 
     def get_context_actions(self) -> list[HintItem]:
         """Jobs screen context actions - varies by pane and selection."""
@@ -100,12 +132,25 @@ class JobsScreen(BaseScreen):
         """Initialize the screen."""
         super().on_mount()
 
+        # Cache widget handles; the layout is fixed after compose
+        self._jobs_table = self.query_one("#jobs-table", DataTable)
+        self._runs_table = self.query_one("#runs-table", DataTable)
+        self._detail = self.query_one("#run-detail", Static)
+        self._panes = tuple(
+            self.query_one(pane_id, Vertical)
+            for pane_id in ("#pane-jobs", "#pane-runs", "#pane-detail")
+        )
+        self._titles = tuple(
+            self.query_one(title_id, Static)
+            for title_id in ("#jobs-title", "#runs-title", "#detail-title")
+        )
+
         # Set up tables
-        jobs_table = self.query_one("#jobs-table", DataTable)
+        jobs_table = self._jobs_table
         jobs_table.cursor_type = "row"
         jobs_table.add_columns("Name", "Schedule", "Health")
 
-        runs_table = self.query_one("#runs-table", DataTable)
+        runs_table = self._runs_table
         runs_table.cursor_type = "row"
         runs_table.add_columns("Run ID", "Started", "Duration", "Result")
 
@@ -120,70 +165,118 @@ class JobsScreen(BaseScreen):
         """Load jobs in background."""
         try:
             jobs = self.lazydatabricks_app.job_ops.list_jobs(limit=100)
-            self.app.call_from_thread(self._update_jobs_table, jobs)
+            # Format cells here so the UI thread only inserts rows
+            rows = [self._job_row(job) for job in jobs]
+            selected = self.app.call_from_thread(self._update_jobs_table, jobs, rows)
         except Exception as e:
             self.app.call_from_thread(self.notify_error, f"Failed to load jobs: {e}")
+            return
 
-    def _update_jobs_table(self, jobs: list[JobSummary]) -> None:
-        """Update the jobs table."""
-        self._jobs = jobs
-        table = self.query_one("#jobs-table", DataTable)
-        table.clear()
-
-        for job in jobs:
-            health_style = self._get_health_style(job)
-            table.add_row(
-                job.name[:40],
-                job.schedule_display[:20],
-                f"[{health_style}]{job.health_display}[/]",
-                key=str(job.id),
-            )
-
-        if jobs:
-            table.move_cursor(row=0)
-            self._select_job(jobs[0])
+        # Fetch the selected job's runs on this thread instead of waiting
+        # out the selection debounce in a second worker
+        if selected is not None:
+            self._fetch_runs(selected.id)
+
+    def _job_row(self, job: JobSummary) -> tuple[str, ...]:
+        """Build the jobs table cells for one job."""
+        health = job.health_display
+        return (
+            job.name[:40],
+            job.schedule_display[:20],
+            _HEALTH_CELL.get(health) or f"[dim]{health}[/]",
+        )
 
-    def _get_health_style(self, job: JobSummary) -> str:
-        """Get style for job health indicator."""
-        if job.health_display == "✓":
-            return "green"
-        elif job.health_display == "✗":
-            return "red"
-        elif job.health_display == "●":
-            return "yellow"
-        return "dim"
+    def _update_jobs_table(
+        self, jobs: list[JobSummary], rows: list[tuple[str, ...]]
+    ) -> JobSummary | None:
+        """Update the jobs table and return the job whose runs to show."""
+        self._jobs = jobs
+        self._jobs_by_key = {str(job.id): job for job in jobs}
+        table = self._jobs_table
+        job_rows = dict(zip(self._jobs_by_key, rows, strict=True))
+        keep = str(self._selected_job.id) if self._selected_job is not None else None
+        self._sync_rows(table, job_rows, self._job_rows, keep=keep)
+        self._job_rows = job_rows
+
+        # Keep the cursor on the selected job if it survived the refresh
+        selected: JobSummary | None = None
+        if self._selected_job is not None:
+            key = str(self._selected_job.id)
+            selected = self._jobs_by_key.get(key)
+            row = table.get_row_index(key) if selected is not None else 0
+        if selected is None:
+            if not jobs:
+                return None
+            selected, row = jobs[0], 0
+
+        # Select without scheduling a load; _load_jobs fetches its runs
+        self._selected_job = selected
+        table.move_cursor(row=row)
+        return selected
 
     def _select_job(self, job: JobSummary) -> None:
         """Select a job and load its runs."""
+        if job is self._selected_job:
+            return
         self._selected_job = job
-        self._load_runs(job.id)
+        if self._select_debounce is not None:
+            self._select_debounce.stop()
+        self._select_debounce = self.set_timer(
+            self.SELECT_DEBOUNCE_SECONDS, self._flush_selection
+        )
 
-    @work(thread=True)
+    def _flush_selection(self) -> None:
+        """Load runs for the job selected once the cursor settles."""
+        self._select_debounce = None
+        if self._selected_job:
+            self._load_runs(self._selected_job.id)
+
+    @work(thread=True, exclusive=True, group="jobs.runs")
     def _load_runs(self, job_id: int) -> None:
         """Load runs for a job."""
+        self._fetch_runs(job_id)
+
+    def _fetch_runs(self, job_id: int) -> None:
+        """Fetch runs for a job and hand them to the UI (worker thread only)."""
         try:
             runs = self.lazydatabricks_app.job_ops.list_runs(job_id=job_id, limit=25)
-            self.app.call_from_thread(self._update_runs_table, runs)
+            # A newer selection superseded this fetch; drop the stale result
+            if get_current_worker().is_cancelled:
+                return
+            rows = [self._run_row(run) for run in runs]
+            self.app.call_from_thread(self._update_runs_table, job_id, runs, rows)
         except Exception as e:
             self.app.call_from_thread(self.notify_error, f"Failed to load runs: {e}")
 
-    def _update_runs_table(self, runs: list[RunSummary]) -> None:
+    def _run_row(self, run: RunSummary) -> tuple[str, ...]:
+        """Build the runs table cells for one run."""
+        result_style = self._get_result_style(run)
+        started = format_short_time(run.started_at)
+        return (
+            str(run.run_id),
+            started,
+            run.duration_display,
+            f"[{result_style}]{run.result_display}[/]",
+        )
+
+    def _update_runs_table(
+        self, job_id: int, runs: list[RunSummary], rows: list[tuple[str, ...]]
+    ) -> None:
         """Update the runs table."""
+        # The selection moved on while these runs were in flight
+        if self._selected_job is None or self._selected_job.id != job_id:
+            return
         self._runs = runs
-        table = self.query_one("#runs-table", DataTable)
-        table.clear()
-
-        for run in runs:
-            result_style = self._get_result_style(run)
-            started = run.started_at.strftime("%m/%d %H:%M") if run.started_at else "—"
-
-            table.add_row(
-                str(run.run_id),
-                started,
-                run.duration_display,
-                f"[{result_style}]{run.result_display}[/]",
-                key=str(run.run_id),
-            )
+        self._runs_by_key = {}
+        table = self._runs_table
+        # One layout/repaint for the whole batch instead of one per row
+        with self.app.batch_update():
+            table.clear()
+
+            for run, row in zip(runs, rows, strict=True):
+                key = str(run.run_id)
+                self._runs_by_key[key] = run
+                table.add_row(*row, key=key)
 
         if runs:
             table.move_cursor(row=0)
@@ -201,69 +294,68 @@ class JobsScreen(BaseScreen):
 
     def _select_run(self, run: RunSummary) -> None:
         """Select a run and show detail."""
+        # Re-highlighting the same row leaves the detail text as is
+        if run is self._selected_run:
+            return
         self._selected_run = run
         self._update_detail(run)
 
     def _update_detail(self, run: RunSummary) -> None:
         """Update the detail panel."""
-        detail = self.query_one("#run-detail", Static)
-
-        result_style = self._get_result_style(run)
-        started = run.started_at.strftime("%Y-%m-%d %H:%M:%S") if run.started_at else "—"
-
-        lines = [
-            f"[bold #e94560]Run {run.run_id}[/]",
-            "",
-            f"[dim]Job ID:[/]   {run.job_id}",
-            f"[dim]State:[/]    [{result_style}]{run.state.value}[/]",
-            f"[dim]Result:[/]   [{result_style}]{run.result_display}[/]",
-            f"[dim]Started:[/]  {started}",
-            f"[dim]Duration:[/] {run.duration_display}",
-            f"[dim]Trigger:[/]  {run.trigger.value}",
-        ]
+        detail = self._detail
+
+        text = self._DETAIL_TEMPLATE.format(
+            run_id=run.run_id,
+            job_id=run.job_id,
+            style=self._get_result_style(run),
+            state=run.state.value,
+            result=run.result_display,
+            started=format_full_time(run.started_at),
+            duration=run.duration_display,
+            trigger=run.trigger.value,
+        )
 
         if run.notebook_path:
-            lines.append(f"[dim]Notebook:[/] {run.notebook_path}")
+            text += f"\n[dim]Notebook:[/] {run.notebook_path}"
 
         if run.error_snippet:
-            lines.append("")
-            lines.append("[red]Error:[/]")
-            lines.append(f"  {run.error_snippet[:200]}")
+            text += f"\n\n[red]Error:[/]\n  {run.error_snippet[:200]}"
 
-        detail.update("\n".join(lines))
+        detail.update(text)
 
         # Update footer with context-aware actions
         self._update_footer()
 
     def _update_pane_styles(self) -> None:
         """Update visual style of panes based on focus."""
-        panes = ["#pane-jobs", "#pane-runs", "#pane-detail"]
-        titles = ["#jobs-title", "#runs-title", "#detail-title"]
-        title_text = ["Jobs", "Runs", "Detail"]
-
-        for i, (pane_id, title_id, text) in enumerate(zip(panes, titles, title_text)):
-            pane = self.query_one(pane_id, Vertical)
-            title = self.query_one(title_id, Static)
-
-            if i == self._current_pane:
-                pane.remove_class("pane-inactive")
-                pane.add_class("pane-active")
-                title.update(f"[bold #e94560]{text}[/]")
-            else:
-                pane.remove_class("pane-active")
-                pane.add_class("pane-inactive")
-                title.update(f"[dim]{text}[/]")
+        title_text = ("Jobs", "Runs", "Detail")
+        previous, current = self._styled_pane, self._current_pane
+        if previous == current:
+            return
+
+        # Only the panes losing and gaining focus change
+        for i in (previous, current):
+            active = i == current
+            pane = self._panes[i]
+            # Restyle once per pane rather than once per class change
+            pane.set_class(active, "pane-active", update=False)
+            pane.set_class(not active, "pane-inactive")
+            text = title_text[i]
+            self._titles[i].update(
+                f"[bold #e94560]{text}[/]" if active else f"[dim]{text}[/]"
+            )
+        self._styled_pane = current
 
     def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
         """Handle row highlight."""
         table = event.data_table
 
         if table.id == "jobs-table" and event.row_key and event.row_key.value:
-            job = next((j for j in self._jobs if str(j.id) == event.row_key.value), None)
+            job = self._jobs_by_key.get(event.row_key.value)
             if job:
                 self._select_job(job)
         elif table.id == "runs-table" and event.row_key and event.row_key.value:
-            run = next((r for r in self._runs if str(r.run_id) == event.row_key.value), None)
+            run = self._runs_by_key.get(event.row_key.value)
             if run:
                 self._select_run(run)
 
@@ -289,9 +381,9 @@ class JobsScreen(BaseScreen):
     def _focus_current_pane(self) -> None:
         """Focus the current pane's table."""
         if self._current_pane == 0:
-            self.query_one("#jobs-table", DataTable).focus()
+            self._jobs_table.focus()
         elif self._current_pane == 1:
-            self.query_one("#runs-table", DataTable).focus()
+            self._runs_table.focus()
         # Pane 2 is detail, no focusable element
 
     def action_drill_down(self) -> None:
@@ -329,16 +421,14 @@ class JobsScreen(BaseScreen):
     @work(thread=True)
     def _do_run_now(self, job_id: int) -> None:
         """Run job in background."""
-        self.lazydatabricks_app.client.config.read_only = False
-        try:
+        with self.lazydatabricks_app.client.writable():
             result = self.lazydatabricks_app.job_ops.run_now(job_id)
             if result.get("status") == "submitted":
-                self.app.call_from_thread(self.notify_success, f"Job triggered - run {result.get('run_id')}")
-                self.app.call_from_thread(self._refresh_data)
+                self.app.call_from_thread(
+                    self._notify_and_refresh, f"Job triggered - run {result.get('run_id')}"
+                )
             else:
                 self.app.call_from_thread(self.notify_error, result.get("error", "Failed to trigger"))
-        finally:
-            self.lazydatabricks_app.client.config.read_only = True
 
     def action_cancel_run(self) -> None:
         """Cancel the selected run."""
@@ -357,16 +447,12 @@ class JobsScreen(BaseScreen):
     @work(thread=True)
     def _do_cancel_run(self, run_id: int) -> None:
         """Cancel run in background."""
-        self.lazydatabricks_app.client.config.read_only = False
-        try:
+        with self.lazydatabricks_app.client.writable():
             result = self.lazydatabricks_app.job_ops.cancel_run(run_id)
             if result.get("status") == "cancelled":
-                self.app.call_from_thread(self.notify_success, "Run cancellation requested")
-                self.app.call_from_thread(self._refresh_data)
+                self.app.call_from_thread(self._notify_and_refresh, "Run cancellation requested")
             else:
                 self.app.call_from_thread(self.notify_error, result.get("error", "Failed to cancel"))
-        finally:
-            self.lazydatabricks_app.client.config.read_only = True
 
     def action_rerun(self) -> None:
         """Rerun the selected run."""
@@ -385,16 +471,12 @@ class JobsScreen(BaseScreen):
     @work(thread=True)
     def _do_rerun(self, run_id: int) -> None:
         """Rerun in background."""
-        self.lazydatabricks_app.client.config.read_only = False
-        try:
+        with self.lazydatabricks_app.client.writable():
             result = self.lazydatabricks_app.job_ops.rerun(run_id)
             if result.get("status") == "rerun_submitted":
-                self.app.call_from_thread(self.notify_success, "Rerun submitted")
-                self.app.call_from_thread(self._refresh_data)
+                self.app.call_from_thread(self._notify_and_refresh, "Rerun submitted")
             else:
                 self.app.call_from_thread(self.notify_error, result.get("error", "Failed to rerun"))
-        finally:
-            self.lazydatabricks_app.client.config.read_only = True
 
     def action_view_logs(self) -> None:
         """View logs for selected run."""
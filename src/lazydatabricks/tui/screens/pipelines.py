@@ -10,13 +10,18 @@ from __future__ import annotations
 
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, Vertical
+from textual.timer import Timer
 from textual.widgets import DataTable, Static
 from textual import work
+from textual.worker import get_current_worker
 
 from lazydatabricks.models.pipeline import PipelineSummary, UpdateSummary, UpdateState
-from lazydatabricks.tui.screens.base import BaseScreen
+from lazydatabricks.tui.screens.base import BaseScreen, format_full_time, format_short_time
 from lazydatabricks.tui.widgets.footer_bar import HintItem
 
+# Health indicator -> style; any other indicator renders dim
+_HEALTH_STYLE: dict[str, str] = {"✓": "green", "✗": "red", "●": "yellow"}
+
 
 class PipelinesScreen(BaseScreen):
     """Pipelines management screen with three-pane layout."""
@@ -32,13 +37,35 @@ class PipelinesScreen(BaseScreen):
         ("f", "full_refresh", "Full Refresh"),
     ]
 
+    # Fixed part of the update detail panel; optional sections are appended
+    _DETAIL_TEMPLATE = (
+        "[bold #e94560]Update {update_id}...[/]\n"
+        "\n"
+        "[dim]Pipeline:[/]  {pipeline_id}...\n"
+        "[dim]State:[/]     [{style}]{state}[/]\n"
+        "[dim]Cause:[/]     {cause}\n"
+        "[dim]Created:[/]   {created}\n"
+        "[dim]Started:[/]   {started}\n"
+        "[dim]Duration:[/]  {duration}"
+    )
+
+    # Quiet period before loading updates, so holding an arrow key fetches once
+    SELECT_DEBOUNCE_SECONDS = 0.15
+
     def __init__(self) -> None:
         super().__init__()
         self._pipelines: list[PipelineSummary] = []
         self._updates: list[UpdateSummary] = []
+        # Row key -> model, for O(1) lookup on highlight
+        self._pipelines_by_key: dict[str, PipelineSummary] = {}
+        self._updates_by_key: dict[str, UpdateSummary] = {}
+        # Row key -> cells currently shown in the pipelines table
+        self._pipeline_rows: dict[str, tuple[str, ...]] = {}
         self._selected_pipeline: PipelineSummary | None = None
+        self._select_debounce: Timer | None = None
         self._selected_update: UpdateSummary | None = None
         self._current_pane = 0  # 0=pipelines, 1=updates, 2=detail
+        self._styled_pane = 0  # pane currently carrying pane-active
 
     def get_context_actions(self) -> list[HintItem]:
         """Pipelines screen context actions - varies by pane and selection."""
@@ -100,12 +127,25 @@ class PipelinesScreen(BaseScreen):
         """Initialize the screen."""
         super().on_mount()
 
+        # Cache widget handles; the layout is fixed after compose
+        self._pipelines_table = self.query_one("#pipelines-table", DataTable)
+        self._updates_table = self.query_one("#updates-table", DataTable)
+        self._detail = self.query_one("#update-detail", Static)
+        self._panes = tuple(
+            self.query_one(pane_id, Vertical)
+            for pane_id in ("#pane-pipelines", "#pane-updates", "#pane-detail")
+        )
+        self._titles = tuple(
+            self.query_one(title_id, Static)
+            for title_id in ("#pipelines-title", "#updates-title", "#detail-title")
+        )
+
         # Set up tables
-        pipelines_table = self.query_one("#pipelines-table", DataTable)
+        pipelines_table = self._pipelines_table
         pipelines_table.cursor_type = "row"
         pipelines_table.add_columns("Name", "State", "Target", "Last Update")
 
-        updates_table = self.query_one("#updates-table", DataTable)
+        updates_table = self._updates_table
         updates_table.cursor_type = "row"
         updates_table.add_columns("Update ID", "Started", "Duration", "State")
 
@@ -120,81 +160,129 @@ class PipelinesScreen(BaseScreen):
         """Load pipelines in background."""
         try:
             pipelines = self.lazydatabricks_app.pipeline_ops.list_pipelines(limit=100)
-            self.app.call_from_thread(self._update_pipelines_table, pipelines)
+            # Format cells here so the UI thread only inserts rows
+            rows = [self._pipeline_row(pipeline) for pipeline in pipelines]
+            selected = self.app.call_from_thread(self._update_pipelines_table, pipelines, rows)
         except Exception as e:
             self.app.call_from_thread(self.notify_error, f"Failed to load pipelines: {e}")
+            return
 
-    def _update_pipelines_table(self, pipelines: list[PipelineSummary]) -> None:
-        """Update the pipelines table."""
-        self._pipelines = pipelines
-        table = self.query_one("#pipelines-table", DataTable)
-        table.clear()
-
-        for pipeline in pipelines:
-            health_style = self._get_health_style(pipeline)
-            state_style = pipeline.state.display_style
-            last_update = "—"
-            if pipeline.last_update_time:
-                last_update = pipeline.last_update_time.strftime("%m/%d %H:%M")
-
-            table.add_row(
-                pipeline.name[:40],
-                f"[{state_style}]{pipeline.state_display}[/]",
-                pipeline.target_display[:20],
-                f"[{health_style}]{last_update}[/]",
-                key=pipeline.pipeline_id,
-            )
+        # Fetch the selected pipeline's updates on this thread instead of
+        # waiting out the selection debounce in a second worker
+        if selected is not None:
+            self._fetch_updates(selected.pipeline_id)
+
+    def _pipeline_row(self, pipeline: PipelineSummary) -> tuple[str, ...]:
+        """Build the pipelines table cells for one pipeline."""
+        health_style = self._get_health_style(pipeline)
+        state_style = pipeline.state.display_style
+        last_update = format_short_time(pipeline.last_update_time)
+        return (
+            pipeline.name[:40],
+            f"[{state_style}]{pipeline.state_display}[/]",
+            pipeline.target_display[:20],
+            f"[{health_style}]{last_update}[/]",
+        )
 
-        if pipelines:
-            table.move_cursor(row=0)
-            self._select_pipeline(pipelines[0])
+    def _update_pipelines_table(
+        self, pipelines: list[PipelineSummary], rows: list[tuple[str, ...]]
+    ) -> PipelineSummary | None:
+        """Update the pipelines table and return the pipeline whose updates to show."""
+        self._pipelines = pipelines
+        self._pipelines_by_key = {p.pipeline_id: p for p in pipelines}
+        table = self._pipelines_table
+        pipeline_rows = dict(zip(self._pipelines_by_key, rows, strict=True))
+        keep = self._selected_pipeline.pipeline_id if self._selected_pipeline is not None else None
+        self._sync_rows(table, pipeline_rows, self._pipeline_rows, keep=keep)
+        self._pipeline_rows = pipeline_rows
+
+        # Keep the cursor on the selected pipeline if it survived the refresh
+        selected: PipelineSummary | None = None
+        if self._selected_pipeline is not None:
+            key = self._selected_pipeline.pipeline_id
+            selected = self._pipelines_by_key.get(key)
+            row = table.get_row_index(key) if selected is not None else 0
+        if selected is None:
+            if not pipelines:
+                return None
+            selected, row = pipelines[0], 0
+
+        # Select without scheduling a load; _load_pipelines fetches its updates
+        self._selected_pipeline = selected
+        table.move_cursor(row=row)
+        return selected
 
     def _get_health_style(self, pipeline: PipelineSummary) -> str:
         """Get style for pipeline health indicator."""
-        if pipeline.health_display == "✓":
-            return "green"
-        elif pipeline.health_display == "✗":
-            return "red"
-        elif pipeline.health_display == "●":
-            return "yellow"
-        return "dim"
+        return _HEALTH_STYLE.get(pipeline.health_display, "dim")
 
     def _select_pipeline(self, pipeline: PipelineSummary) -> None:
         """Select a pipeline and load its updates."""
+        if pipeline is self._selected_pipeline:
+            return
         self._selected_pipeline = pipeline
-        self._load_updates(pipeline.pipeline_id)
+        if self._select_debounce is not None:
+            self._select_debounce.stop()
+        self._select_debounce = self.set_timer(
+            self.SELECT_DEBOUNCE_SECONDS, self._flush_selection
+        )
 
-    @work(thread=True)
+    def _flush_selection(self) -> None:
+        """Load updates for the pipeline selected once the cursor settles."""
+        self._select_debounce = None
+        if self._selected_pipeline:
+            self._load_updates(self._selected_pipeline.pipeline_id)
+
+    @work(thread=True, exclusive=True, group="pipelines.updates")
     def _load_updates(self, pipeline_id: str) -> None:
         """Load updates for a pipeline."""
+        self._fetch_updates(pipeline_id)
+
+    def _fetch_updates(self, pipeline_id: str) -> None:
+        """Fetch updates for a pipeline and hand them to the UI (worker thread only)."""
         try:
             updates = self.lazydatabricks_app.pipeline_ops.list_updates(
                 pipeline_id=pipeline_id, limit=25
             )
-            self.app.call_from_thread(self._update_updates_table, updates)
+            # A newer selection superseded this fetch; drop the stale result
+            if get_current_worker().is_cancelled:
+                return
+            rows = [self._update_row(update) for update in updates]
+            self.app.call_from_thread(self._update_updates_table, pipeline_id, updates, rows)
         except Exception as e:
             self.app.call_from_thread(self.notify_error, f"Failed to load updates: {e}")
 
-    def _update_updates_table(self, updates: list[UpdateSummary]) -> None:
+    def _update_row(self, update: UpdateSummary) -> tuple[str, ...]:
+        """Build the updates table cells for one update."""
+        result_style = self._get_result_style(update)
+        started = format_short_time(update.start_time)
+
+        # Truncate update ID for display
+        update_id_short = update.update_id[:12] if update.update_id else "—"
+
+        return (
+            update_id_short,
+            started,
+            update.duration_display,
+            f"[{result_style}]{update.state_display}[/]",
+        )
+
+    def _update_updates_table(
+        self, pipeline_id: str, updates: list[UpdateSummary], rows: list[tuple[str, ...]]
+    ) -> None:
         """Update the updates table."""
+        # The selection moved on while these updates were in flight
+        if self._selected_pipeline is None or self._selected_pipeline.pipeline_id != pipeline_id:
+            return
         self._updates = updates
-        table = self.query_one("#updates-table", DataTable)
-        table.clear()
-
-        for update in updates:
-            result_style = self._get_result_style(update)
-            started = update.start_time.strftime("%m/%d %H:%M") if update.start_time else "—"
-
-            # Truncate update ID for display
-            update_id_short = update.update_id[:12] if update.update_id else "—"
-
-            table.add_row(
-                update_id_short,
-                started,
-                update.duration_display,
-                f"[{result_style}]{update.state_display}[/]",
-                key=update.update_id,
-            )
+        self._updates_by_key = {u.update_id: u for u in updates}
+        table = self._updates_table
+        # One layout/repaint for the whole batch instead of one per row
+        with self.app.batch_update():
+            table.clear()
+
+            for update, row in zip(updates, rows, strict=True):
+                table.add_row(*row, key=update.update_id)
 
         if updates:
             table.move_cursor(row=0)
@@ -214,76 +302,70 @@ class PipelinesScreen(BaseScreen):
 
     def _select_update(self, update: UpdateSummary) -> None:
         """Select an update and show detail."""
+        # Re-highlighting the same row leaves the detail text as is
+        if update is self._selected_update:
+            return
         self._selected_update = update
         self._update_detail(update)
 
     def _update_detail(self, update: UpdateSummary) -> None:
         """Update the detail panel."""
-        detail = self.query_one("#update-detail", Static)
-
-        result_style = self._get_result_style(update)
-        started = update.start_time.strftime("%Y-%m-%d %H:%M:%S") if update.start_time else "—"
-        created = update.creation_time.strftime("%Y-%m-%d %H:%M:%S") if update.creation_time else "—"
-
-        lines = [
-            f"[bold #e94560]Update {update.update_id[:16]}...[/]",
-            "",
-            f"[dim]Pipeline:[/]  {update.pipeline_id[:20]}...",
-            f"[dim]State:[/]     [{result_style}]{update.state.value}[/]",
-            f"[dim]Cause:[/]     {update.cause.value}",
-            f"[dim]Created:[/]   {created}",
-            f"[dim]Started:[/]   {started}",
-            f"[dim]Duration:[/]  {update.duration_display}",
-        ]
+        detail = self._detail
+
+        text = self._DETAIL_TEMPLATE.format(
+            update_id=update.update_id[:16],
+            pipeline_id=update.pipeline_id[:20],
+            style=self._get_result_style(update),
+            state=update.state.value,
+            cause=update.cause.value,
+            created=format_full_time(update.creation_time),
+            started=format_full_time(update.start_time),
+            duration=update.duration_display,
+        )
 
         if update.full_refresh:
-            lines.append("[dim]Mode:[/]      [yellow]FULL REFRESH[/]")
+            text += "\n[dim]Mode:[/]      [yellow]FULL REFRESH[/]"
             if update.full_refresh_selection:
-                lines.append(f"[dim]Tables:[/]    {', '.join(update.full_refresh_selection[:3])}")
+                text += f"\n[dim]Tables:[/]    {', '.join(update.full_refresh_selection[:3])}"
 
         if update.cluster_id:
-            lines.append(f"[dim]Cluster:[/]   {update.cluster_id}")
+            text += f"\n[dim]Cluster:[/]   {update.cluster_id}"
 
-        detail.update("\n".join(lines))
+        detail.update(text)
 
         # Update footer with context-aware actions
         self._update_footer()
 
     def _update_pane_styles(self) -> None:
         """Update visual style of panes based on focus."""
-        panes = ["#pane-pipelines", "#pane-updates", "#pane-detail"]
-        titles = ["#pipelines-title", "#updates-title", "#detail-title"]
-        title_text = ["Pipelines", "Updates", "Detail"]
-
-        for i, (pane_id, title_id, text) in enumerate(zip(panes, titles, title_text)):
-            pane = self.query_one(pane_id, Vertical)
-            title = self.query_one(title_id, Static)
-
-            if i == self._current_pane:
-                pane.remove_class("pane-inactive")
-                pane.add_class("pane-active")
-                title.update(f"[bold #e94560]{text}[/]")
-            else:
-                pane.remove_class("pane-active")
-                pane.add_class("pane-inactive")
-                title.update(f"[dim]{text}[/]")
+        title_text = ("Pipelines", "Updates", "Detail")
+        previous, current = self._styled_pane, self._current_pane
+        if previous == current:
+            return
+
+        # Only the panes losing and gaining focus change
+        for i in (previous, current):
+            active = i == current
+            pane = self._panes[i]
+            # Restyle once per pane rather than once per class change
+            pane.set_class(active, "pane-active", update=False)
+            pane.set_class(not active, "pane-inactive")
+            text = title_text[i]
+            self._titles[i].update(
+                f"[bold #e94560]{text}[/]" if active else f"[dim]{text}[/]"
+            )
+        self._styled_pane = current
 
     def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
         """Handle row highlight."""
         table = event.data_table
 
         if table.id == "pipelines-table" and event.row_key and event.row_key.value:
-            pipeline = next(
-                (p for p in self._pipelines if p.pipeline_id == event.row_key.value),
-                None,
-            )
+            pipeline = self._pipelines_by_key.get(event.row_key.value)
             if pipeline:
                 self._select_pipeline(pipeline)
         elif table.id == "updates-table" and event.row_key and event.row_key.value:
-            update = next(
-                (u for u in self._updates if u.update_id == event.row_key.value),
-                None,
-            )
+            update = self._updates_by_key.get(event.row_key.value)
             if update:
                 self._select_update(update)
 
@@ -309,9 +391,9 @@ class PipelinesScreen(BaseScreen):
     def _focus_current_pane(self) -> None:
         """Focus the current pane's table."""
         if self._current_pane == 0:
-            self.query_one("#pipelines-table", DataTable).focus()
+            self._pipelines_table.focus()
         elif self._current_pane == 1:
-            self.query_one("#updates-table", DataTable).focus()
+            self._updates_table.focus()
         # Pane 2 is detail, no focusable element
 
     def action_drill_down(self) -> None:
@@ -367,24 +449,20 @@ class PipelinesScreen(BaseScreen):
     @work(thread=True)
     def _do_start_update(self, pipeline_id: str, full_refresh: bool = False) -> None:
         """Start pipeline in background."""
-        self.lazydatabricks_app.client.config.read_only = False
-        try:
+        with self.lazydatabricks_app.client.writable():
             result = self.lazydatabricks_app.pipeline_ops.start_update(
                 pipeline_id, full_refresh=full_refresh
             )
             if result.get("status") == "started":
                 msg = "Full refresh" if full_refresh else "Update"
                 self.app.call_from_thread(
-                    self.notify_success,
+                    self._notify_and_refresh,
                     f"{msg} started - update {result.get('update_id', '')[:12]}",
                 )
-                self.app.call_from_thread(self._refresh_data)
             else:
                 self.app.call_from_thread(
                     self.notify_error, result.get("error", "Failed to start")
                 )
-        finally:
-            self.lazydatabricks_app.client.config.read_only = True
 
     def action_stop_pipeline(self) -> None:
         """Stop the selected pipeline."""
@@ -403,15 +481,11 @@ class PipelinesScreen(BaseScreen):
     @work(thread=True)
     def _do_stop_pipeline(self, pipeline_id: str) -> None:
         """Stop pipeline in background."""
-        self.lazydatabricks_app.client.config.read_only = False
-        try:
+        with self.lazydatabricks_app.client.writable():
             result = self.lazydatabricks_app.pipeline_ops.stop(pipeline_id)
             if result.get("status") == "stopped":
-                self.app.call_from_thread(self.notify_success, "Pipeline stop requested")
-                self.app.call_from_thread(self._refresh_data)
+                self.app.call_from_thread(self._notify_and_refresh, "Pipeline stop requested")
             else:
                 self.app.call_from_thread(
                     self.notify_error, result.get("error", "Failed to stop")
                 )
-        finally:
-            self.lazydatabricks_app.client.config.read_only = True
@@ -174,16 +174,12 @@ class WarehousesScreen(BaseScreen):
     @work(thread=True)
     def _do_start_warehouse(self, warehouse_id: str) -> None:
         """Start warehouse in background."""
-        self.lazydatabricks_app.client.config.read_only = False
-        try:
+        with self.lazydatabricks_app.client.writable():
             result = self.lazydatabricks_app.warehouse_ops.start(warehouse_id)
             if result.get("status") == "started":
-                self.app.call_from_thread(self.notify_success, "Warehouse start requested")
-                self.app.call_from_thread(self._refresh_data)
+                self.app.call_from_thread(self._notify_and_refresh, "Warehouse start requested")
             else:
                 self.app.call_from_thread(self.notify_error, result.get("error", "Failed to start"))
-        finally:
-            self.lazydatabricks_app.client.config.read_only = True
 
     def action_stop_warehouse(self) -> None:
         """Stop the selected warehouse."""
@@ -202,13 +198,9 @@ class WarehousesScreen(BaseScreen):
     @work(thread=True)
     def _do_stop_warehouse(self, warehouse_id: str) -> None:
         """Stop warehouse in background."""
-        self.lazydatabricks_app.client.config.read_only = False
-        try:
+        with self.lazydatabricks_app.client.writable():
             result = self.lazydatabricks_app.warehouse_ops.stop(warehouse_id)
             if result.get("status") == "stopped":
-                self.app.call_from_thread(self.notify_success, "Warehouse stop requested")
-                self.app.call_from_thread(self._refresh_data)
+                self.app.call_from_thread(self._notify_and_refresh, "Warehouse stop requested")
             else:
                 self.app.call_from_thread(self.notify_error, result.get("error", "Failed to stop"))
-        finally:
-            self.lazydatabricks_app.client.config.read_only = True
@@ -9,6 +9,8 @@ Never wraps; truncates intelligently to fit terminal width.
 
 from __future__ import annotations
 
+import re
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -45,7 +47,7 @@ CORE_NAV_END: list[HintItem] = [
 ]
 
 
-def build_global_nav(extension_hints: list[HintItem] | None = None) -> list[HintItem]:
+def build_global_nav(extension_hints: Sequence[HintItem] | None = None) -> list[HintItem]:
     """Build global nav including extension items.
 
     Extension hints are inserted between core nav and Profiles/Help/Quit.
@@ -57,6 +59,9 @@ def build_global_nav(extension_hints: list[HintItem] | None = None) -> list[Hint
     return nav
 
 
+# Markup tags, stripped when measuring display width
+_MARKUP_RE = re.compile(r'\[.*?\]')
+
 # Default global nav (without extensions)
 GLOBAL_NAV: list[HintItem] = build_global_nav()
 
@@ -89,7 +94,7 @@ class FooterBar(Widget):
         self,
         guard: "ArmedGuard | None" = None,
         context_actions: list[HintItem] | None = None,
-        extension_hints: list[HintItem] | None = None,
+        extension_hints: Sequence[HintItem] | None = None,
         **kwargs
     ) -> None:
         super().__init__(**kwargs)
@@ -97,6 +102,9 @@ class FooterBar(Widget):
         self.context_actions = context_actions or []
         self._extension_hints = extension_hints or []
         self._global_nav = build_global_nav(self._extension_hints)
+        # The nav zone never changes for a footer; format it once
+        self._left_zone = self._format_items(self._global_nav)
+        self._left_plain = self._plain_text(self._left_zone)
 
     def compose(self) -> ComposeResult:
         yield Static("", id="footer-content")
@@ -140,9 +148,6 @@ class FooterBar(Widget):
 
         width = self.size.width or 80
 
-        # Build left zone (global nav)
-        left_items = self._format_items(self._global_nav)
-
         # Build right zone (context actions)
         if self.is_armed:
             # Armed mode: show destructive actions + disarm hint
@@ -159,11 +164,11 @@ class FooterBar(Widget):
             right_items = self._format_items(normal_actions)
             right_zone = right_items
 
-        left_zone = left_items
+        left_zone = self._left_zone
         delimiter = " [$text-muted]|[/] "
 
         # Calculate display widths (approximate, ignoring markup)
-        left_plain = self._plain_text(left_zone)
+        left_plain = self._left_plain
         right_plain = self._plain_text(right_zone)
         delim_plain = " | "
 
@@ -196,8 +201,7 @@ class FooterBar(Widget):
 
     def _plain_text(self, markup: str) -> str:
         """Strip markup to get plain text for width calculation."""
-        import re
-        return re.sub(r'\[.*?\]', '', markup)
+        return _MARKUP_RE.sub('', markup)
 
     def _truncate_zone(self, zone: str, max_width: int) -> str:
         """Truncate a zone to fit width, ending with ..."""
@@ -5,6 +5,8 @@ Shows available keybindings for the current screen context.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.reactive import reactive
@@ -40,12 +42,12 @@ class StatusBar(Widget):
     }
     """
 
-    # List of (key, description) tuples
-    bindings: reactive[list[tuple[str, str]]] = reactive(list)
+    # Sequence of (key, description) tuples
+    bindings: reactive[Sequence[tuple[str, str]]] = reactive(tuple)
 
-    def __init__(self, bindings: list[tuple[str, str]] | None = None, **kwargs) -> None:
+    def __init__(self, bindings: Sequence[tuple[str, str]] | None = None, **kwargs) -> None:
         super().__init__(**kwargs)
-        self.bindings = bindings or []
+        self.bindings = bindings or ()
 
     def compose(self) -> ComposeResult:
         yield Horizontal(id="status-bindings")
@@ -54,7 +56,7 @@ class StatusBar(Widget):
         """Initial render."""
         self._render_bindings()
 
-    def watch_bindings(self, new_bindings: list[tuple[str, str]]) -> None:
+    def watch_bindings(self, new_bindings: Sequence[tuple[str, str]]) -> None:
         """React to binding changes."""
         self._render_bindings()
 
@@ -71,13 +73,13 @@ class StatusBar(Widget):
             # Widget not yet composed
             pass
 
-    def set_bindings(self, bindings: list[tuple[str, str]]) -> None:
+    def set_bindings(self, bindings: Sequence[tuple[str, str]]) -> None:
         """Update the displayed bindings."""
         self.bindings = bindings
 
 
 # Default keybindings for different contexts
-GLOBAL_BINDINGS = [
+GLOBAL_BINDINGS: tuple[tuple[str, str], ...] = (
     ("h", "home"),
     ("c", "clusters"),
     ("j", "jobs"),
@@ -87,9 +89,9 @@ GLOBAL_BINDINGS = [
     ("A", "arm"),
     ("?", "help"),
     ("q", "quit"),
-]
+)
 
-HOME_BINDINGS = [
+HOME_BINDINGS: tuple[tuple[str, str], ...] = (
     ("r", "refresh"),
     ("c", "clusters"),
     ("j", "jobs"),
@@ -97,9 +99,9 @@ HOME_BINDINGS = [
     ("A", "arm"),
     ("?", "help"),
     ("q", "quit"),
-]
+)
 
-CLUSTERS_BINDINGS = [
+CLUSTERS_BINDINGS: tuple[tuple[str, str], ...] = (
     ("s", "start"),
     ("t", "terminate"),
     ("R", "restart"),
@@ -107,9 +109,9 @@ CLUSTERS_BINDINGS = [
     ("r", "refresh"),
     ("A", "arm"),
     ("?", "help"),
-]
+)
 
-JOBS_BINDINGS = [
+JOBS_BINDINGS: tuple[tuple[str, str], ...] = (
     ("Enter", "select"),
     ("Tab", "pane"),
     ("Esc", "back"),
@@ -118,9 +120,9 @@ JOBS_BINDINGS = [
     ("R", "rerun"),
     ("l", "logs"),
     ("r", "refresh"),
-]
+)
 
-PIPELINES_BINDINGS = [
+PIPELINES_BINDINGS: tuple[tuple[str, str], ...] = (
     ("Enter", "select"),
     ("Tab", "pane"),
     ("Esc", "back"),
@@ -128,9 +130,9 @@ PIPELINES_BINDINGS = [
     ("S", "stop"),
     ("f", "full refresh"),
     ("r", "refresh"),
-]
+)
 
-LOGS_BINDINGS = [
+LOGS_BINDINGS: tuple[tuple[str, str], ...] = (
     ("/", "search"),
     ("n", "next"),
     ("N", "prev"),
@@ -139,18 +141,18 @@ LOGS_BINDINGS = [
     ("g", "top"),
     ("b", "bookmark"),
     ("Esc", "close"),
-]
+)
 
-WAREHOUSES_BINDINGS = [
+WAREHOUSES_BINDINGS: tuple[tuple[str, str], ...] = (
     ("s", "start"),
     ("S", "stop"),
     ("r", "refresh"),
     ("A", "arm"),
     ("?", "help"),
-]
+)
 
-CONFIG_BINDINGS = [
+CONFIG_BINDINGS: tuple[tuple[str, str], ...] = (
     ("Enter", "switch"),
     ("t", "test"),
     ("?", "help"),
-]
+)
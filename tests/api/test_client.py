@@ -0,0 +1,130 @@
+"""Tests for DatabricksClient."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from unittest.mock import MagicMock
+
+import pytest
+
+from lazydatabricks.api.client import DatabricksClient
+from lazydatabricks.models.config import LazyDatabricksConfig
+
+
+@pytest.fixture
+def client(mock_config: LazyDatabricksConfig) -> DatabricksClient:
+    """A real client with a mocked SDK."""
+    client = DatabricksClient(mock_config)
+    client._sdk = MagicMock()
+    client._sdk.current_user.me.return_value = MagicMock(
+        user_name="test-user@example.com",
+        display_name="Test User",
+    )
+    return client
+
+
+class TestConnectionCache:
+    """Test the identity cache behind test_connection."""
+
+    def test_success_is_cached(self, client: DatabricksClient) -> None:
+        """Repeated calls within the TTL hit the API once."""
+        first = client.test_connection()
+        second = client.test_connection()
+
+        assert first["status"] == "ok"
+        assert second == first
+        assert client.sdk.current_user.me.call_count == 1
+
+    def test_expired_cache_refetches(self, client: DatabricksClient) -> None:
+        """Calls after the TTL expires hit the API again."""
+        client.IDENTITY_TTL_SECONDS = 0.0
+        client.test_connection()
+        client.test_connection()
+
+        assert client.sdk.current_user.me.call_count == 2
+
+    def test_errors_are_not_cached(self, client: DatabricksClient) -> None:
+        """A failed lookup is retried on the next call."""
+        client.sdk.current_user.me.side_effect = RuntimeError("boom")
+        assert client.test_connection()["status"] == "error"
+
+        client.sdk.current_user.me.side_effect = None
+        assert client.test_connection()["status"] == "ok"
+        assert client.sdk.current_user.me.call_count == 2
+
+    def test_refresh_clears_cache(self, client: DatabricksClient) -> None:
+        """refresh() drops the cached identity."""
+        client.test_connection()
+        client.refresh()
+
+        assert not client._identity_cache
+
+
+class TestSharedCache:
+    """Test that caches are shared per workspace and profile."""
+
+    def test_clients_for_same_profile_share_identity(self, client: DatabricksClient) -> None:
+        """A second client for the same profile reuses the cached identity."""
+        client.test_connection()
+
+        other = DatabricksClient(client.config)
+        other._sdk = MagicMock()
+
+        assert other.test_connection()["user"] == "test-user@example.com"
+        other._sdk.current_user.me.assert_not_called()
+
+    def test_profiles_are_isolated(self, client: DatabricksClient) -> None:
+        """A different profile starts with a cold cache."""
+        client.test_connection()
+
+        other = DatabricksClient(replace(client.config, profile_name="staging"))
+        other._sdk = MagicMock()
+        other.test_connection()
+
+        other._sdk.current_user.me.assert_called_once()
+
+    def test_token_change_starts_cold(self, client: DatabricksClient) -> None:
+        """A new token for the same profile does not reuse the old identity."""
+        client.test_connection()
+
+        other = DatabricksClient(replace(client.config, token="dapi-rotated"))
+        other._sdk = MagicMock()
+        other.test_connection()
+
+        other._sdk.current_user.me.assert_called_once()
+
+
+class TestWritable:
+    """Test the scoped write access used by armed actions."""
+
+    def test_restores_read_only(self, client: DatabricksClient) -> None:
+        """read_only is lifted inside the block and restored after."""
+        assert client.is_read_only
+        with client.writable():
+            assert not client.is_read_only
+        assert client.is_read_only
+
+    def test_restores_on_error(self, client: DatabricksClient) -> None:
+        """An exception inside the block still restores read_only."""
+        with pytest.raises(RuntimeError):
+            with client.writable():
+                raise RuntimeError("boom")
+        assert client.is_read_only
+
+    def test_overlapping_blocks(self, client: DatabricksClient) -> None:
+        """The first block to exit must not re-lock a block still running."""
+        first, second = client.writable(), client.writable()
+        first.__enter__()
+        second.__enter__()
+        first.__exit__(None, None, None)
+        assert not client.is_read_only
+
+        second.__exit__(None, None, None)
+        assert client.is_read_only
+
+    def test_keeps_writable_config_writable(self, client: DatabricksClient) -> None:
+        """A client that started writable stays writable afterwards."""
+        client.config.read_only = False
+        with client.writable():
+            pass
+        assert not client.is_read_only
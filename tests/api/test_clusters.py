@@ -0,0 +1,178 @@
+"""Tests for ClusterOps."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+from databricks.sdk.service.compute import AutoScale, ClusterDetails, ClusterSource, State
+
+from lazydatabricks.api.clusters import ClusterOps
+from lazydatabricks.models.cluster import ClusterFlag, ClusterState, ClusterSummary
+
+
+def _sdk_cluster(cluster_id: str, name: str, state: str) -> ClusterDetails:
+    """Build an SDK ClusterDetails object."""
+    return ClusterDetails(cluster_id=cluster_id, cluster_name=name, state=State(state))
+
+
+@pytest.fixture
+def cluster_ops(mock_client: MagicMock) -> ClusterOps:
+    """ClusterOps backed by a fake SDK cluster listing."""
+    mock_client.sdk = MagicMock()
+    mock_client.sdk.clusters.list.return_value = iter([
+        _sdk_cluster("c-1", "zeta", "TERMINATED"),
+        _sdk_cluster("c-2", "Alpha", "RUNNING"),
+        _sdk_cluster("c-3", "beta", "PENDING"),
+        _sdk_cluster("c-4", "gamma", "RUNNING"),
+    ])
+    return ClusterOps(mock_client)
+
+
+class TestListAll:
+    """Test cluster listing and ordering."""
+
+    def test_sorted_active_first_then_name(self, cluster_ops: ClusterOps) -> None:
+        """Running clusters sort first, then by case-insensitive name."""
+        names = [c.name for c in cluster_ops.list_all()]
+        assert names == ["Alpha", "gamma", "beta", "zeta"]
+
+    def test_limit_keeps_first_in_sort_order(self, cluster_ops: ClusterOps) -> None:
+        """limit returns the top N of the full sort order."""
+        names = [c.name for c in cluster_ops.list_all(limit=2)]
+        assert names == ["Alpha", "gamma"]
+
+    def test_list_failure_returns_empty(self, cluster_ops: ClusterOps) -> None:
+        """API errors yield an empty list instead of raising."""
+        cluster_ops._client.sdk.clusters.list.side_effect = RuntimeError("boom")
+        assert cluster_ops.list_all() == []
+
+    def test_duplicate_names_sort_stably(self, cluster_ops: ClusterOps) -> None:
+        """Clusters with identical sort keys keep API order."""
+        cluster_ops._client.sdk.clusters.list.return_value = iter([
+            _sdk_cluster("c-1", "same", "RUNNING"),
+            _sdk_cluster("c-2", "Same", "RUNNING"),
+        ])
+        assert [c.id for c in cluster_ops.list_all()] == ["c-1", "c-2"]
+
+
+class TestGetEvents:
+    """Test cluster event parsing."""
+
+    def test_parses_events(self, cluster_ops: ClusterOps) -> None:
+        """SDK events are normalized into ClusterEvent models."""
+        event = MagicMock(timestamp=1_700_000_000_000, details=None)
+        event.type.value = "RUNNING"
+        cluster_ops._client.sdk.clusters.events.return_value = iter([event])
+
+        events = cluster_ops.get_events("c-1")
+
+        assert len(events) == 1
+        assert events[0].event_type == "RUNNING"
+        assert events[0].timestamp.year == 2023
+        assert events[0].details == ""
+
+    def test_missing_fields_use_defaults(self, cluster_ops: ClusterOps) -> None:
+        """Events without timestamp or type fall back to defaults."""
+        event = MagicMock(timestamp=None, type=None, details="resized")
+        cluster_ops._client.sdk.clusters.events.return_value = iter([event])
+
+        events = cluster_ops.get_events("c-1")
+
+        assert events[0].event_type == "UNKNOWN"
+        assert events[0].details == "resized"
+
+    def test_respects_limit(self, cluster_ops: ClusterOps) -> None:
+        """No more than `limit` events are consumed from the SDK iterator."""
+        cluster_ops._client.sdk.clusters.events.return_value = iter(
+            MagicMock(timestamp=None, type=None, details=None) for _ in range(10)
+        )
+        assert len(cluster_ops.get_events("c-1", limit=3)) == 3
+
+
+class TestGetEventsMany:
+    """Test the concurrent multi-cluster event fetch."""
+
+    def test_results_follow_input_ids(self, cluster_ops: ClusterOps) -> None:
+        """Each id maps to its own events, in input order."""
+        def events(cluster_id: str, limit: int) -> Iterator[MagicMock]:
+            event = MagicMock(timestamp=None, details=None)
+            event.type.value = f"EVENT_{cluster_id}"
+            return iter([event])
+
+        cluster_ops._client.sdk.clusters.events.side_effect = events
+
+        result = cluster_ops.get_events_many(["c-3", "c-1", "c-2"])
+
+        assert list(result) == ["c-3", "c-1", "c-2"]
+        assert [evs[0].event_type for evs in result.values()] == [
+            "EVENT_c-3", "EVENT_c-1", "EVENT_c-2",
+        ]
+
+    def test_one_failure_does_not_abort_others(self, cluster_ops: ClusterOps) -> None:
+        """A failing cluster yields no events; the rest still load."""
+        def events(cluster_id: str, limit: int) -> Iterator[MagicMock]:
+            if cluster_id == "c-2":
+                raise RuntimeError("boom")
+            return iter([MagicMock(timestamp=None, type=None, details=None)])
+
+        cluster_ops._client.sdk.clusters.events.side_effect = events
+
+        result = cluster_ops.get_events_many(["c-1", "c-2", "c-3"])
+
+        assert result["c-2"] == []
+        assert len(result["c-1"]) == len(result["c-3"]) == 1
+
+    def test_empty_input_returns_empty_dict(self, cluster_ops: ClusterOps) -> None:
+        """No ids means no requests."""
+        assert cluster_ops.get_events_many([]) == {}
+        cluster_ops._client.sdk.clusters.events.assert_not_called()
+
+
+class TestFromSdk:
+    """Test building ClusterSummary straight from SDK objects."""
+
+    def test_matches_dict_path(self) -> None:
+        """from_sdk yields the same summary as from_api(as_dict())."""
+        details = ClusterDetails(
+            cluster_id="c-9",
+            cluster_name="etl",
+            state=State.RUNNING,
+            node_type_id="i3.xlarge",
+            autoscale=AutoScale(min_workers=2, max_workers=8),
+            start_time=1_700_000_000_000,
+            autotermination_minutes=60,
+            spark_version="14.3.x-scala2.12",
+            creator_user_name="a@b.com",
+            cluster_source=ClusterSource.UI,
+        )
+
+        from_sdk = ClusterSummary.from_sdk(details, "https://host")
+        from_dict = ClusterSummary.from_api(details.as_dict(), "https://host")
+
+        assert from_sdk == from_dict
+        assert from_sdk.workers_display == "2–8"
+
+
+class TestLazyFlags:
+    """Test deferred flag computation."""
+
+    def test_flags_computed_on_first_access(self) -> None:
+        """from_api leaves flags unset until .flags is read."""
+        summary = ClusterSummary.from_api(
+            {"cluster_id": "c-1", "cluster_name": "adhoc", "state": "RUNNING"},
+        )
+
+        assert summary._flags is None
+        assert ClusterFlag.AUTO_TERMINATION_OFF in summary.flags
+        assert summary._flags is summary.flags
+
+    def test_explicit_flags_are_kept(self) -> None:
+        """Flags passed to the constructor are not recomputed."""
+        summary = ClusterSummary(
+            id="c-1", name="adhoc", state=ClusterState.RUNNING,
+            flags=[ClusterFlag.IDLE_BURN],
+        )
+
+        assert summary.flags == [ClusterFlag.IDLE_BURN]
@@ -11,7 +11,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from lazydatabricks.api.client import DatabricksClient
+from lazydatabricks.api.client import _SHARED_CACHES, DatabricksClient
 from lazydatabricks.api.guard import ArmedGuard
 from lazydatabricks.models.cluster import ClusterSummary, ClusterState, ClusterFlag
 from lazydatabricks.models.config import LazyDatabricksConfig, DatabricksProfile, AuthMethod
@@ -20,6 +20,17 @@ from lazydatabricks.models.job import JobSummary, RunSummary, RunState, RunResul
 from lazydatabricks.models.warehouse import WarehouseSummary, WarehouseState
 
 
+# ─── Shared State ────────────────────────────────────────────────
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_caches() -> Generator[None, None, None]:
+    """Keep process-wide API and config caches from leaking between tests."""
+    yield
+    _SHARED_CACHES.clear()
+    LazyDatabricksConfig.invalidate_cache()
+
+
 # ─── Configuration Fixtures ──────────────────────────────────────
 
 
@@ -33,7 +44,7 @@ def mock_config() -> LazyDatabricksConfig:
         profile_name="test-profile",
         auth_method=AuthMethod.PAT,
         read_only=True,
-        available_profiles=[
+        available_profiles=(
             DatabricksProfile(
                 name="test-profile",
                 host="https://test-workspace.cloud.databricks.com",
@@ -45,7 +56,7 @@ def mock_config() -> LazyDatabricksConfig:
                 host="https://staging.cloud.databricks.com",
                 token="dapi_staging_token",
             ),
-        ],
+        ),
     )
 
 
@@ -0,0 +1 @@
+"""Extension tests."""
@@ -0,0 +1,384 @@
+"""Tests for billing extension API operations."""
+
+from __future__ import annotations
+
+import time
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from lazydatabricks.extensions.billing.api import BillingOps
+from lazydatabricks.extensions.billing.models import SkuCostSummary, TimeWindow
+
+
+def _column(name: str) -> MagicMock:
+    col = MagicMock()
+    col.name = name
+    return col
+
+
+def _response(columns: list[str], data: list[list], next_chunk_index: int | None = None) -> MagicMock:
+    """Build a fake StatementResponse with one inline chunk."""
+    response = MagicMock()
+    response.statement_id = "stmt-1"
+    response.status.state.value = "SUCCEEDED"
+    response.manifest.schema.columns = [_column(c) for c in columns]
+    response.result.data_array = data
+    response.result.next_chunk_index = next_chunk_index
+    return response
+
+
+@pytest.fixture
+def billing_ops(mock_client: MagicMock) -> BillingOps:
+    """BillingOps with a fake statement execution API."""
+    mock_client.sdk = MagicMock()
+    return BillingOps(mock_client, {"sql_warehouse_id": "wh-001"})
+
+
+class TestExecuteQuery:
+    """Test statement execution and result parsing."""
+
+    def test_column_index_map(self, billing_ops: BillingOps) -> None:
+        """Rows come back raw alongside a column name -> index map."""
+        sec = billing_ops._client.sdk.statement_execution
+        sec.execute_statement.return_value = _response(["a", "b"], [["1", "2"]])
+
+        idx, rows = billing_ops._execute_query("SELECT 1")
+
+        assert idx == {"a": 0, "b": 1}
+        assert rows == [["1", "2"]]
+
+    def test_follows_result_chunks(self, billing_ops: BillingOps) -> None:
+        """Rows from every chunk are returned, in order."""
+        sec = billing_ops._client.sdk.statement_execution
+        sec.execute_statement.return_value = _response(["a"], [["1"]], next_chunk_index=1)
+        chunk = MagicMock(data_array=[["2"], ["3"]], next_chunk_index=None)
+        sec.get_statement_result_chunk_n.return_value = chunk
+
+        _, rows = billing_ops._execute_query("SELECT 1")
+
+        assert [r[0] for r in rows] == ["1", "2", "3"]
+        sec.get_statement_result_chunk_n.assert_called_once_with(
+            statement_id="stmt-1", chunk_index=1
+        )
+
+    def test_failed_query_returns_empty(self, billing_ops: BillingOps) -> None:
+        """A FAILED statement yields no rows."""
+        sec = billing_ops._client.sdk.statement_execution
+        response = _response(["a"], [["1"]])
+        response.status.state.value = "FAILED"
+        sec.execute_statement.return_value = response
+
+        assert billing_ops._execute_query("SELECT 1") == ({}, [])
+
+    def test_parameters_are_typed(self, billing_ops: BillingOps) -> None:
+        """Window bounds are bound as DATE, other values as STRING."""
+        sec = billing_ops._client.sdk.statement_execution
+        sec.execute_statement.return_value = _response(["a"], [])
+
+        billing_ops.get_usage_breakdown("JOBS_COMPUTE", "COMPUTE_TIME", TimeWindow.DAY_7)
+
+        params = sec.execute_statement.call_args.kwargs["parameters"]
+        assert {p.name: p.type for p in params} == {
+            "sku_name": "STRING",
+            "usage_type": "STRING",
+            "window_start": "DATE",
+            "window_end": "DATE",
+        }
+
+
+class TestCheckAccess:
+    """Test the billing access probe."""
+
+    def test_both_tables_visible(self, billing_ops: BillingOps) -> None:
+        """Access is granted when both billing tables are listed."""
+        sec = billing_ops._client.sdk.statement_execution
+        sec.execute_statement.return_value = _response(
+            ["table_name"], [["usage"], ["list_prices"]]
+        )
+
+        assert billing_ops.check_access() == (True, "")
+
+    def test_missing_table_denies_access(self, billing_ops: BillingOps) -> None:
+        """A table missing from information_schema means no grant."""
+        sec = billing_ops._client.sdk.statement_execution
+        sec.execute_statement.return_value = _response(["table_name"], [["usage"]])
+
+        ok, error = billing_ops.check_access()
+
+        assert not ok
+        assert "system.billing.list_prices" in error
+
+    def test_failed_probe_reports_error(self, billing_ops: BillingOps) -> None:
+        """Statement failures surface their message."""
+        sec = billing_ops._client.sdk.statement_execution
+        sec.execute_statement.side_effect = RuntimeError("PERMISSION_DENIED")
+
+        assert billing_ops.check_access() == (False, "PERMISSION_DENIED")
+
+class TestListSkuCosts:
+    """Test SKU cost parsing."""
+
+    def test_parses_rows_by_column_name(self, billing_ops: BillingOps) -> None:
+        """Columns are matched by name regardless of their position."""
+        sec = billing_ops._client.sdk.statement_execution
+        sec.execute_statement.return_value = _response(
+            ["estimated_cost", "sku_name", "usage_type", "total_dbu"],
+            [["12.5", "JOBS_COMPUTE", "COMPUTE_TIME", "100"]],
+        )
+
+        (sku,) = billing_ops.list_sku_costs(TimeWindow.DAY_7)
+
+        assert sku.sku_name == "JOBS_COMPUTE"
+        assert sku.cost_display == "$12.50"
+        assert sku.dbu_display == "100.0"
+        assert sku.discount_pct == 0
+
+
+
+class TestCostView:
+    """Test reading through the optional pre-aggregated cost view."""
+
+    @pytest.fixture
+    def view_ops(self, mock_client: MagicMock) -> BillingOps:
+        mock_client.sdk = MagicMock()
+        return BillingOps(
+            mock_client,
+            {"sql_warehouse_id": "wh-001", "cost_view": "billing_mv.sku_daily_cost"},
+        )
+
+    def test_sku_costs_read_from_view(self, view_ops: BillingOps) -> None:
+        """A configured view is queried instead of the system tables."""
+        sec = view_ops._client.sdk.statement_execution
+        sec.execute_statement.return_value = _response(["sku_name"], [["JOBS_COMPUTE"]])
+
+        view_ops.list_sku_costs(TimeWindow.DAY_7)
+
+        statement = sec.execute_statement.call_args.kwargs["statement"]
+        assert "FROM billing_mv.sku_daily_cost" in statement
+
+    def test_falls_back_when_view_is_missing(self, view_ops: BillingOps) -> None:
+        """A missing view falls back to system tables and is not retried."""
+        sec = view_ops._client.sdk.statement_execution
+        failed = _response(["a"], [])
+        failed.status.state.value = "FAILED"
+        failed.status.error.message = "[TABLE_OR_VIEW_NOT_FOUND] The table or view cannot be found."
+        ok = _response(["sku_name"], [["JOBS_COMPUTE"]])
+        sec.execute_statement.side_effect = [failed, ok, ok]
+
+        (sku,) = view_ops.list_sku_costs(TimeWindow.DAY_7)
+        view_ops.get_total_cost(TimeWindow.DAY_30)
+
+        assert sku.sku_name == "JOBS_COMPUTE"
+        statements = [c.kwargs["statement"] for c in sec.execute_statement.call_args_list]
+        assert "system.billing.usage" in statements[1]
+        assert "system.billing.usage" in statements[2]
+        assert view_ops._cost_view == ""
+
+    def test_transient_failure_retries_view_later(self, view_ops: BillingOps) -> None:
+        """A timeout skips the view only until the retry time passes."""
+        sec = view_ops._client.sdk.statement_execution
+        ok = _response(["sku_name"], [["JOBS_COMPUTE"]])
+        sec.execute_statement.side_effect = [TimeoutError("timed out"), ok, ok, ok]
+
+        view_ops.list_sku_costs(TimeWindow.DAY_7)
+        view_ops.get_total_cost(TimeWindow.DAY_7)
+        view_ops._cost_view_retry_at = 0.0
+        view_ops.get_total_cost(TimeWindow.DAY_30)
+
+        statements = [c.kwargs["statement"] for c in sec.execute_statement.call_args_list]
+        assert "billing_mv.sku_daily_cost" in statements[0]
+        assert "system.billing.usage" in statements[1]
+        assert "system.billing.usage" in statements[2]
+        assert "billing_mv.sku_daily_cost" in statements[3]
+
+    def test_invalid_view_name_is_ignored(self, mock_client: MagicMock) -> None:
+        """View names that are not dotted identifiers are never interpolated."""
+        ops = BillingOps(mock_client, {"sql_warehouse_id": "wh", "cost_view": "x; DROP TABLE y"})
+        assert ops._cost_view == ""
+
+
+class TestQueryCache:
+    """Test the TTL cache around billing queries."""
+
+    def test_repeat_call_is_served_from_cache(self, billing_ops: BillingOps) -> None:
+        """A second call within the TTL does not hit the warehouse."""
+        sec = billing_ops._client.sdk.statement_execution
+        sec.execute_statement.return_value = _response(
+            ["sku_name", "estimated_cost"], [["JOBS_COMPUTE", "1"]]
+        )
+
+        first = billing_ops.list_sku_costs(TimeWindow.DAY_7)
+        second = billing_ops.list_sku_costs(TimeWindow.DAY_7)
+
+        assert second is first
+        assert sec.execute_statement.call_count == 1
+
+    def test_empty_result_is_not_cached(self, billing_ops: BillingOps) -> None:
+        """Empty results are retried on the next call."""
+        sec = billing_ops._client.sdk.statement_execution
+        sec.execute_statement.return_value = _response(["sku_name"], [])
+
+        billing_ops.list_sku_costs(TimeWindow.DAY_7)
+        billing_ops.list_sku_costs(TimeWindow.DAY_7)
+
+        assert sec.execute_statement.call_count == 2
+
+    def test_invalidate_forces_refetch(self, billing_ops: BillingOps) -> None:
+        """invalidate() drops cached results."""
+        sec = billing_ops._client.sdk.statement_execution
+        sec.execute_statement.return_value = _response(
+            ["sku_name", "estimated_cost"], [["JOBS_COMPUTE", "1"]]
+        )
+
+        billing_ops.list_sku_costs(TimeWindow.DAY_7)
+        billing_ops.invalidate()
+        billing_ops.list_sku_costs(TimeWindow.DAY_7)
+
+        assert sec.execute_statement.call_count == 2
+
+    def test_scoped_invalidate_keeps_other_kinds(self, billing_ops: BillingOps) -> None:
+        """invalidate(scope=...) drops only that kind of entry."""
+        billing_ops._cache[("sku", TimeWindow.DAY_7)] = (0.0, ["sku"])
+        billing_ops._cache[("total", TimeWindow.DAY_7)] = (0.0, Decimal(1))
+
+        billing_ops.invalidate(scope="sku")
+
+        assert list(billing_ops._cache) == [("total", TimeWindow.DAY_7)]
+
+    def test_unknown_scope_raises(self, billing_ops: BillingOps) -> None:
+        """Unrecognised scopes are rejected."""
+        with pytest.raises(ValueError):
+            billing_ops.invalidate(scope="skus")
+
+    def test_other_warehouse_has_own_cache(self, billing_ops: BillingOps) -> None:
+        """Results are not shared across warehouses for the same workspace."""
+        billing_ops._cache[("total", TimeWindow.DAY_7)] = (0.0, Decimal(1))
+
+        other = BillingOps(billing_ops._client, {"sql_warehouse_id": "wh-002"})
+
+        assert not other._cache
+
+
+class TestLoadDashboard:
+    """Test the combined dashboard query."""
+
+    def test_dispatches_rows_by_kind(self, billing_ops: BillingOps) -> None:
+        """Tagged rows land in the right dashboard field and seed the cache."""
+        sec = billing_ops._client.sdk.statement_execution
+        sec.execute_statement.return_value = _response(
+            ["kind", "sku_name", "usage_type", "cluster_id", "estimated_cost"],
+            [
+                ["total", None, None, None, "30.0"],
+                ["sku", "JOBS_COMPUTE", "COMPUTE_TIME", None, "20.0"],
+                ["breakdown", "JOBS_COMPUTE", "COMPUTE_TIME", "c-1", "20.0"],
+                ["sku", "SQL", "COMPUTE_TIME", None, "10.0"],
+            ],
+        )
+
+        dashboard = billing_ops.load_dashboard(TimeWindow.DAY_7)
+
+        assert [s.sku_name for s in dashboard.sku_costs] == ["JOBS_COMPUTE", "SQL"]
+        (item,) = dashboard.breakdown_for("JOBS_COMPUTE", "COMPUTE_TIME")
+        assert item.cluster_id == "c-1"
+        assert dashboard.breakdown_for("SQL", "COMPUTE_TIME") == []
+        assert dashboard.total_cost == Decimal("30.0")
+
+        assert billing_ops.list_sku_costs(TimeWindow.DAY_7) is dashboard.sku_costs
+        assert billing_ops.get_total_cost(TimeWindow.DAY_7) == Decimal("30.0")
+        assert sec.execute_statement.call_count == 1
+
+    def test_revisit_is_served_from_cache(self, billing_ops: BillingOps) -> None:
+        """Loading the same window again does not re-run the query."""
+        sec = billing_ops._client.sdk.statement_execution
+        sec.execute_statement.return_value = _response(
+            ["kind", "sku_name", "usage_type", "cluster_id", "estimated_cost"],
+            [
+                ["sku", "JOBS_COMPUTE", "COMPUTE_TIME", None, "20.0"],
+                ["breakdown", "JOBS_COMPUTE", "COMPUTE_TIME", "c-1", "20.0"],
+            ],
+        )
+
+        first = billing_ops.load_dashboard(TimeWindow.DAY_7)
+        second = billing_ops.load_dashboard(TimeWindow.DAY_7)
+
+        assert second.sku_costs is first.sku_costs
+        assert second.breakdown_for("JOBS_COMPUTE", "COMPUTE_TIME") == first.breakdown_for(
+            "JOBS_COMPUTE", "COMPUTE_TIME"
+        )
+        assert sec.execute_statement.call_count == 1
+
+
+    def test_iter_dashboard_yields_per_chunk(self, billing_ops: BillingOps) -> None:
+        """Each result chunk is yielded as soon as it is parsed."""
+        sec = billing_ops._client.sdk.statement_execution
+        sec.execute_statement.return_value = _response(
+            ["kind", "sku_name", "usage_type", "estimated_cost"],
+            [["sku", "A", "COMPUTE_TIME", "9"]],
+            next_chunk_index=1,
+        )
+        sec.get_statement_result_chunk_n.return_value = MagicMock(
+            data_array=[["sku", "B", "COMPUTE_TIME", "1"]], next_chunk_index=None
+        )
+
+        seen = [
+            [s.sku_name for s in d.sku_costs]
+            for d in billing_ops.iter_dashboard(TimeWindow.DAY_7)
+        ]
+
+        assert seen == [["A"], ["A", "B"]]
+        assert billing_ops.list_sku_costs(TimeWindow.DAY_7)[0].sku_name == "A"
+
+class TestCheckAccessAndLoad:
+    """Test the concurrent first-load path."""
+
+    def test_denied_access_drops_dashboard(self, billing_ops: BillingOps) -> None:
+        """No dashboard is returned when the access probe fails."""
+        sec = billing_ops._client.sdk.statement_execution
+        sec.execute_statement.return_value = _response(["table_name"], [])
+
+        ok, error, dashboard = billing_ops.check_access_and_load(TimeWindow.DAY_7)
+
+        assert not ok
+        assert "system.billing.usage" in error
+        assert dashboard is None
+
+    def test_returns_dashboard_when_access_ok(self, billing_ops: BillingOps) -> None:
+        """Both statements are submitted and the dashboard is returned."""
+        access = _response(["table_name"], [["usage"], ["list_prices"]])
+        data = _response(
+            ["kind", "sku_name", "usage_type", "estimated_cost"],
+            [["sku", "JOBS_COMPUTE", "COMPUTE_TIME", "5"]],
+        )
+
+        def execute(statement: str, **_: object) -> MagicMock:
+            return access if "information_schema" in statement else data
+
+        billing_ops._client.sdk.statement_execution.execute_statement.side_effect = execute
+
+        ok, _, dashboard = billing_ops.check_access_and_load(TimeWindow.DAY_7)
+
+        assert ok
+        assert [s.sku_name for s in dashboard.sku_costs] == ["JOBS_COMPUTE"]
+
+
+class TestPrefetchBreakdowns:
+    """Test speculative breakdown prefetch."""
+
+    def test_only_uncached_skus_are_queried(self, billing_ops: BillingOps) -> None:
+        """Cached SKUs are skipped; the rest land in the cache."""
+        sec = billing_ops._client.sdk.statement_execution
+        sec.execute_statement.return_value = _response(["cluster_id"], [["c-1"]])
+        cached = SkuCostSummary("A", "COMPUTE_TIME", 1.0, 1.0, 1.0)
+        fresh = SkuCostSummary("B", "COMPUTE_TIME", 1.0, 1.0, 1.0)
+        billing_ops._cache[("breakdown", "A", "COMPUTE_TIME", TimeWindow.DAY_7)] = (
+            time.monotonic(), ["hit"],
+        )
+
+        billing_ops.prefetch_breakdowns([cached, fresh], TimeWindow.DAY_7)
+
+        assert sec.execute_statement.call_count == 1
+        (item,) = billing_ops.get_usage_breakdown("B", "COMPUTE_TIME", TimeWindow.DAY_7)
+        assert item.cluster_id == "c-1"
+        assert sec.execute_statement.call_count == 1
@@ -0,0 +1,50 @@
+"""Tests for billing extension models."""
+
+from __future__ import annotations
+
+from lazydatabricks.extensions.billing.models import GroupBy, TimeWindow, UsageBreakdown
+
+
+class TestUsageBreakdownResource:
+    """Test resource resolution on UsageBreakdown."""
+
+    def test_first_populated_field_wins(self) -> None:
+        """Cluster takes precedence over job when both are set."""
+        item = UsageBreakdown(workspace_id="ws", cluster_id="0101-abcdefghijklmnop", job_id="42")
+
+        assert item.resource_type == "cluster"
+        assert item.resource_id == "0101-abcdefghijklmnop"
+        assert item.resource_display == "0101-abcdefghijk"
+
+    def test_job_display(self) -> None:
+        """Jobs are displayed with a prefix."""
+        item = UsageBreakdown(workspace_id="ws", job_id="42")
+
+        assert item.resource_type == "job"
+        assert item.resource_display == "job-42"
+
+    def test_falls_back_to_creator(self) -> None:
+        """Without a resource id, the creator is shown."""
+        item = UsageBreakdown(workspace_id="ws", creator="alice")
+
+        assert item.resource_type is None
+        assert item.resource_id is None
+        assert item.resource_display == "[alice]"
+        assert UsageBreakdown(workspace_id="ws").resource_display == "[unknown]"
+
+
+class TestCycling:
+    """Test hotkey cycling of windows and groupings."""
+
+    def test_time_window_cycles_and_wraps(self) -> None:
+        """Windows advance in order and wrap to the start."""
+        assert TimeWindow.DAY_1.next() is TimeWindow.DAY_7
+        assert TimeWindow.DAY_30.next() is TimeWindow.DAY_1
+        assert TimeWindow.DAY_7.days == 7
+        assert TimeWindow.DAY_30.display == "30 days"
+
+    def test_group_by_cycles_and_wraps(self) -> None:
+        """Groupings advance in order and wrap to the start."""
+        assert GroupBy.CLUSTER.next() is GroupBy.WAREHOUSE
+        assert GroupBy.WORKSPACE.next() is GroupBy.CLUSTER
+        assert GroupBy.JOB.display == "Job"
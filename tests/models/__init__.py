@@ -0,0 +1 @@
+"""Model layer tests."""
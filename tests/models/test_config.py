@@ -0,0 +1,136 @@
+"""Tests for configuration loading."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from lazydatabricks.models.config import (
+    LazyDatabricksConfig,
+    _clear_cfg_cache,
+    _parse_databricks_cfg,
+    reload_env,
+)
+
+
+@pytest.fixture
+def cfg_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point ~ at a temp dir holding a .databrickscfg."""
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    cfg = tmp_path / ".databrickscfg"
+    cfg.write_text(
+        "[dev]\n"
+        "host = https://dev.cloud.databricks.com\n"
+        "token = dapi-dev\n"
+        "\n"
+        "[staging]\n"
+        "host = https://staging.cloud.databricks.com\n"
+        "auth_type = azure-cli\n"
+    )
+    yield cfg
+    _clear_cfg_cache()
+
+
+class TestParseDatabricksCfg:
+    """Test ~/.databrickscfg parsing and its mtime cache."""
+
+    def test_missing_file_returns_empty(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """No config file means no profiles."""
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        assert _parse_databricks_cfg() == ()
+
+    def test_unchanged_file_served_from_cache(self, cfg_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A second parse of an untouched file does not re-read it."""
+        first = _parse_databricks_cfg()
+        monkeypatch.setattr(Path, "read_text", None)
+
+        second = _parse_databricks_cfg()
+
+        assert second is first
+
+    def test_modified_file_is_reparsed(self, cfg_file: Path) -> None:
+        """A changed mtime or size invalidates the cache."""
+        assert len(_parse_databricks_cfg()) == 2
+
+        cfg_file.write_text("[prod]\nhost = https://prod.cloud.databricks.com\n")
+        st = cfg_file.stat()
+        os.utime(cfg_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert [p.name for p in _parse_databricks_cfg()] == ["prod"]
+
+    def test_default_section_is_inherited(self, cfg_file: Path) -> None:
+        """[DEFAULT] values fill gaps in other sections but are not a profile."""
+        cfg_file.write_text(
+            "# comment\n"
+            "[DEFAULT]\n"
+            "host = https://shared.cloud.databricks.com\n"
+            "[ci]\n"
+            "Token = dapi-ci\n"
+            "jobs-api-version = 2.1\n"
+            "[sp]\n"
+            "host = https://sp.cloud.databricks.com\n"
+            "auth_type = oauth-m2m\n"
+        )
+
+        ci, sp = _parse_databricks_cfg()
+
+        assert (ci.name, ci.host, ci.token) == ("ci", "https://shared.cloud.databricks.com", "dapi-ci")
+        assert (sp.host, sp.auth_type, sp.token) == ("https://sp.cloud.databricks.com", "oauth-m2m", None)
+
+
+class TestLoadCache:
+    """Test memoized LazyDatabricksConfig.load."""
+
+    @pytest.fixture(autouse=True)
+    def no_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Resolve everything from the temp cfg file."""
+        for name in ("DATABRICKS_HOST", "DATABRICKS_TOKEN", "DATABRICKS_CLUSTER_ID"):
+            monkeypatch.delenv(name, raising=False)
+
+    def test_repeat_load_returns_independent_copies(self, cfg_file: Path) -> None:
+        """A memoized load still hands each caller its own object."""
+        first = LazyDatabricksConfig.load(profile="dev")
+        first.read_only = False
+
+        second = LazyDatabricksConfig.load(profile="dev")
+
+        assert second.read_only is True
+        assert second.available_profiles is first.available_profiles
+        assert [p.name for p in second.available_profiles] == ["dev", "staging"]
+
+    def test_cfg_edit_misses_memo(self, cfg_file: Path) -> None:
+        """An edited ~/.databrickscfg is re-read without invalidate_cache()."""
+        config = LazyDatabricksConfig.load(profile="dev")
+        cfg_file.write_text("[dev]\nhost = https://new.cloud.databricks.com\ntoken = dapi-new\n")
+
+        assert config.switch_profile("dev").token == "dapi-new"
+
+    def test_forced_switch_rereads_env(self, cfg_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """switch_profile(force=True) picks up env changes."""
+        config = LazyDatabricksConfig.load(profile="dev")
+        monkeypatch.setenv("DATABRICKS_CLUSTER_ID", "c-env")
+
+        assert config.switch_profile("dev").cluster_id is None
+        assert config.switch_profile("dev", force=True).cluster_id == "c-env"
+
+    def test_reload_env_picks_up_new_vars(self, cfg_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Env changes apply only after reload_env()."""
+        assert LazyDatabricksConfig.load(profile="dev").cluster_id is None
+        monkeypatch.setenv("DATABRICKS_CLUSTER_ID", "c-env")
+
+        assert LazyDatabricksConfig.load(profile="dev").cluster_id is None
+        reload_env()
+        assert LazyDatabricksConfig.load(profile="dev").cluster_id == "c-env"
+
+    def test_profile_name_resolution(self, cfg_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Explicit, auto-selected and env-only loads report the right profile."""
+        assert LazyDatabricksConfig.load(profile="staging", token_override="t").profile_name == "staging"
+        assert LazyDatabricksConfig.load().profile_name == "dev"
+
+        cfg_file.unlink()
+        LazyDatabricksConfig.invalidate_cache()
+        monkeypatch.setenv("DATABRICKS_HOST", "https://env.cloud.databricks.com")
+        monkeypatch.setenv("DATABRICKS_TOKEN", "dapi-env")
+        assert LazyDatabricksConfig.load().profile_name is None
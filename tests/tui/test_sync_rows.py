@@ -0,0 +1,155 @@
+"""Tests for BaseScreen._sync_rows table diffing and streamed fills."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.pilot import Pilot
+from textual.widgets import DataTable
+
+from lazydatabricks.api.guard import ArmedGuard
+from lazydatabricks.tui.screens.base import BaseScreen
+
+Rows = dict[str, tuple[str, ...]]
+
+
+class _TableScreen(BaseScreen):
+    """Bare screen holding one two-column table."""
+
+    ROW_CHUNK = 3
+
+    def compose(self) -> ComposeResult:
+        yield DataTable(id="rows")
+
+    def on_mount(self) -> None:
+        self.query_one(DataTable).add_columns("Name", "Value")
+
+
+class _SyncApp(App[None]):
+    """Just enough of LazyDatabricksApp for BaseScreen's footer."""
+
+    guard = ArmedGuard()
+    extension_hints = ()
+
+    def on_mount(self) -> None:
+        self.push_screen(_TableScreen())
+
+
+def _rows(*keys: str) -> Rows:
+    return {key: (key, f"v-{key}") for key in keys}
+
+
+def _keys(table: DataTable) -> list[str | None]:
+    return [row.key.value for row in table.ordered_rows]
+
+
+async def _drain(pilot: Pilot, screen: BaseScreen) -> None:
+    """Let any streamed fill run to completion."""
+    for _ in range(20):
+        if not screen._row_feeds:
+            return
+        await pilot.pause()
+    raise AssertionError("streamed fill did not finish")
+
+
+class TestSyncRows:
+    """Test the diff, rebuild and streaming paths of _sync_rows."""
+
+    @pytest.mark.asyncio
+    async def test_changed_cell_updates_only_that_cell(self) -> None:
+        """A single changed value is patched in place."""
+        app = _SyncApp()
+        async with app.run_test():
+            screen = app.screen
+            assert isinstance(screen, _TableScreen)
+            table = screen.query_one(DataTable)
+            before = _rows("a", "b", "c")
+            screen._sync_rows(table, before, {})
+            after = {**before, "b": ("b", "changed")}
+
+            with (
+                patch.object(table, "update_cell", wraps=table.update_cell) as update_cell,
+                patch.object(table, "clear", wraps=table.clear) as clear,
+                patch.object(table, "add_row", wraps=table.add_row) as add_row,
+            ):
+                screen._sync_rows(table, after, before)
+
+            update_cell.assert_called_once()
+            assert update_cell.call_args.args[0] == "b"
+            assert update_cell.call_args.args[2] == "changed"
+            clear.assert_not_called()
+            add_row.assert_not_called()
+            assert table.get_row("b") == ["b", "changed"]
+
+    @pytest.mark.asyncio
+    async def test_removed_row_is_removed(self) -> None:
+        """Rows missing from the new data are dropped without a rebuild."""
+        app = _SyncApp()
+        async with app.run_test():
+            screen = app.screen
+            assert isinstance(screen, _TableScreen)
+            table = screen.query_one(DataTable)
+            before = _rows("a", "b", "c")
+            screen._sync_rows(table, before, {})
+
+            with patch.object(table, "clear", wraps=table.clear) as clear:
+                screen._sync_rows(table, _rows("a", "c"), before)
+
+            clear.assert_not_called()
+            assert _keys(table) == ["a", "c"]
+
+    @pytest.mark.asyncio
+    async def test_reorder_rebuilds_table(self) -> None:
+        """A new order that appending cannot produce rebuilds the table."""
+        app = _SyncApp()
+        async with app.run_test():
+            screen = app.screen
+            assert isinstance(screen, _TableScreen)
+            table = screen.query_one(DataTable)
+            before = _rows("a", "b", "c")
+            screen._sync_rows(table, before, {})
+
+            with patch.object(table, "clear", wraps=table.clear) as clear:
+                screen._sync_rows(table, _rows("c", "a", "b"), before)
+
+            clear.assert_called_once()
+            assert _keys(table) == ["c", "a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_kept_row_past_first_chunk_is_present(self) -> None:
+        """The keep row is added synchronously; the rest stream in later."""
+        app = _SyncApp()
+        async with app.run_test() as pilot:
+            screen = app.screen
+            assert isinstance(screen, _TableScreen)
+            table = screen.query_one(DataTable)
+            rows = _rows(*(f"r{i}" for i in range(10)))
+
+            screen._sync_rows(table, rows, {}, keep="r7")
+
+            assert table.get_row_index("r7") == 7
+            assert table.row_count < len(rows)
+
+            await _drain(pilot, screen)
+            assert _keys(table) == list(rows)
+
+    @pytest.mark.asyncio
+    async def test_new_sync_stops_streamed_fill(self) -> None:
+        """A sync during a streamed fill cancels the old feed."""
+        app = _SyncApp()
+        async with app.run_test() as pilot:
+            screen = app.screen
+            assert isinstance(screen, _TableScreen)
+            table = screen.query_one(DataTable)
+            old = _rows(*(f"old{i}" for i in range(10)))
+            new = _rows(*(f"new{i}" for i in range(8)))
+
+            screen._sync_rows(table, old, {})
+            assert screen._row_feeds
+            screen._sync_rows(table, new, old)
+
+            await _drain(pilot, screen)
+            await pilot.pause()
+            assert _keys(table) == list(new)
@@ -0,0 +1,31 @@
+"""Tests for screen timestamp formatting helpers."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from lazydatabricks.tui.screens.base import format_full_time, format_short_time
+
+
+class TestTimeFormat:
+    """The hand-rolled formatters must match the strftime output they replace."""
+
+    @pytest.mark.parametrize(
+        "dt",
+        [
+            datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            datetime(2024, 12, 31, 23, 59, 59),
+            datetime(2025, 10, 10, 0, 0, 0),
+        ],
+    )
+    def test_matches_strftime(self, dt: datetime) -> None:
+        """Both formats should be byte-identical to strftime."""
+        assert format_short_time(dt) == dt.strftime("%m/%d %H:%M")
+        assert format_full_time(dt) == dt.strftime("%Y-%m-%d %H:%M:%S")
+
+    def test_none_renders_dash(self) -> None:
+        """Unset timestamps should render as an em dash."""
+        assert format_short_time(None) == "—"
+        assert format_full_time(None) == "—"